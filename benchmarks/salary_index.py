@@ -0,0 +1,64 @@
+"""
+Сравнение фильтрации по зарплате: линейный get_vacancies_by_salary и SalaryIndex
+при чередовании добавления вакансий и запросов.
+
+Запуск: python -m benchmarks.salary_index
+"""
+import random
+import time
+from typing import Any, Dict, List
+
+from src.indexes import SalaryIndex
+from src.utils import get_vacancies_by_salary
+
+COUNT = 200000
+ROUNDS = 200
+SALARY_RANGE = '150000-160000'
+
+
+def make_vacancies(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """Вакансии со случайными зарплатными вилками"""
+    vacancies = []
+    for i in range(count):
+        low = rng.randrange(20000, 400000, 1000)
+        vacancies.append({
+            'id': str(i),
+            'url': f'https://hh.ru/vacancy/{i}',
+            'salary_from': low,
+            'salary_to': low + rng.randrange(0, 50000, 1000)
+        })
+    return vacancies
+
+
+def main() -> None:
+    rng = random.Random(1)
+    vacancies = make_vacancies(COUNT, rng)
+    extra = make_vacancies(COUNT + ROUNDS, rng)[COUNT:]
+    for i, vacancy in enumerate(extra):
+        vacancy['id'] = vacancy['url'] = f'new-{i}'
+
+    started = time.perf_counter()
+    index = SalaryIndex(vacancies)
+    build = time.perf_counter() - started
+
+    linear = list(vacancies)
+    started = time.perf_counter()
+    for vacancy in extra:
+        linear.append(vacancy)
+        get_vacancies_by_salary(linear, SALARY_RANGE)
+    linear_time = (time.perf_counter() - started) / ROUNDS
+
+    started = time.perf_counter()
+    for vacancy in extra:
+        index.add(vacancy)
+        index.search(SALARY_RANGE)
+    index_time = (time.perf_counter() - started) / ROUNDS
+
+    print(f"Построение индекса на {COUNT} вакансий: {build:.3f} с")
+    print(f"{'Способ':<32}{'с на добавление + запрос':>26}")
+    print(f"{'get_vacancies_by_salary':<32}{linear_time:>26.5f}")
+    print(f"{'SalaryIndex':<32}{index_time:>26.5f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Сравнение фильтрации, сортировки и выбора лучших вакансий по зарплате:
+функции utils над списком словарей и VacancyBatch.
+
+Запуск: python -m benchmarks.vacancy_batch
+"""
+import random
+import timeit
+from typing import Any, Callable, Dict, List
+
+from src.batch import VacancyBatch
+from src.utils import get_vacancies_by_salary, sort_vacancies, top_vacancies
+
+COUNT = 200000
+SALARY_RANGE = '100000-200000'
+
+
+def make_vacancies(count: int) -> List[Dict[str, Any]]:
+    """Вакансии со случайными зарплатами, работодателями и описаниями"""
+    rng = random.Random(1)
+    vacancies = []
+    for i in range(count):
+        low = rng.choice([None, rng.randrange(20000, 400000, 1000)])
+        vacancies.append({
+            'id': str(i),
+            'name': f'Python Developer {i}',
+            'url': f'https://hh.ru/vacancy/{i}',
+            'salary_from': low,
+            'salary_to': rng.choice([None, (low or 0) + rng.randrange(0, 100000, 1000)]),
+            'salary_currency': 'RUR',
+            'description': 'Опыт работы с Python, Django и PostgreSQL ' * 3,
+            'employer': f'Компания {i % 500}',
+            'experience': 'От 1 года до 3 лет',
+            'employment': 'Полная занятость'
+        })
+    return vacancies
+
+
+def measure(func: Callable[[], Any]) -> float:
+    """Лучшее время выполнения в секундах"""
+    return min(timeit.repeat(func, number=1, repeat=3))
+
+
+def main() -> None:
+    vacancies = make_vacancies(COUNT)
+    batch = VacancyBatch.from_dicts(vacancies)
+    # Производные массивы зарплат строятся при первом запросе и далее переиспользуются
+    batch.filter_salary(SALARY_RANGE)
+    batch.top(1)
+
+    cases = {
+        'фильтр по зарплате': (
+            lambda: get_vacancies_by_salary(vacancies, SALARY_RANGE), lambda: batch.filter_salary(SALARY_RANGE)
+        ),
+        'сортировка по зарплате': (lambda: sort_vacancies(vacancies), lambda: batch.sort_by_salary()),
+        'топ-10 по зарплате': (lambda: top_vacancies(vacancies, 10), lambda: batch.top(10)),
+        'фильтр + топ-10': (
+            lambda: top_vacancies(get_vacancies_by_salary(vacancies, SALARY_RANGE), 10),
+            lambda: batch.filter_salary(SALARY_RANGE).top(10)
+        ),
+    }
+    print(f"Вакансий: {COUNT}")
+    print(f"{'Операция':<28}{'словари, с':>14}{'VacancyBatch, с':>18}")
+    for title, (dicts, columns) in cases.items():
+        print(f"{title:<28}{measure(dicts):>14.4f}{measure(columns):>18.4f}")
+
+
+if __name__ == '__main__':
+    main()
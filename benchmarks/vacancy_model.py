@@ -0,0 +1,105 @@
+"""
+Сравнение памяти и времени создания вакансий: прежний класс с __dict__,
+текущий Vacancy со __slots__ и быстрый путь from_trusted_dict без валидации.
+
+Запуск: python -m benchmarks.vacancy_model
+"""
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from src.models import Vacancy
+
+DATA = {
+    'name': 'Python Developer',
+    'url': 'https://hh.ru/vacancy/12345',
+    'salary_from': 100000,
+    'salary_to': 150000,
+    'salary_currency': 'RUR',
+    'description': 'Опыт работы с Python',
+    'employer': 'Test Company',
+    'experience': 'От 1 года до 3 лет',
+    'employment': 'Полная занятость'
+}
+
+
+class DictVacancy:
+    """Вакансия в прежнем виде: обычный класс с __dict__ и валидацией при создании"""
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        salary_from: Optional[int] = None,
+        salary_to: Optional[int] = None,
+        salary_currency: Optional[str] = None,
+        description: str = "",
+        employer: Optional[str] = None,
+        experience: Optional[str] = None,
+        employment: Optional[str] = None
+    ):
+        self.name = name
+        self.url = url
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.salary_currency = salary_currency
+        self.description = description
+        self.employer = employer
+        self.experience = experience
+        self.employment = employment
+        self._validate_salary()
+        self._validate_url()
+
+    def _validate_salary(self) -> None:
+        if self.salary_from is not None and not isinstance(self.salary_from, (int, float)):
+            raise ValueError("Зарплата 'от' должна быть числом")
+        if self.salary_to is not None and not isinstance(self.salary_to, (int, float)):
+            raise ValueError("Зарплата 'до' должна быть числом")
+
+    def _validate_url(self) -> None:
+        if not isinstance(self.url, str) or not self.url.startswith(('http://', 'https://')):
+            raise ValueError("Некорректный URL вакансии")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DictVacancy':
+        return cls(
+            name=data.get('name', ''),
+            url=data.get('url', ''),
+            salary_from=data.get('salary_from'),
+            salary_to=data.get('salary_to'),
+            salary_currency=data.get('salary_currency'),
+            description=data.get('description', ''),
+            employer=data.get('employer'),
+            experience=data.get('experience'),
+            employment=data.get('employment')
+        )
+
+
+def measure_memory(factory: Callable[[], Any], count: int = 100000) -> float:
+    """Средний объем памяти на один объект в байтах"""
+    tracemalloc.start()
+    objects: List[Any] = [factory() for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def measure_time(factory: Callable[[], Any], number: int = 200000) -> float:
+    """Среднее время создания одного объекта в микросекундах"""
+    return min(timeit.repeat(factory, number=number, repeat=3)) / number * 1e6
+
+
+def main() -> None:
+    cases = {
+        'DictVacancy.from_dict (прежний класс)': lambda: DictVacancy.from_dict(DATA),
+        'Vacancy.from_dict (__slots__)': lambda: Vacancy.from_dict(DATA),
+        'Vacancy.from_trusted_dict': lambda: Vacancy.from_trusted_dict(DATA),
+    }
+    print(f"{'Способ создания':<40}{'байт/объект':>14}{'мкс/объект':>14}")
+    for title, factory in cases.items():
+        print(f"{title:<40}{measure_memory(factory):>14.0f}{measure_time(factory):>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
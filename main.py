@@ -1,27 +1,50 @@
 import os
+from itertools import chain
+from typing import Iterator, Optional, TypeVar
 
-
+from src.aggregator import JobAggregator
+from src.currency import DEFAULT_RATES_FILE, RateTable
 from src.headhunter import HeadHunterAPI
-from src.models import Vacancy
+from src.query import EXPERIENCE, VacancyQuery
+from src.render import PagedViewer
 from src.storage import JSONStorage
 from src.utils import (
     filter_vacancies,
     get_vacancies_by_salary,
-    sort_vacancies,
-    get_top_vacancies,
+    top_vacancies,
     print_vacancies,
     save_vacancies_to_file
 )
 
 
+T = TypeVar('T')
+
+
+def peek_vacancies(vacancies: Iterator[T]) -> Optional[Iterator[T]]:
+    """
+    Проверка итератора вакансий на пустоту без потери первого элемента
+    :param vacancies: Итератор вакансий
+    :return: Итератор по всем вакансиям или None, если вакансий нет
+    """
+    first = next(vacancies, None)
+    if first is None:
+        return None
+    return chain([first], vacancies)
+
+
 def user_interaction() -> None:
     """Функция для взаимодействия с пользователем через консоль"""
     print("Добро пожаловать в программу поиска вакансий!")
     print("=" * 50)
     
-    # Инициализация API и хранилища
-    hh_api = HeadHunterAPI()
-    storage = JSONStorage('vacancies.json')
+    # Инициализация источников вакансий и хранилища
+    job_api = JobAggregator([HeadHunterAPI()])
+    # Курсы валют берутся из локального файла: сравнение зарплат не зависит от сети
+    rates = RateTable.load() if os.path.exists(DEFAULT_RATES_FILE) else None
+    if rates is None:
+        print(f"Файл курсов валют {DEFAULT_RATES_FILE} не найден: "
+              "зарплаты в разных валютах сравниваются без пересчета")
+    storage = JSONStorage('vacancies.json', rates=rates)
     
     while True:
         print("\nМеню:")
@@ -43,34 +66,41 @@ def user_interaction() -> None:
             try:
                 per_page = int(input("Количество вакансий для загрузки (по умолчанию 50): ") or "50")
                 only_with_salary = input("Только с указанием зарплаты? (да/нет): ").lower() == 'да'
+                experience = input(f"Опыт работы ({', '.join(EXPERIENCE)}; Enter - любой): ").strip() or None
+                filter_words = input("Ключевые слова для отбора (через пробел, Enter - без отбора): ").split()
+                salary_range = input("Диапазон зарплат (например, 100000-200000, Enter - любой): ").strip() or None
                 
-                print("\nИдет загрузка вакансий...")
-                vacancies = hh_api.get_vacancies(
-                    search_query=search_query,
-                    per_page=per_page,
-                    only_with_salary=only_with_salary
+                # Опыт и наличие зарплаты отбирает API, ключевые слова и диапазон зарплат - программа
+                # (зарплаты пересчитываются в базовую валюту до проверки диапазона)
+                query = VacancyQuery(
+                    search_query,
+                    keywords=filter_words,
+                    salary_range=salary_range,
+                    experience=experience,
+                    only_with_salary=only_with_salary,
+                    rates=rates
                 )
                 
+                print("\nИдет загрузка вакансий...")
+                vacancies = query.fetch(job_api, per_page=per_page)
+                for source, error in job_api.errors.items():
+                    print(f"Источник {source} недоступен: {error}")
+                
                 if not vacancies:
                     print("По вашему запросу вакансии не найдены.")
                     continue
                 
-                # Сохраняем вакансии в хранилище
-                for v in vacancies:
-                    vacancy = Vacancy.from_dict(v)
-                    try:
-                        storage.add_vacancy(vacancy)
-                    except ValueError as e:
-                        # Пропускаем дубликаты
-                        pass
+                # Сохраняем вакансии в хранилище: записываются только новые и изменившиеся
+                saved = storage.upsert_vacancies(vacancies)
                 
-                print(f"\nЗагружено {len(vacancies)} вакансий.")
+                print(f"\nЗагружено {len(vacancies)} вакансий "
+                      f"(новых: {saved['inserted']}, обновлено: {saved['updated']}, "
+                      f"без изменений: {saved['unchanged']}, дубликатов: {saved['duplicates']}, "
+                      f"некорректных: {saved['invalid']}).")
                 
                 # Выводим топ-5 вакансий
                 print("\nТоп-5 вакансий по зарплате:")
-                sorted_vacancies = sort_vacancies(vacancies)
-                top_vacancies = get_top_vacancies(sorted_vacancies, 5)
-                print_vacancies(top_vacancies)
+                print_vacancies(top_vacancies(vacancies, 5))
                 
                 # Предлагаем сохранить в файл
                 if input("\nХотите сохранить результаты в файл? (да/нет): ").lower() == 'да':
@@ -83,52 +113,48 @@ def user_interaction() -> None:
                 print(f"Произошла ошибка: {e}")
         
         elif choice == '2':
-            # Просмотр сохраненных вакансий
-            vacancies = storage.get_vacancies()
-            if not vacancies:
+            # Просмотр сохраненных вакансий по страницам: читаются и выводятся только нужные
+            stored = peek_vacancies(storage.iter_vacancies())
+            if stored is None:
                 print("\nСохраненных вакансий нет.")
                 continue
                 
-            print(f"\nВсего сохранено вакансий: {len(vacancies)}")
-            print_vacancies(vacancies)
+            compact = input("Компактный вид (одна строка на вакансию)? (да/нет): ").lower() == 'да'
+            PagedViewer(stored, page_size=20 if compact else 5, compact=compact).run()
         
         elif choice == '3':
             # Фильтрация вакансий
-            vacancies = storage.get_vacancies()
-            if not vacancies:
+            stored = peek_vacancies(storage.iter_vacancies())
+            if stored is None:
                 print("\nНет вакансий для фильтрации.")
                 continue
             
             # Фильтрация по ключевым словам
             filter_words = input("\nВведите ключевые слова для фильтрации (через пробел): ").strip().split()
-            filtered = filter_vacancies(vacancies, filter_words)
+            filtered = filter_vacancies(stored, filter_words)
             
             # Фильтрация по зарплате
             salary_range = input("Введите диапазон зарплат (например, 100000-200000): ").strip()
             if salary_range:
                 filtered = get_vacancies_by_salary(filtered, salary_range)
             
-            # Сортировка
-            sorted_vacancies = sort_vacancies(filtered)
-            
-            # Вывод топ N
+            # Вывод топ N, отсортированных по зарплате
             try:
                 top_n = int(input("Сколько вакансий показать? (по умолчанию все): ") or "0")
-                result_vacancies = get_top_vacancies(sorted_vacancies, top_n) if top_n > 0 else sorted_vacancies
-                print_vacancies(result_vacancies)
+                print_vacancies(top_vacancies(filtered, top_n))
             except ValueError:
                 print("Ошибка: введите корректное число")
         
         elif choice == '4':
-            # Удаление вакансии
-            vacancies = storage.get_vacancies()
-            if not vacancies:
+            # Удаление вакансии: сохраненные записи уже проверены, объекты создаются без валидации
+            stored_objects = peek_vacancies(storage.iter_vacancy_objects())
+            if stored_objects is None:
                 print("\nНет вакансий для удаления.")
                 continue
                 
             print("\nСписок вакансий для удаления:")
-            for i, v in enumerate(vacancies, 1):
-                print(f"{i}. {v.get('name')} (ID: {v.get('id')})")
+            for i, v in enumerate(stored_objects, 1):
+                print(f"{i}. {v.name} (ID: {v.id})")
             
             try:
                 vacancy_id = input("\nВведите ID вакансии для удаления: ").strip()
@@ -144,14 +170,17 @@ def user_interaction() -> None:
                 print(f"Произошла ошибка: {e}")
         
         elif choice == '5':
-            # Сохранение в файл
-            vacancies = storage.get_vacancies()
-            if not vacancies:
+            # Сохранение в файл потоком, без загрузки всего хранилища в память
+            stored = peek_vacancies(storage.iter_vacancies())
+            if stored is None:
                 print("\nНет вакансий для сохранения.")
                 continue
                 
-            filename = input("\nВведите имя файла (по умолчанию 'vacancies_export.json'): ") or 'vacancies_export.json'
-            save_vacancies_to_file(vacancies, filename)
+            print("\nФормат определяется по расширению: .json, .jsonl, .csv; суффикс .gz - сжатие gzip")
+            filename = input("Введите имя файла (по умолчанию 'vacancies_export.json'): ") or 'vacancies_export.json'
+            save_vacancies_to_file(
+                stored, filename, progress=lambda count: print(f"\rВыгружено вакансий: {count}", end='')
+            )
         
         elif choice == '6':
             print("\nСпасибо за использование программы! До свидания!")
@@ -0,0 +1,151 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from .headhunter import HeadHunterAPI
+from .job_api import JobAPI
+from .models import Vacancy
+
+
+class JobAggregator(JobAPI):
+    """
+    Поиск вакансий сразу в нескольких источниках (реализациях JobAPI).
+    Источники опрашиваются параллельно, каждый со своим ограничением времени;
+    медленный или упавший источник не задерживает остальные, а его ошибка сохраняется в errors
+    """
+
+    def __init__(
+        self,
+        sources: Union[Sequence[JobAPI], Mapping[str, JobAPI]],
+        timeout: float = 30.0,
+        timeouts: Optional[Mapping[str, float]] = None
+    ) -> None:
+        """
+        Инициализация
+        :param sources: Источники вакансий: список или словарь (название: источник).
+            Название источника из списка - имя его класса
+        :param timeout: Время ожидания ответа источника в секундах
+        :param timeouts: Время ожидания для отдельных источников (название: секунды)
+        """
+        if isinstance(sources, Mapping):
+            self._sources: Dict[str, JobAPI] = dict(sources)
+        else:
+            self._sources = {}
+            for source in sources:
+                name = type(source).__name__
+                # Источники одного класса различаются номером позиции
+                if name in self._sources:
+                    name = f"{name}#{len(self._sources) + 1}"
+                self._sources[name] = source
+        if not self._sources:
+            raise ValueError("Нужен хотя бы один источник вакансий")
+
+        self._timeout = timeout
+        self._timeouts: Dict[str, float] = dict(timeouts or {})
+        self.errors: Dict[str, Exception] = {}  # Ошибки источников при последнем запросе
+        self.counts: Dict[str, int] = {}  # Количество вакансий от каждого источника при последнем запросе
+
+    @property
+    def sources(self) -> List[str]:
+        """Названия источников"""
+        return list(self._sources)
+
+    def connect(self) -> None:
+        """Подключение ко всем источникам (ошибки сохраняются в errors; если недоступны все - ConnectionError)"""
+        self.errors = {}
+        for name, source in self._sources.items():
+            try:
+                source.connect()
+            except Exception as e:
+                self.errors[name] = e
+
+        if len(self.errors) == len(self._sources):
+            raise ConnectionError(f"Все источники вакансий недоступны: {self._describe_errors()}")
+
+    def get_vacancies(self, search_query: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Поиск вакансий во всех источниках одновременно
+        :param search_query: Поисковый запрос
+        :param kwargs: Дополнительные параметры запроса (передаются каждому источнику)
+        :return: Вакансии в порядке источников, без дубликатов по URL и без некорректных записей.
+            Ошибки источников сохраняются в errors; если не ответил ни один - ConnectionError
+        """
+        self.errors = {}
+        self.counts = {}
+        results: Dict[str, List[Dict[str, Any]]] = {}
+
+        executor = ThreadPoolExecutor(max_workers=len(self._sources), thread_name_prefix='job-source')
+        started = time.monotonic()
+        try:
+            futures: Dict[str, Future] = {
+                name: executor.submit(source.get_vacancies, search_query, **kwargs)
+                for name, source in self._sources.items()
+            }
+            # Ожидание в порядке сроков: каждый источник получает свое время от общего старта
+            for name in sorted(futures, key=self._source_timeout):
+                remaining = self._source_timeout(name) - (time.monotonic() - started)
+                try:
+                    results[name] = futures[name].result(timeout=max(remaining, 0))
+                except FutureTimeoutError:
+                    futures[name].cancel()
+                    self.errors[name] = TimeoutError(
+                        f"Источник не ответил за {self._source_timeout(name):g} с"
+                    )
+                except Exception as e:
+                    self.errors[name] = e
+        finally:
+            # Зависший источник не должен блокировать возврат результатов
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if not results:
+            raise ConnectionError(f"Ни один источник вакансий не ответил: {self._describe_errors()}")
+
+        return self._combine(results)
+
+    def _source_timeout(self, name: str) -> float:
+        """Время ожидания источника"""
+        return self._timeouts.get(name, self._timeout)
+
+    def _combine(self, results: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Приведение вакансий к общей схеме и удаление дубликатов между источниками
+        :param results: Ответы источников (название: вакансии)
+        :return: Вакансии в порядке источников; из дубликатов остается первый.
+            ID уникальны только внутри источника, поэтому получают префикс с названием источника
+            ("название:ID"); ID вакансий HeadHunterAPI остаются как есть, как и при поиске без агрегатора
+        """
+        merged = []
+        seen_urls = set()
+        for name in self._sources:
+            if name not in results:
+                continue
+            count = 0
+            prefix = '' if isinstance(self._sources[name], HeadHunterAPI) else f"{name}:"
+            for data in results[name] or []:
+                try:
+                    vacancy = Vacancy.from_dict(data).to_dict()
+                except (ValueError, AttributeError, TypeError):
+                    # Запись, не соответствующая схеме, пропускается
+                    continue
+                key = self._dedup_key(vacancy['url'])
+                if key in seen_urls:
+                    continue
+                seen_urls.add(key)
+                if prefix and vacancy.get('id'):
+                    vacancy['id'] = f"{prefix}{vacancy['id']}"
+                merged.append(vacancy)
+                count += 1
+            self.counts[name] = count
+        return merged
+
+    @staticmethod
+    def _dedup_key(url: str) -> str:
+        """Ключ для поиска дубликатов: URL без схемы, регистра домена и завершающей косой черты"""
+        address = url.split('://', 1)[1]
+        host, _, path = address.partition('/')
+        return f"{host.lower()}/{path.rstrip('/')}"
+
+    def _describe_errors(self) -> str:
+        """Ошибки источников одной строкой"""
+        return '; '.join(f"{name}: {error}" for name, error in self.errors.items())
@@ -0,0 +1,313 @@
+import heapq
+import math
+from array import array
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .currency import SALARY_FROM_BASE, SALARY_TO_BASE
+from .utils import parse_salary_range
+
+NUMERIC_FIELDS = ('salary_from', 'salary_to', SALARY_FROM_BASE, SALARY_TO_BASE)
+CATEGORY_FIELDS = ('employer', 'experience', 'employment', 'salary_currency')
+TEXT_FIELDS = ('id', 'name', 'url', 'description')
+FIELDS = (
+    'id', 'name', 'url', 'salary_from', 'salary_to', 'salary_currency',
+    'description', 'employer', 'experience', 'employment'
+)
+BASE_FIELDS = (SALARY_FROM_BASE, SALARY_TO_BASE)
+
+
+class _TextColumn:
+    """Текстовый столбец: строки хранятся одним блоком UTF-8 и декодируются при обращении"""
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+        self._offsets = array('q', [0])
+        self._nulls: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self._nulls.add(len(self))
+        else:
+            self._data += str(value).encode('utf-8')
+        self._offsets.append(len(self._data))
+
+    def get(self, index: int) -> Optional[str]:
+        if index in self._nulls:
+            return None
+        return self._data[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+
+class _CategoryColumn:
+    """Категориальный столбец со словарным кодированием: значения хранятся кодами в массиве"""
+
+    def __init__(self) -> None:
+        self.categories: List[Any] = []
+        self._codes_by_value: Dict[Any, int] = {}
+        self.codes = array('i')
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._codes_by_value.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(value)
+            self._codes_by_value[value] = code
+        self.codes.append(code)
+
+    def code(self, value: Any) -> Optional[int]:
+        """Код значения (None, если значение не встречается)"""
+        if value is None:
+            return -1
+        return self._codes_by_value.get(value)
+
+    def get(self, index: int) -> Any:
+        code = self.codes[index]
+        return self.categories[code] if code >= 0 else None
+
+
+def _from_float(value: float) -> Optional[float]:
+    """Обратное преобразование числа из столбца: NaN - нет значения, целые возвращаются как int"""
+    if math.isnan(value):
+        return None
+    return int(value) if value.is_integer() else value
+
+
+class _Columns:
+    """
+    Столбцы вакансий, общие для набора и всех выборок из него.
+    Производные массивы для фильтрации и сортировки по зарплате вычисляются один раз
+    """
+
+    def __init__(self) -> None:
+        self.numeric = {field: array('d') for field in NUMERIC_FIELDS}
+        self.categories = {field: _CategoryColumn() for field in CATEGORY_FIELDS}
+        self.texts = {field: _TextColumn() for field in TEXT_FIELDS}
+        self.has_base = array('b')  # Признак наличия у вакансии полей с пересчитанной зарплатой
+        self.size = 0
+        self._salary_bounds: Optional[Tuple[array, array]] = None
+        self._salary_keys: Optional[array] = None
+
+    def append(self, vacancy: Dict[str, Any]) -> None:
+        """Добавление одной вакансии"""
+        for field, column in self.numeric.items():
+            value = vacancy.get(field)
+            column.append(float(value) if value is not None else math.nan)
+        for field, category in self.categories.items():
+            category.append(vacancy.get(field))
+        for field, text in self.texts.items():
+            text.append(vacancy.get(field))
+        self.has_base.append(any(field in vacancy for field in BASE_FIELDS))
+        self._salary_bounds = None
+        self._salary_keys = None
+        self.size += 1
+
+    def _salary_pairs(self) -> Iterator[Tuple[float, float]]:
+        """Пары (от, до) для сравнения: пересчитанная в базовую валюту зарплата, если есть (как get_salary_values)"""
+        numeric = self.numeric
+        for low, high, low_base, high_base, has_base in zip(
+            numeric['salary_from'], numeric['salary_to'], numeric[SALARY_FROM_BASE], numeric[SALARY_TO_BASE],
+            self.has_base
+        ):
+            yield (low_base, high_base) if has_base else (low, high)
+
+    def salary_bounds(self) -> Tuple[array, array]:
+        """Границы зарплатных вилок (как get_salary_bounds): отсутствующие - 0 и бесконечность"""
+        if self._salary_bounds is None:
+            lows, highs = array('d'), array('d')
+            for low, high in self._salary_pairs():
+                # NaN и 0 означают отсутствие границы
+                lows.append(low if low == low else 0.0)
+                highs.append(high if high == high and high else math.inf)
+            self._salary_bounds = lows, highs
+        return self._salary_bounds
+
+    def salary_keys(self) -> array:
+        """Ключи сортировки по зарплате (как get_salary_sort_key)"""
+        if self._salary_keys is None:
+            keys = array('d')
+            for low, high in self._salary_pairs():
+                low = low if low == low else 0.0
+                high = high if high == high else 0.0
+                # Если указана только максимальная зарплата, используем её
+                keys.append(high if low == 0 and high > 0 else max(low, high))
+            self._salary_keys = keys
+        return self._salary_keys
+
+
+class VacancyBatch:
+    """
+    Столбцовое представление набора вакансий для массовой аналитики:
+    зарплаты - в числовых массивах, работодатель/опыт/занятость/валюта - кодами словаря,
+    текстовые поля - одним блоком UTF-8 с декодированием по запросу.
+    Результаты фильтрации и сортировки - выборки: массив номеров строк над теми же столбцами,
+    без копирования данных
+    """
+
+    def __init__(self, columns: Optional[_Columns] = None, rows: Optional[array] = None) -> None:
+        """
+        Создание пустого набора (для заполнения используйте from_dicts)
+        :param columns: Столбцы (для выборок - столбцы исходного набора)
+        :param rows: Номера строк выборки в столбцах (None - все строки)
+        """
+        self._columns = columns if columns is not None else _Columns()
+        self._rows = rows
+
+    @classmethod
+    def from_dicts(cls, vacancies: Iterable[Dict[str, Any]]) -> 'VacancyBatch':
+        """
+        Построение набора из словарей вакансий
+        :param vacancies: Список или итератор вакансий
+        :return: Набор вакансий
+        """
+        columns = _Columns()
+        for vacancy in vacancies:
+            columns.append(vacancy)
+        return cls(columns)
+
+    def _indices(self) -> Sequence[int]:
+        """Номера строк набора в столбцах"""
+        return self._rows if self._rows is not None else range(self._columns.size)
+
+    def __len__(self) -> int:
+        return len(self._rows) if self._rows is not None else self._columns.size
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Вакансия в виде словаря (поля декодируются только для нее)"""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Индекс вакансии вне диапазона")
+        return self._row(self._indices()[index])
+
+    def _row(self, row: int) -> Dict[str, Any]:
+        """Словарь вакансии по номеру строки в столбцах"""
+        columns = self._columns
+        vacancy: Dict[str, Any] = {}
+        for field in FIELDS:
+            if field in columns.numeric:
+                vacancy[field] = _from_float(columns.numeric[field][row])
+            elif field in columns.categories:
+                vacancy[field] = columns.categories[field].get(row)
+            else:
+                vacancy[field] = columns.texts[field].get(row)
+        if columns.has_base[row]:
+            for field in BASE_FIELDS:
+                vacancy[field] = _from_float(columns.numeric[field][row])
+        return vacancy
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in self._indices():
+            yield self._row(row)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Преобразование в список словарей"""
+        return list(self)
+
+    def column(self, field: str) -> List[Any]:
+        """
+        Значения одного поля для всех вакансий
+        :param field: Название поля
+        :return: Список значений
+        """
+        columns = self._columns
+        if field in columns.numeric:
+            values = columns.numeric[field]
+            return [_from_float(values[row]) for row in self._indices()]
+        if field in columns.categories:
+            category = columns.categories[field]
+            return [category.get(row) for row in self._indices()]
+        if field in columns.texts:
+            text = columns.texts[field]
+            return [text.get(row) for row in self._indices()]
+        raise ValueError(f"Неизвестное поле: {field}")
+
+    def take(self, indices: Iterable[int]) -> 'VacancyBatch':
+        """
+        Выборка вакансий с указанными позициями (столбцы не копируются)
+        :param indices: Позиции вакансий в наборе
+        :return: Набор вакансий
+        """
+        if self._rows is None:
+            return VacancyBatch(self._columns, array('q', indices))
+        rows = self._rows
+        return VacancyBatch(self._columns, array('q', [rows[index] for index in indices]))
+
+    def _select(self, rows: Iterable[int]) -> 'VacancyBatch':
+        """Выборка по номерам строк в столбцах"""
+        return VacancyBatch(self._columns, array('q', rows))
+
+    def salary_mask(self, min_salary: float, max_salary: float) -> List[bool]:
+        """
+        Признаки пересечения зарплатной вилки с диапазоном (семантика get_vacancies_by_salary)
+        :param min_salary: Нижняя граница диапазона
+        :param max_salary: Верхняя граница диапазона
+        :return: Список признаков по вакансиям
+        """
+        lows, highs = self._columns.salary_bounds()
+        if self._rows is None:
+            return [low <= max_salary and high >= min_salary for low, high in zip(lows, highs)]
+        return [lows[row] <= max_salary and highs[row] >= min_salary for row in self._rows]
+
+    def filter_salary(self, salary_range: str) -> 'VacancyBatch':
+        """
+        Фильтрация по диапазону зарплат в формате "min-max"
+        :param salary_range: Строка с диапазоном
+        :return: Набор подходящих вакансий (весь набор, если диапазон некорректен)
+        """
+        bounds = parse_salary_range(salary_range)
+        if bounds is None:
+            return self
+        min_salary, max_salary = bounds
+        return self._select(compress(self._indices(), self.salary_mask(min_salary, max_salary)))
+
+    def filter_equals(self, field: str, value: Any) -> 'VacancyBatch':
+        """
+        Отбор вакансий с заданным значением категориального поля (сравнение кодов)
+        :param field: Поле (employer, experience, employment, salary_currency)
+        :param value: Значение поля
+        :return: Набор подходящих вакансий
+        """
+        if field not in self._columns.categories:
+            raise ValueError(f"Поле {field} не является категориальным")
+        category = self._columns.categories[field]
+        code = category.code(value)
+        if code is None:
+            return self._select([])
+        codes = category.codes
+        if self._rows is None:
+            return self._select(row for row, item in enumerate(codes) if item == code)
+        return self._select(row for row in self._rows if codes[row] == code)
+
+    def salary_keys(self) -> array:
+        """Ключи сортировки по зарплате (как get_salary_sort_key) в порядке вакансий набора"""
+        keys = self._columns.salary_keys()
+        if self._rows is None:
+            return keys
+        return array('d', [keys[row] for row in self._rows])
+
+    def sort_by_salary(self, descending: bool = True) -> 'VacancyBatch':
+        """
+        Сортировка по зарплате (устойчивая, как sort_vacancies)
+        :param descending: По убыванию
+        :return: Отсортированный набор
+        """
+        keys = self._columns.salary_keys()
+        return self._select(sorted(self._indices(), key=keys.__getitem__, reverse=descending))
+
+    def top(self, n: int) -> 'VacancyBatch':
+        """
+        N вакансий с наибольшей зарплатой без полной сортировки
+        :param n: Количество вакансий (0 и меньше - все, по убыванию зарплаты)
+        :return: Набор вакансий
+        """
+        if n <= 0:
+            return self.sort_by_salary()
+        keys = self._columns.salary_keys()
+        return self._select(heapq.nlargest(n, self._indices(), key=keys.__getitem__))
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from src.job_api import JobAPI
+
+
+class ResponseCache(ABC):
+    """Абстрактный класс кеша ответов API с временем жизни записей"""
+
+    def __init__(self, ttl: float = 300) -> None:
+        """
+        Инициализация кеша
+        :param ttl: Время жизни записи в секундах
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    @abstractmethod
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Получение записи кеша (в том числе устаревшей)"""
+        pass
+
+    @abstractmethod
+    def _store(self, key: str, entry: Dict[str, Any]) -> None:
+        """Сохранение записи кеша"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Очистка кеша"""
+        pass
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Получение актуальных данных из кеша
+        :param key: Ключ запроса
+        :return: Данные или None, если записи нет или она устарела
+        """
+        entry = self._load(key)
+        if entry is not None and time.time() - entry['stored_at'] < self.ttl:
+            self.hits += 1
+            return entry['data']
+        self.misses += 1
+        return None
+
+    def set(self, key: str, data: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Сохранение данных в кеш
+        :param key: Ключ запроса
+        :param data: Данные ответа
+        :param etag: Значение заголовка ETag ответа
+        :param last_modified: Значение заголовка Last-Modified ответа
+        """
+        self._store(key, {
+            'data': data,
+            'stored_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified
+        })
+
+    def validators(self, key: str) -> Dict[str, str]:
+        """
+        Заголовки условного запроса для устаревшей записи
+        :param key: Ключ запроса
+        :return: Словарь с заголовками If-None-Match / If-Modified-Since
+        """
+        entry = self._load(key)
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def revalidate(self, key: str) -> Optional[Any]:
+        """
+        Продление записи после ответа 304 Not Modified
+        :param key: Ключ запроса
+        :return: Данные записи или None, если запись уже вытеснена
+        """
+        entry = self._load(key)
+        if entry is None:
+            return None
+        entry['stored_at'] = time.time()
+        self._store(key, entry)
+        self.revalidations += 1
+        return entry['data']
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Счетчики попаданий, промахов и успешных перепроверок"""
+        return {'hits': self.hits, 'misses': self.misses, 'revalidations': self.revalidations}
+
+
+class MemoryCache(ResponseCache):
+    """Кеш в памяти с вытеснением давно не использованных записей (LRU)"""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300) -> None:
+        """
+        Инициализация кеша
+        :param max_size: Максимальное количество записей
+        :param ttl: Время жизни записи в секундах
+        """
+        super().__init__(ttl)
+        self._max_size = max_size
+        self._entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCache(ResponseCache):
+    """Кеш на диске: по одному JSON-файлу на запрос"""
+
+    def __init__(self, directory: str = os.path.join('data', 'cache'), ttl: float = 300) -> None:
+        """
+        Инициализация кеша
+        :param directory: Каталог для файлов кеша
+        :param ttl: Время жизни записи в секундах
+        """
+        super().__init__(ttl)
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Путь к файлу записи"""
+        return os.path.join(self._directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as file:
+                entry: Dict[str, Any] = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        # Защита от коллизий имен файлов
+        return entry if entry.get('key') == key else None
+
+    def _store(self, key: str, entry: Dict[str, Any]) -> None:
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump({**entry, 'key': key}, file, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def clear(self) -> None:
+        for name in os.listdir(self._directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self._directory, name))
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Построение ключа кеша из параметров запроса
+    :param parts: Составляющие запроса (словари сериализуются с сортировкой ключей)
+    :return: Строковый ключ
+    """
+    return json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class CachedJobAPI(JobAPI):
+    """Обертка над любым JobAPI, кеширующая результаты get_vacancies"""
+
+    def __init__(self, api: JobAPI, cache: Optional[ResponseCache] = None) -> None:
+        """
+        Инициализация обертки
+        :param api: Источник вакансий
+        :param cache: Кеш результатов (по умолчанию MemoryCache)
+        """
+        self._api = api
+        self.cache = cache if cache is not None else MemoryCache()
+
+    def connect(self) -> None:
+        """Подключение к API"""
+        self._api.connect()
+
+    def get_vacancies(self, search_query: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Получение списка вакансий с использованием кеша
+        :param search_query: Поисковый запрос
+        :param kwargs: Дополнительные параметры запроса
+        :return: Список словарей с данными о вакансиях
+        """
+        key = make_cache_key(type(self._api).__name__, search_query, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        vacancies = self._api.get_vacancies(search_query, **kwargs)
+        self.cache.set(key, list(vacancies))
+        return vacancies
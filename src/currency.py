@@ -0,0 +1,108 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# Поля с зарплатой, пересчитанной в базовую валюту при загрузке
+SALARY_FROM_BASE = 'salary_from_base'
+SALARY_TO_BASE = 'salary_to_base'
+
+DEFAULT_RATES_FILE = os.path.join('data', 'rates.json')
+
+
+class RateTable:
+    """
+    Таблица курсов валют для пересчета зарплат в базовую валюту.
+    Загружается из локального JSON-файла вида
+    {"base": "RUR", "timestamp": "2026-10-01T00:00:00", "rates": {"USD": 95.0, "EUR": 103.0}},
+    где курс - стоимость единицы валюты в базовой валюте
+    """
+
+    def __init__(self, rates: Dict[str, float], base: str = 'RUR', timestamp: Optional[datetime] = None) -> None:
+        """
+        Инициализация таблицы
+        :param rates: Курсы валют (валюта: стоимость в базовой валюте)
+        :param base: Код базовой валюты
+        :param timestamp: Дата и время, на которые актуальны курсы
+        """
+        self.base = base
+        self.timestamp = timestamp
+        self._rates = {currency: float(rate) for currency, rate in rates.items()}
+        self._rates[base] = 1.0
+
+    @classmethod
+    def load(cls, filename: str = DEFAULT_RATES_FILE) -> 'RateTable':
+        """
+        Загрузка таблицы из файла
+        :param filename: Путь к JSON-файлу с курсами
+        :return: Таблица курсов
+        """
+        try:
+            with open(filename, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except IOError as e:
+            raise IOError(f"Ошибка при чтении курсов валют из {filename}: {e}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Некорректный файл курсов валют {filename}: {e}")
+
+        if not isinstance(data, dict) or not isinstance(data.get('rates'), dict):
+            raise ValueError(f"В файле {filename} нет таблицы курсов 'rates'")
+
+        timestamp = datetime.fromisoformat(data['timestamp']) if data.get('timestamp') else None
+        return cls(data['rates'], base=data.get('base', 'RUR'), timestamp=timestamp)
+
+    def save(self, filename: str = DEFAULT_RATES_FILE) -> None:
+        """
+        Сохранение таблицы в файл
+        :param filename: Путь к JSON-файлу
+        """
+        data = {
+            'base': self.base,
+            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+            'rates': {currency: rate for currency, rate in self._rates.items() if currency != self.base}
+        }
+        with open(filename, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=4)
+
+    def rate(self, currency: Optional[str]) -> Optional[float]:
+        """
+        Курс валюты (валюта не указана - базовая)
+        :param currency: Код валюты
+        :return: Стоимость единицы валюты в базовой валюте или None, если курс неизвестен
+        """
+        return self._rates.get(currency or self.base)
+
+    def convert(self, amount: Optional[float], currency: Optional[str]) -> Optional[float]:
+        """
+        Пересчет суммы в базовую валюту
+        :param amount: Сумма
+        :param currency: Код валюты суммы
+        :return: Сумма в базовой валюте или None, если сумма не указана или курс неизвестен
+        """
+        rate = self.rate(currency)
+        if amount is None or rate is None:
+            return None
+        return amount if rate == 1.0 else round(amount * rate, 2)
+
+    def normalize(self, vacancy: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Добавление к вакансии зарплаты в базовой валюте
+        :param vacancy: Словарь с данными о вакансии
+        :return: Новый словарь с полями salary_from_base и salary_to_base. Для валюты без курса
+            они равны None: такая зарплата не сравнивается с пересчитанными как есть (см. get_salary_values)
+        """
+        currency = vacancy.get('salary_currency')
+        return {
+            **vacancy,
+            SALARY_FROM_BASE: self.convert(vacancy.get('salary_from'), currency),
+            SALARY_TO_BASE: self.convert(vacancy.get('salary_to'), currency)
+        }
+
+    def normalize_all(self, vacancies: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Пересчет зарплат для набора вакансий
+        :param vacancies: Список или итератор вакансий
+        :return: Итератор по вакансиям с зарплатой в базовой валюте
+        """
+        for vacancy in vacancies:
+            yield self.normalize(vacancy)
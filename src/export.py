@@ -0,0 +1,122 @@
+import csv
+import gzip
+import json
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Sequence
+
+from .currency import SALARY_FROM_BASE, SALARY_TO_BASE
+
+# Форматы выгрузки: JSON-массив с отступами, JSON-массив без пробелов, JSON Lines и CSV
+EXPORT_FORMATS = ('json', 'compact', 'jsonl', 'csv')
+
+CSV_FIELDS = (
+    'id', 'name', 'url', 'salary_from', 'salary_to', 'salary_currency',
+    'description', 'employer', 'experience', 'employment', SALARY_FROM_BASE, SALARY_TO_BASE
+)
+
+_EXTENSIONS = {'.json': 'json', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.csv': 'csv'}
+
+
+def detect_format(filename: str) -> str:
+    """
+    Определение формата выгрузки по расширению файла (суффикс .gz не учитывается)
+    :param filename: Имя файла
+    :return: Формат из EXPORT_FORMATS (по умолчанию json)
+    """
+    name = filename.lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    for extension, fmt in _EXTENSIONS.items():
+        if name.endswith(extension):
+            return fmt
+    return 'json'
+
+
+def _write_json(file: IO[str], vacancies: Iterable[Dict[str, Any]], on_record: Callable[[], None]) -> None:
+    """JSON-массив, побайтно совпадающий с json.dump(..., indent=2), без построения всего списка"""
+    file.write('[')
+    separator = '\n  '
+    for vacancy in vacancies:
+        # Отступ элемента массива - два пробела перед каждой строкой его представления
+        file.write(separator + json.dumps(vacancy, ensure_ascii=False, indent=2).replace('\n', '\n  '))
+        separator = ',\n  '
+        on_record()
+    file.write(']' if separator == '\n  ' else '\n]')
+
+
+def _write_compact(file: IO[str], vacancies: Iterable[Dict[str, Any]], on_record: Callable[[], None]) -> None:
+    """JSON-массив без отступов и пробелов"""
+    file.write('[')
+    separator = ''
+    for vacancy in vacancies:
+        file.write(separator + json.dumps(vacancy, ensure_ascii=False, separators=(',', ':')))
+        separator = ','
+        on_record()
+    file.write(']')
+
+
+def _write_jsonl(file: IO[str], vacancies: Iterable[Dict[str, Any]], on_record: Callable[[], None]) -> None:
+    """JSON Lines: одна вакансия на строку"""
+    for vacancy in vacancies:
+        file.write(json.dumps(vacancy, ensure_ascii=False, separators=(',', ':')) + '\n')
+        on_record()
+
+
+def _csv_writer(fields: Sequence[str]) -> Callable[[IO[str], Iterable[Dict[str, Any]], Callable[[], None]], None]:
+    """Запись CSV с заданными столбцами (лишние поля вакансий пропускаются)"""
+    def write(file: IO[str], vacancies: Iterable[Dict[str, Any]], on_record: Callable[[], None]) -> None:
+        writer = csv.DictWriter(file, fieldnames=list(fields), extrasaction='ignore')
+        writer.writeheader()
+        for vacancy in vacancies:
+            writer.writerow(vacancy)
+            on_record()
+    return write
+
+
+def export_vacancies(
+    vacancies: Iterable[Dict[str, Any]],
+    filename: str,
+    fmt: Optional[str] = None,
+    compress: Optional[bool] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    progress_every: int = 1000,
+    fields: Sequence[str] = CSV_FIELDS
+) -> int:
+    """
+    Потоковая выгрузка вакансий в файл: вакансии записываются по одной по мере чтения из итератора,
+    поэтому расход памяти не зависит от их количества
+    :param vacancies: Список или итератор вакансий
+    :param filename: Имя файла
+    :param fmt: Формат из EXPORT_FORMATS (по умолчанию определяется по расширению, см. detect_format)
+    :param compress: Сжатие gzip (по умолчанию - если имя файла оканчивается на .gz)
+    :param progress: Функция, получающая количество выгруженных вакансий
+        каждые progress_every вакансий и по завершении
+    :param progress_every: Период вызова progress
+    :param fields: Столбцы CSV
+    :return: Количество выгруженных вакансий
+    """
+    fmt = fmt or detect_format(filename)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Неизвестный формат выгрузки: {fmt}. Доступны: {', '.join(EXPORT_FORMATS)}")
+    if compress is None:
+        compress = filename.lower().endswith('.gz')
+
+    writers = {'json': _write_json, 'compact': _write_compact, 'jsonl': _write_jsonl, 'csv': _csv_writer(fields)}
+    count = 0
+
+    def on_record() -> None:
+        nonlocal count
+        count += 1
+        if progress is not None and count % progress_every == 0:
+            progress(count)
+
+    # newline='' - переводы строк CSV записываются модулем csv без преобразования
+    if compress:
+        file = gzip.open(filename, 'wt', encoding='utf-8', newline='')
+    else:
+        file = open(filename, 'w', encoding='utf-8', newline='')
+    with file:
+        writers[fmt](file, vacancies, on_record)
+
+    if progress is not None and (count == 0 or count % progress_every):
+        progress(count)
+    return count
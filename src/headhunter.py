@@ -1,8 +1,19 @@
-from typing import Any, Dict, List
+import asyncio
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from src.job_api import JobAPI
+from src.cache import ResponseCache, make_cache_key
+from src.job_api import AsyncJobAPI, JobAPI
+from src.rate_limiter import RateLimiter, RequestBudget
 
 
 class HeadHunterAPI(JobAPI):
@@ -10,70 +21,472 @@ class HeadHunterAPI(JobAPI):
 
     __base_url = "https://api.hh.ru/vacancies"
     __connected = False
+    __max_depth = 2000  # hh.ru отдает не более 2000 вакансий по одному запросу
+    __retry_statuses = frozenset({429, 500, 502, 503, 504})
 
-    def __init__(self):
-        """Инициализация класса для работы с API hh.ru"""
-        super().__init__()
-        self.connect()
+    def __init__(
+        self,
+        max_workers: int = 8,
+        base_url: Optional[str] = None,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        per_host_limit: Optional[int] = None,
+        health_check_ttl: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limit: Optional[float] = None,
+        burst: int = 1,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_budget: Optional[int] = None
+    ):
+        """
+        Инициализация класса для работы с API hh.ru
+        :param max_workers: Максимальное число одновременно загружаемых страниц
+        :param base_url: Адрес API (по умолчанию https://api.hh.ru/vacancies)
+        :param pool_size: Размер пула keep-alive соединений
+        :param max_retries: Количество повторов при ответах 429/5xx и сетевых ошибках
+        :param backoff_factor: Базовая задержка экспоненциального backoff в секундах
+        :param max_backoff: Максимальная задержка между повторами в секундах
+        :param per_host_limit: Максимум одновременных запросов к одному хосту (по умолчанию pool_size)
+        :param health_check_ttl: Если задан, перед запросами выполняется проверка доступности API,
+            результат которой кешируется на указанное число секунд
+        :param cache: Кеш страниц выдачи (MemoryCache, FileCache и т.п.)
+        :param rate_limit: Допустимое количество запросов в секунду (None - без ограничения)
+        :param burst: Количество запросов, выполняемых подряд без ожидания
+        :param rate_limiter: Готовый ограничитель частоты, общий для нескольких клиентов
+            (вместо rate_limit и burst)
+        :param request_budget: Максимальное количество HTTP-запросов за запуск (включая повторы);
+            при превышении - RequestBudgetExceeded. Новый запуск начинается с reset_metrics
+        """
+        self.__max_workers = max_workers
+        if base_url:
+            self.__base_url = base_url
+        self.__max_retries = max_retries
+        self.__backoff_factor = backoff_factor
+        self.__max_backoff = max_backoff
+        self.__per_host_limit = per_host_limit or pool_size
+        self.__host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self.__host_limits_lock = threading.Lock()
+
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.__session.mount("https://", adapter)
+        self.__session.mount("http://", adapter)
+
+        # Подключение ленивое: сессия проверяется первым реальным запросом
+        self.__health_check_ttl = health_check_ttl
+        self.__checked_at: Optional[float] = None
+
+        self.__cache = cache
+
+        if rate_limiter is None and rate_limit:
+            rate_limiter = RateLimiter(rate_limit, burst)
+        self.__rate_limiter = rate_limiter
+        self.__budget = RequestBudget(request_budget) if request_budget is not None else None
+        self.__metrics = self._empty_metrics()
+        self.__metrics_lock = threading.Lock()
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Ограничитель частоты запросов (None - без ограничения)"""
+        return self.__rate_limiter
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Статистика запросов с последнего сброса
+        :return: Словарь: requests - HTTP-запросы, retries - повторы,
+            wait_time - ожидание ограничителя частоты и слота хоста, backoff_time - паузы перед повторами,
+            io_time - выполнение запросов (секунды), budget_remaining - остаток лимита запросов
+        """
+        with self.__metrics_lock:
+            metrics = dict(self.__metrics)
+        if self.__budget is not None:
+            metrics['budget_remaining'] = self.__budget.remaining
+        return metrics
+
+    def reset_metrics(self) -> None:
+        """Сброс статистики и начало нового запуска с полным лимитом запросов"""
+        with self.__metrics_lock:
+            self.__metrics = self._empty_metrics()
+        if self.__budget is not None:
+            self.__budget.reset()
+
+    @staticmethod
+    def _empty_metrics() -> Dict[str, float]:
+        """Начальные значения статистики"""
+        return {'requests': 0, 'retries': 0, 'wait_time': 0.0, 'backoff_time': 0.0, 'io_time': 0.0}
+
+    def _record(self, **values: float) -> None:
+        """Добавление значений к статистике"""
+        with self.__metrics_lock:
+            for name, value in values.items():
+                self.__metrics[name] += value
+
+    def __enter__(self) -> 'HeadHunterAPI':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрытие пула соединений"""
+        self.__session.close()
 
     def connect(self) -> None:
-        """Подключение к API hh.ru"""
+        """Проверка доступности API hh.ru (результат кешируется на health_check_ttl секунд)"""
+        if self.__connected and self.__checked_at is not None and self.__health_check_ttl is not None:
+            if time.monotonic() - self.__checked_at < self.__health_check_ttl:
+                return
+
+        self.__connected = False
         try:
-            response = requests.get(self.__base_url, timeout=5)
+            # Запрос одной вакансии вместо полной выдачи
+            response = self._request(params={"per_page": 1}, timeout=5)
             if response.status_code != 200:
                 raise ConnectionError(f"Ошибка подключения к hh.ru: {response.status_code}")
-            self.__connected = True
+            self._mark_connected()
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"Ошибка подключения к hh.ru: {str(e)}")
 
+    def _mark_connected(self) -> None:
+        """Отметка об успешном обращении к API"""
+        self.__connected = True
+        self.__checked_at = time.monotonic()
+
     def get_vacancies(self, search_query: str, **kwargs: Any) -> List[Dict[str, Any]]:
         """
         Получение списка вакансий по поисковому запросу
         :param search_query: Поисковый запрос
         :param kwargs: Дополнительные параметры запроса
+            (fetch_all=True загружает все страницы выдачи, max_pages ограничивает их число;
+            фильтры API: area, only_with_salary, experience, employment, salary, currency)
         :return: Список словарей с данными о вакансиях
         """
-        if not self.__connected:
+        if self.__health_check_ttl is not None:
             self.connect()
 
+        params = self._build_params(search_query, **kwargs)
+        first_page = self._fetch_page(params)
+        result = self._parse_vacancies(first_page.get("items", []))
+
+        if not kwargs.get('fetch_all'):
+            return result
+
+        pages = self._count_pages(first_page, params["per_page"], kwargs.get('max_pages'))
+        if pages <= 1:
+            return result
+
+        # Остальные страницы загружаем параллельно, map сохраняет порядок страниц
+        pages_params = [{**params, "page": page} for page in range(1, pages)]
+        with ThreadPoolExecutor(max_workers=min(self.__max_workers, len(pages_params))) as executor:
+            for page_data in executor.map(self._fetch_page, pages_params):
+                result.extend(self._parse_vacancies(page_data.get("items", [])))
+
+        return result
+
+    @staticmethod
+    def _build_params(search_query: str, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Формирование параметров запроса первой страницы
+        :param search_query: Поисковый запрос
+        :param kwargs: Дополнительные параметры запроса
+        :return: Словарь параметров запроса
+        """
         params = {
             "text": search_query,
             "per_page": kwargs.get('per_page', 100),  # Максимальное количество результатов на странице
-            "area": 113,  # Код России
+            "area": kwargs.get('area', 113),  # По умолчанию код России
             "only_with_salary": kwargs.get('only_with_salary', False),
-            "page": kwargs.get('page', 0)
+            "page": 0 if kwargs.get('fetch_all') else kwargs.get('page', 0)
         }
+        # Фильтры, выполняемые API (см. VacancyQuery): передаются, только если заданы
+        for name in ('experience', 'employment', 'salary', 'currency'):
+            if kwargs.get(name) is not None:
+                params[name] = kwargs[name]
+        return params
+
+    def _count_pages(self, first_page: Dict[str, Any], per_page: int, max_pages: Any = None) -> int:
+        """
+        Вычисление количества страниц для загрузки с учетом ограничения глубины выдачи
+        :param first_page: Ответ API на запрос первой страницы
+        :param per_page: Количество вакансий на странице
+        :param max_pages: Необязательное ограничение числа страниц
+        :return: Количество страниц
+        """
+        pages = first_page.get("pages")
+        if pages is None:
+            pages = math.ceil(first_page.get("found", 0) / per_page) if per_page > 0 else 1
+
+        pages = min(pages, math.ceil(self.__max_depth / per_page) if per_page > 0 else 1)
+        if max_pages is not None:
+            pages = min(pages, max_pages)
+        return pages
+
+    def _fetch_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Загрузка одной страницы выдачи (с учетом кеша, если он задан)
+        :param params: Параметры запроса
+        :return: Ответ API в виде словаря
+        """
+        cache_key = None
+        headers: Dict[str, str] = {}
+        if self.__cache is not None:
+            cache_key = make_cache_key(self.__base_url, params)
+            cached: Optional[Dict[str, Any]] = self.__cache.get(cache_key)
+            if cached is not None:
+                return cached
+            headers = self.__cache.validators(cache_key)
 
         try:
-            response = requests.get(self.__base_url, params=params, timeout=10)
+            response = self._request(params=params, timeout=10, headers=headers)
+            if response.status_code == 304 and cache_key is not None and self.__cache is not None:
+                revalidated: Optional[Dict[str, Any]] = self.__cache.revalidate(cache_key)
+                if revalidated is not None:
+                    self._mark_connected()
+                    return revalidated
+                # Запись успели вытеснить: повторяем запрос без условных заголовков
+                response = self._request(params=params, timeout=10)
+
             response.raise_for_status()
+            data: Dict[str, Any] = response.json()
+        except requests.exceptions.RequestException as e:
+            raise ConnectionError(f"Ошибка при получении вакансий: {str(e)}")
+
+        if cache_key is not None and self.__cache is not None:
+            self.__cache.set(
+                cache_key, data,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+
+        self._mark_connected()
+        return data
 
-            vacancies = response.json().get("items", [])
-            result = []
-
-            for v in vacancies:
-                salary = v.get("salary")
-                if salary:
-                    salary_from = salary.get('from')
-                    salary_to = salary.get('to')
-                    salary_currency = salary.get('currency', 'RUR')
-                else:
-                    salary_from = salary_to = salary_currency = None
-
-                result.append({
-                    "id": v.get("id"),
-                    "name": v.get("name"),
-                    "url": v.get("alternate_url"),
-                    "salary_from": salary_from,
-                    "salary_to": salary_to,
-                    "salary_currency": salary_currency,
-                    "description": v.get("snippet", {}).get("requirement", ""),
-                    "employer": v.get("employer", {}).get("name"),
-                    "experience": v.get("experience", {}).get("name"),
-                    "employment": v.get("employment", {}).get("name")
-                })
+    def _request(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 10,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """
+        GET-запрос через общий пул соединений с повторами при 429/5xx и сетевых ошибках.
+        Каждая попытка расходует лимит запросов и ждет разрешения ограничителя частоты
+        :param params: Параметры запроса
+        :param timeout: Таймаут запроса в секундах
+        :param headers: Дополнительные заголовки запроса
+        :return: Ответ сервера (последний, если повторы исчерпаны)
+        """
+        host_limit = self._host_limit(urlsplit(self.__base_url).netloc)
 
+        attempt = 0
+        while True:
+            if self.__budget is not None:
+                self.__budget.spend()
+            started = time.monotonic()
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.acquire()
+            try:
+                with host_limit:
+                    sent = time.monotonic()
+                    try:
+                        response = self.__session.get(
+                            self.__base_url, params=params, headers=headers, timeout=timeout
+                        )
+                    finally:
+                        self._record(
+                            requests=1, retries=1 if attempt else 0,
+                            wait_time=sent - started, io_time=time.monotonic() - sent
+                        )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.__max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+            else:
+                if response.status_code not in self.__retry_statuses or attempt >= self.__max_retries:
+                    return response
+                retry_after = self._retry_after(response)
+                delay = retry_after if retry_after is not None else self._backoff_delay(attempt)
+                response.close()
+
+            # Ждем вне семафора, чтобы не занимать слот хоста
+            time.sleep(delay)
+            self._record(backoff_time=delay)
+            attempt += 1
+
+    def _host_limit(self, host: str) -> threading.BoundedSemaphore:
+        """Семафор, ограничивающий число одновременных запросов к хосту"""
+        with self.__host_limits_lock:
+            if host not in self.__host_limits:
+                self.__host_limits[host] = threading.BoundedSemaphore(self.__per_host_limit)
+            return self.__host_limits[host]
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Экспоненциальная задержка со случайным разбросом (full jitter)"""
+        return random.uniform(0, min(self.__max_backoff, self.__backoff_factor * 2 ** attempt))
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Разбор заголовка Retry-After
+        :param response: Ответ сервера
+        :return: Задержка в секундах или None, если заголовок отсутствует или некорректен
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    @staticmethod
+    def _parse_vacancies(vacancies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Преобразование вакансий из формата hh.ru в формат приложения
+        :param vacancies: Список вакансий из ответа API
+        :return: Список словарей с данными о вакансиях
+        """
+        result = []
+
+        for v in vacancies:
+            salary = v.get("salary")
+            if salary:
+                salary_from = salary.get('from')
+                salary_to = salary.get('to')
+                salary_currency = salary.get('currency', 'RUR')
+            else:
+                salary_from = salary_to = salary_currency = None
+
+            result.append({
+                "id": v.get("id"),
+                "name": v.get("name"),
+                "url": v.get("alternate_url"),
+                "salary_from": salary_from,
+                "salary_to": salary_to,
+                "salary_currency": salary_currency,
+                "description": v.get("snippet", {}).get("requirement", ""),
+                "employer": v.get("employer", {}).get("name"),
+                "experience": v.get("experience", {}).get("name"),
+                "employment": v.get("employment", {}).get("name")
+            })
+
+        return result
+
+
+class AsyncHeadHunterAPI(AsyncJobAPI):
+    """Асинхронный клиент API hh.ru для одновременной загрузки множества запросов и страниц"""
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        rate_limit: Optional[float] = None,
+        burst: int = 1,
+        client: Optional[HeadHunterAPI] = None,
+        **client_kwargs: Any
+    ):
+        """
+        Инициализация асинхронного клиента
+        :param max_concurrency: Глобальный предел одновременно выполняемых запросов
+        :param rate_limit: Допустимое количество запросов в секунду (None - без ограничения)
+        :param burst: Количество запросов, выполняемых подряд без ожидания
+        :param client: Синхронный клиент, выполняющий HTTP-запросы (по умолчанию создается новый).
+            Ограничение частоты и лимит запросов задаются в нем самом
+        :param client_kwargs: Параметры для создаваемого HeadHunterAPI
+        """
+        if client is not None and rate_limit:
+            raise ValueError("Для переданного client ограничение частоты задается при его создании")
+        if client is None:
+            client_kwargs.setdefault('pool_size', max_concurrency)
+            client = HeadHunterAPI(rate_limit=rate_limit, burst=burst, **client_kwargs)
+        # Ограничитель частоты живет в синхронном клиенте: каждая попытка запроса, включая повторы,
+        # ждет его ровно один раз, в каком бы потоке или задаче она ни выполнялась
+        self._client = client
+        self._max_concurrency = max_concurrency
+        # В зависимостях проекта нет асинхронного HTTP-клиента, поэтому запросы к пулу соединений
+        # выполняются в пуле потоков, размер которого совпадает с глобальным пределом
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> 'AsyncHeadHunterAPI':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Освобождение пула потоков и соединений"""
+        self._executor.shutdown(wait=False)
+        self._client.close()
+
+    @property
+    def client(self) -> HeadHunterAPI:
+        """Синхронный клиент (ограничитель частоты, статистика запросов)"""
+        return self._client
+
+    async def connect(self) -> None:
+        """Проверка доступности API hh.ru"""
+        await self._run(self._client.connect)
+
+    async def get_vacancies(self, search_query: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Получение списка вакансий по поисковому запросу
+        :param search_query: Поисковый запрос
+        :param kwargs: Дополнительные параметры запроса (как у HeadHunterAPI.get_vacancies)
+        :return: Список словарей с данными о вакансиях
+        """
+        params = self._client._build_params(search_query, **kwargs)
+        first_page = await self._run(self._client._fetch_page, params)
+        result = self._client._parse_vacancies(first_page.get("items", []))
+
+        if not kwargs.get('fetch_all'):
             return result
 
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"Ошибка при получении вакансий: {str(e)}")
+        pages = self._client._count_pages(first_page, params["per_page"], kwargs.get('max_pages'))
+        # gather возвращает результаты в порядке переданных задач, то есть в порядке страниц
+        pages_data = await asyncio.gather(
+            *(self._run(self._client._fetch_page, {**params, "page": page}) for page in range(1, pages))
+        )
+        for page_data in pages_data:
+            result.extend(self._client._parse_vacancies(page_data.get("items", [])))
+
+        return result
+
+    async def get_vacancies_many(
+        self, search_queries: Iterable[str], **kwargs: Any
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Одновременная загрузка вакансий по нескольким поисковым запросам
+        :param search_queries: Поисковые запросы
+        :param kwargs: Параметры, общие для всех запросов
+        :return: Словарь "запрос: список вакансий"
+        """
+        queries = list(dict.fromkeys(search_queries))
+        results = await asyncio.gather(*(self.get_vacancies(query, **kwargs) for query in queries))
+        return dict(zip(queries, results))
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Глобальный семафор для текущего цикла событий"""
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            # Семафоры завершившихся циклов больше не нужны
+            self._semaphores = {
+                known: semaphore for known, semaphore in self._semaphores.items() if not known.is_closed()
+            }
+            self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphores[loop]
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Выполнение блокирующего запроса с учетом глобального предела
+        :param func: Вызываемая функция
+        :param args: Аргументы функции
+        :return: Результат функции
+        """
+        async with self._semaphore():
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
@@ -0,0 +1,325 @@
+import math
+import re
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from .storage import Storage
+from .utils import get_salary_bounds, get_search_text, parse_salary_range
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Нормализация текста для поиска: нижний регистр без учета особых случаев и замена "ё" на "е"
+    :param text: Исходный текст
+    :return: Нормализованный текст
+    """
+    return text.casefold().replace('ё', 'е')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Разбиение текста на нормализованные слова (буквы любых алфавитов, цифры и "_")
+    :param text: Исходный текст
+    :return: Список слов
+    """
+    return _TOKEN_RE.findall(normalize_text(text))
+
+
+class KeywordIndex:
+    """Инвертированный индекс слов вакансий для поиска по ключевым словам"""
+
+    def __init__(self, vacancies: Iterable[Dict[str, Any]] = ()) -> None:
+        """
+        Построение индекса
+        :param vacancies: Вакансии для индексации
+        """
+        self._postings: Dict[str, Set[int]] = {}  # Слово -> номера вакансий
+        self._vacancies: Dict[int, Dict[str, Any]] = {}  # Номер -> вакансия
+        self._tokens: Dict[int, Set[str]] = {}  # Номер -> слова вакансии
+        self._keys: Dict[Any, int] = {}  # Ключ вакансии (id или url) -> номер
+        self._next_seq = 0
+
+        for vacancy in vacancies:
+            self.add(vacancy)
+
+    @classmethod
+    def from_storage(cls, storage: Storage) -> 'KeywordIndex':
+        """
+        Построение индекса по всем вакансиям хранилища (чтение потоком)
+        :param storage: Хранилище вакансий
+        :return: Индекс
+        """
+        return cls(storage.iter_vacancies())
+
+    def __len__(self) -> int:
+        return len(self._vacancies)
+
+    @staticmethod
+    def _key(vacancy: Dict[str, Any]) -> Any:
+        """Ключ вакансии в индексе: id, а при его отсутствии URL"""
+        return vacancy.get('id') or vacancy.get('url')
+
+    def add(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Добавление вакансии в индекс (вакансия с тем же ключом заменяется)
+        :param vacancy: Словарь с данными о вакансии
+        """
+        key = self._key(vacancy)
+        if key is not None and key in self._keys:
+            self.remove(key)
+
+        seq = self._next_seq
+        self._next_seq += 1
+        tokens = set(tokenize(get_search_text(vacancy)))
+
+        self._vacancies[seq] = vacancy
+        self._tokens[seq] = tokens
+        if key is not None:
+            self._keys[key] = seq
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(seq)
+
+    def remove(self, key: Any) -> None:
+        """
+        Удаление вакансии из индекса
+        :param key: ID (или URL) вакансии
+        """
+        if key not in self._keys:
+            raise ValueError(f"Вакансия {key} отсутствует в индексе")
+
+        seq = self._keys.pop(key)
+        del self._vacancies[seq]
+        for token in self._tokens.pop(seq):
+            postings = self._postings[token]
+            postings.discard(seq)
+            if not postings:
+                del self._postings[token]
+
+    def search(self, words: Iterable[str], mode: str = 'and', substring: bool = False) -> List[Dict[str, Any]]:
+        """
+        Поиск вакансий по ключевым словам
+        :param words: Ключевые слова
+        :param mode: 'and' - все слова должны встречаться, 'or' - хотя бы одно
+        :param substring: Совместимый с filter_vacancies режим: слово ищется как подстрока текста,
+            а не как целое слово
+        :return: Список вакансий в порядке добавления в индекс
+        """
+        if mode not in ('and', 'or'):
+            raise ValueError("Режим поиска должен быть 'and' или 'or'")
+
+        words = [word for word in words if word]
+        if not words:
+            return list(self._vacancies.values())
+
+        matches = [self._match_word(word, substring) for word in words]
+        if mode == 'and':
+            matches.sort(key=len)
+            found = matches[0].intersection(*matches[1:])
+        else:
+            found = set().union(*matches)
+
+        return [self._vacancies[seq] for seq in sorted(found)]
+
+    def _match_word(self, word: str, substring: bool) -> Set[int]:
+        """Номера вакансий, содержащих слово"""
+        tokens = tokenize(word)
+
+        if not substring:
+            # Составное слово ("web-разработчик") требует всех своих частей
+            if not tokens:
+                return set()
+            postings = sorted((self._postings.get(token, set()) for token in tokens), key=len)
+            return postings[0].intersection(*postings[1:])
+
+        # Кандидаты: вакансии, в словах которых есть каждая часть искомой подстроки
+        candidates = set(self._vacancies)
+        for token in tokens:
+            containing: Set[int] = set()
+            for indexed_token, token_postings in self._postings.items():
+                if token in indexed_token:
+                    containing |= token_postings
+            candidates &= containing
+
+        # Окончательная проверка - та же, что в filter_vacancies
+        word = word.lower()
+        return {seq for seq in candidates if word in get_search_text(self._vacancies[seq])}
+
+
+class SalaryIndex:
+    """
+    Индекс зарплатных вилок для запросов пересечения с диапазоном.
+    Вакансии упорядочены по нижней границе зарплаты, над верхними границами строится
+    дерево отрезков с максимумами: запрос выполняется за O(log n + k) для k найденных вакансий.
+    Удаление - точечное обновление дерева за O(log n); новые вакансии попадают в буфер
+    размером O(√n), который просматривается при запросах и переносится в дерево при заполнении
+    """
+
+    _MIN_BUFFER = 64  # Минимальный размер буфера изменений до перестроения дерева
+    _LEAF_BLOCK = 16  # Размер поддерева, листья которого просматриваются подряд
+
+    def __init__(self, vacancies: Iterable[Dict[str, Any]] = ()) -> None:
+        """
+        Построение индекса
+        :param vacancies: Вакансии для индексации
+        """
+        self._order: List[Tuple[float, int]] = []  # (нижняя граница, номер) по возрастанию, в дереве
+        self._positions: Dict[int, int] = {}  # Номер -> позиция в _order для вакансий в дереве
+        self._pending: Dict[int, Tuple[float, float]] = {}  # Номер -> (от, до) для вакансий вне дерева
+        self._removed = 0  # Удаленные позиции дерева, ожидающие перестроения
+        self._vacancies: Dict[int, Dict[str, Any]] = {}  # Номер -> вакансия
+        self._keys: Dict[Any, int] = {}  # Ключ вакансии (id или url) -> номер
+        self._next_seq = 0
+        self._tree: List[float] = []
+        self._tree_size = 1
+
+        # Начальное построение одной сортировкой, а не вставками по одной
+        for vacancy in vacancies:
+            self._insert(vacancy)
+        self._rebuild()
+
+    @classmethod
+    def from_storage(cls, storage: Storage) -> 'SalaryIndex':
+        """
+        Построение индекса по всем вакансиям хранилища (чтение потоком)
+        :param storage: Хранилище вакансий
+        :return: Индекс
+        """
+        return cls(storage.iter_vacancies())
+
+    def __len__(self) -> int:
+        return len(self._vacancies)
+
+    @staticmethod
+    def _key(vacancy: Dict[str, Any]) -> Any:
+        """Ключ вакансии в индексе: id, а при его отсутствии URL"""
+        return vacancy.get('id') or vacancy.get('url')
+
+    def _insert(self, vacancy: Dict[str, Any]) -> None:
+        """Добавление вакансии в буфер (вакансия с тем же ключом удаляется)"""
+        key = self._key(vacancy)
+        if key is not None and key in self._keys:
+            self._delete(self._keys.pop(key))
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self._vacancies[seq] = vacancy
+        self._pending[seq] = get_salary_bounds(vacancy)
+        if key is not None:
+            self._keys[key] = seq
+
+    def _delete(self, seq: int) -> None:
+        """Удаление вакансии: из буфера или точечным обновлением дерева"""
+        del self._vacancies[seq]
+        if self._pending.pop(seq, None) is not None:
+            return
+
+        # Лист удаленной вакансии не проходит ни одну проверку max >= min_salary
+        node = self._tree_size + self._positions.pop(seq)
+        self._tree[node] = float('-inf')
+        node //= 2
+        while node:
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+            node //= 2
+        self._removed += 1
+
+    def _maybe_rebuild(self) -> None:
+        """Перестроение дерева, когда буфер изменений превысил O(√n)"""
+        if len(self._pending) + self._removed > max(self._MIN_BUFFER, math.isqrt(len(self._vacancies))):
+            self._rebuild()
+
+    def add(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Добавление вакансии в индекс (вакансия с тем же ключом заменяется)
+        :param vacancy: Словарь с данными о вакансии
+        """
+        self._insert(vacancy)
+        self._maybe_rebuild()
+
+    def remove(self, key: Any) -> None:
+        """
+        Удаление вакансии из индекса
+        :param key: ID (или URL) вакансии
+        """
+        if key not in self._keys:
+            raise ValueError(f"Вакансия {key} отсутствует в индексе")
+
+        self._delete(self._keys.pop(key))
+        self._maybe_rebuild()
+
+    def _rebuild(self) -> None:
+        """Построение дерева отрезков с максимумами верхних границ по всем вакансиям индекса"""
+        highs = {seq: self._tree[self._tree_size + position] for seq, position in self._positions.items()}
+        highs.update((seq, high) for seq, (_, high) in self._pending.items())
+        # Уже упорядоченная часть и буфер сливаются одной сортировкой (timsort использует готовые серии)
+        entries = [entry for entry in self._order if entry[1] in self._positions]
+        entries.extend((low, seq) for seq, (low, _) in self._pending.items())
+        entries.sort()
+
+        size = 1
+        while size < len(entries):
+            size *= 2
+        tree = [float('-inf')] * (2 * size)
+        tree[size:size + len(entries)] = [highs[seq] for _, seq in entries]
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+
+        self._order = entries
+        self._positions = {seq: position for position, (_, seq) in enumerate(entries)}
+        self._pending = {}
+        self._removed = 0
+        self._tree = tree
+        self._tree_size = size
+
+    def overlapping(self, min_salary: float, max_salary: float) -> List[Dict[str, Any]]:
+        """
+        Вакансии, зарплатная вилка которых пересекается с диапазоном
+        :param min_salary: Нижняя граница диапазона
+        :param max_salary: Верхняя граница диапазона
+        :return: Список вакансий в порядке добавления в индекс
+        """
+        # Нижняя граница вилки не больше max_salary - это префикс упорядоченного списка
+        limit = bisect_right(self._order, (max_salary, float('inf')))
+        size = self._tree_size
+        found = []
+
+        tree = self._tree
+        order = self._order
+        positions = self._positions
+
+        # Спуск по дереву только в поддеревья префикса с верхней границей не меньше min_salary
+        stack = [(1, 0, size)]
+        while stack:
+            node, start, end = stack.pop()
+            if start >= limit or tree[node] < min_salary:
+                continue
+            if end - start <= self._LEAF_BLOCK:
+                # Небольшое поддерево дешевле просмотреть по листьям, чем спускаться до каждого
+                for position in range(start, min(end, limit)):
+                    if tree[size + position] >= min_salary:
+                        seq = order[position][1]
+                        if seq in positions:
+                            found.append(seq)
+                continue
+            middle = (start + end) // 2
+            stack.append((2 * node + 1, middle, end))
+            stack.append((2 * node, start, middle))
+
+        # Вакансии, еще не перенесенные в дерево
+        found.extend(
+            seq for seq, (low, high) in self._pending.items() if low <= max_salary and high >= min_salary
+        )
+
+        return [self._vacancies[seq] for seq in sorted(found)]
+
+    def search(self, salary_range: str) -> List[Dict[str, Any]]:
+        """
+        Фильтрация по диапазону зарплат с той же семантикой, что у get_vacancies_by_salary
+        :param salary_range: Строка с диапазоном зарплат в формате "min-max"
+        :return: Список вакансий в порядке добавления в индекс
+        """
+        bounds = parse_salary_range(salary_range)
+        if bounds is None:
+            return list(self._vacancies.values())
+        return self.overlapping(*bounds)
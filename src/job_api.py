@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
@@ -24,3 +25,51 @@ class JobAPI(ABC):
         :return: Список словарей с данными о вакансиях
         """
         pass
+
+
+class AsyncJobAPI(ABC):
+    """Абстрактный класс для асинхронной работы с API сервисов с вакансиями"""
+
+    @abstractmethod
+    def __init__(self) -> None:
+        """Инициализация класса для работы с API"""
+        pass
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Подключение к API"""
+        pass
+
+    @abstractmethod
+    async def get_vacancies(self, search_query: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Получение списка вакансий по поисковому запросу
+        :param search_query: Поисковый запрос
+        :param kwargs: Дополнительные параметры запроса
+        :return: Список словарей с данными о вакансиях
+        """
+        pass
+
+
+class SyncJobAPI(JobAPI):
+    """Синхронный фасад над AsyncJobAPI для кода, не использующего asyncio"""
+
+    def __init__(self, api: AsyncJobAPI) -> None:
+        """
+        Инициализация фасада
+        :param api: Асинхронный источник вакансий
+        """
+        self._api = api
+
+    def connect(self) -> None:
+        """Подключение к API"""
+        asyncio.run(self._api.connect())
+
+    def get_vacancies(self, search_query: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Получение списка вакансий по поисковому запросу
+        :param search_query: Поисковый запрос
+        :param kwargs: Дополнительные параметры запроса
+        :return: Список словарей с данными о вакансиях
+        """
+        return asyncio.run(self._api.get_vacancies(search_query, **kwargs))
@@ -1,9 +1,51 @@
 from typing import Any, Dict, Optional
 
 
+def format_salary(salary_from: Optional[float], salary_to: Optional[float], currency: Optional[str]) -> str:
+    """
+    Форматирование зарплатной вилки
+    :param salary_from: Зарплата "от"
+    :param salary_to: Зарплата "до"
+    :param currency: Код валюты
+    :return: Строка вида "100 000 - 150 000 RUR", "от 100 000 RUR", "до 150 000 RUR" или "Зарплата не указана"
+    """
+    if salary_from is not None and salary_to is not None:
+        return f"{salary_from:,} - {salary_to:,} {currency or ''}".replace(',', ' ')
+    elif salary_from is not None:
+        return f"от {salary_from:,} {currency or ''}".replace(',', ' ')
+    elif salary_to is not None:
+        return f"до {salary_to:,} {currency or ''}".replace(',', ' ')
+    return "Зарплата не указана"
+
+
+def format_vacancy(vacancy: Dict[str, Any]) -> str:
+    """
+    Текстовое представление вакансии из словаря (без создания Vacancy и без валидации)
+    :param vacancy: Словарь с данными о вакансии
+    :return: Многострочный текст, завершающийся разделителем
+    """
+    salary = format_salary(vacancy.get('salary_from'), vacancy.get('salary_to'), vacancy.get('salary_currency'))
+    return (
+        f"{vacancy.get('name') or ''}\n"
+        f"Зарплата: {salary}\n"
+        f"Компания: {vacancy.get('employer') or 'Не указано'}\n"
+        f"Требования: {vacancy.get('description') or 'Не указаны'}\n"
+        f"Опыт: {vacancy.get('experience') or 'Не указан'}\n"
+        f"Тип занятости: {vacancy.get('employment') or 'Не указан'}\n"
+        f"Ссылка: {vacancy.get('url') or ''}\n"
+        + "-" * 50
+    )
+
+
 class Vacancy:
     """Класс для представления вакансии"""
 
+    # Без __dict__ у каждого экземпляра: меньше памяти и быстрее доступ к атрибутам
+    __slots__ = (
+        'name', 'url', 'salary_from', 'salary_to', 'salary_currency',
+        'description', 'employer', 'experience', 'employment', 'id'
+    )
+
     def __init__(
         self,
         name: str,
@@ -14,7 +56,8 @@ class Vacancy:
         description: str = "",
         employer: Optional[str] = None,
         experience: Optional[str] = None,
-        employment: Optional[str] = None
+        employment: Optional[str] = None,
+        vacancy_id: Optional[str] = None
     ):
         self.name = name
         self.url = url
@@ -25,6 +68,8 @@ class Vacancy:
         self.employer = employer
         self.experience = experience
         self.employment = employment
+        # ID вакансии в источнике (например, на hh.ru) - первичный ключ в хранилищах
+        self.id = vacancy_id
 
         # Валидация данных при инициализации
         self._validate_salary()
@@ -58,13 +103,7 @@ class Vacancy:
     @property
     def salary(self) -> str:
         """Возвращает отформатированную строку с зарплатой"""
-        if self.salary_from is not None and self.salary_to is not None:
-            return f"{self.salary_from:,} - {self.salary_to:,} {self.salary_currency or ''}".replace(',', ' ')
-        elif self.salary_from is not None:
-            return f"от {self.salary_from:,} {self.salary_currency or ''}".replace(',', ' ')
-        elif self.salary_to is not None:
-            return f"до {self.salary_to:,} {self.salary_currency or ''}".replace(',', ' ')
-        return "Зарплата не указана"
+        return format_salary(self.salary_from, self.salary_to, self.salary_currency)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Vacancy':
@@ -78,9 +117,29 @@ class Vacancy:
             description=data.get('description', ''),
             employer=data.get('employer'),
             experience=data.get('experience'),
-            employment=data.get('employment')
+            employment=data.get('employment'),
+            vacancy_id=data.get('id')
         )
 
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> 'Vacancy':
+        """
+        Создает экземпляр Vacancy из словаря без валидации.
+        Только для данных, уже проверенных при сохранении (например, прочитанных из хранилища)
+        """
+        vacancy = cls.__new__(cls)
+        vacancy.name = data.get('name', '')
+        vacancy.url = data.get('url', '')
+        vacancy.salary_from = data.get('salary_from')
+        vacancy.salary_to = data.get('salary_to')
+        vacancy.salary_currency = data.get('salary_currency')
+        vacancy.description = data.get('description', '')
+        vacancy.employer = data.get('employer')
+        vacancy.experience = data.get('experience')
+        vacancy.employment = data.get('employment')
+        vacancy.id = data.get('id')
+        return vacancy
+
     def to_dict(self) -> Dict[str, Any]:
         """Возвращает словарь с данными вакансии"""
         return {
@@ -92,18 +151,10 @@ class Vacancy:
             'description': self.description,
             'employer': self.employer,
             'experience': self.experience,
-            'employment': self.employment
+            'employment': self.employment,
+            'id': self.id
         }
 
     def __str__(self) -> str:
         """Строковое представление вакансии"""
-        return (
-            f"{self.name}\n"
-            f"Зарплата: {self.salary}\n"
-            f"Компания: {self.employer or 'Не указано'}\n"
-            f"Требования: {self.description or 'Не указаны'}\n"
-            f"Опыт: {self.experience or 'Не указан'}\n"
-            f"Тип занятости: {self.employment or 'Не указан'}\n"
-            f"Ссылка: {self.url}\n"
-            "-" * 50
-        )
+        return format_vacancy(self.to_dict())
@@ -0,0 +1,191 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .currency import RateTable
+from .job_api import JobAPI
+from .utils import filter_vacancies, parse_salary_range, salary_overlaps
+
+# Справочники hh.ru: идентификатор значения и его название в вакансиях
+EXPERIENCE = {
+    'noExperience': 'Нет опыта',
+    'between1And3': 'От 1 года до 3 лет',
+    'between3And6': 'От 3 до 6 лет',
+    'moreThan6': 'Более 6 лет',
+}
+EMPLOYMENT = {
+    'full': 'Полная занятость',
+    'part': 'Частичная занятость',
+    'project': 'Проектная работа',
+    'volunteer': 'Волонтерство',
+    'probation': 'Стажировка',
+}
+
+
+def _dictionary_ids(values: Union[None, str, Sequence[str]], dictionary: Mapping[str, str], title: str) -> List[str]:
+    """
+    Приведение значений справочника к идентификаторам hh.ru
+    :param values: Идентификатор, название или их список
+    :param dictionary: Справочник (идентификатор: название)
+    :param title: Название справочника для сообщения об ошибке
+    :return: Список идентификаторов
+    """
+    if values is None:
+        return []
+    if isinstance(values, str):
+        values = [values]
+
+    names = {name.lower(): key for key, name in dictionary.items()}
+    ids = []
+    for value in values:
+        key = value if value in dictionary else names.get(value.strip().lower())
+        if key is None:
+            raise ValueError(f"Неизвестное значение справочника '{title}': {value}")
+        ids.append(key)
+    return ids
+
+
+class QueryPlan:
+    """
+    План выполнения запроса: параметры, передаваемые API, и фильтры, применяемые к ответу локально
+    """
+
+    def __init__(
+        self,
+        search_query: str,
+        params: Dict[str, Any],
+        keywords: Sequence[str],
+        salary_range: Optional[Tuple[int, int]],
+        rates: Optional[RateTable] = None
+    ) -> None:
+        """
+        Инициализация
+        :param search_query: Поисковый запрос для API
+        :param params: Параметры запроса для get_vacancies
+        :param keywords: Ключевые слова, проверяемые локально
+        :param salary_range: Диапазон зарплат (min, max) в базовой валюте, проверяемый локально
+        :param rates: Курсы для пересчета зарплат в базовую валюту перед локальной проверкой
+        """
+        self.search_query = search_query
+        self.params = params
+        self.keywords = list(keywords)
+        self.salary_range = salary_range
+        self.rates = rates
+
+    @property
+    def local_filters(self) -> List[str]:
+        """Названия фильтров, применяемых локально"""
+        filters = []
+        if self.keywords:
+            filters.append('keywords')
+        if self.salary_range is not None:
+            filters.append('salary_range')
+        return filters
+
+    def apply(self, vacancies: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Применение локальных фильтров к ответу API
+        :param vacancies: Список или итератор вакансий
+        :return: Вакансии, прошедшие фильтры (с зарплатой в базовой валюте, если заданы курсы)
+        """
+        if self.rates is not None:
+            # Диапазон зарплат сравнивается с зарплатой в базовой валюте, а не в валюте вакансии
+            vacancies = self.rates.normalize_all(vacancies)
+        filtered = filter_vacancies(vacancies, self.keywords)
+        if self.salary_range is None:
+            return filtered
+
+        min_salary, max_salary = self.salary_range
+        return [vacancy for vacancy in filtered if salary_overlaps(vacancy, min_salary, max_salary)]
+
+    def fetch(self, job_api: JobAPI, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Выполнение запроса
+        :param job_api: Источник вакансий
+        :param kwargs: Дополнительные параметры запроса (per_page, fetch_all и т.п.)
+        :return: Вакансии, отобранные API и локальными фильтрами
+        """
+        return self.apply(job_api.get_vacancies(self.search_query, **{**kwargs, **self.params}))
+
+
+class VacancyQuery:
+    """
+    Поисковый запрос с фильтрами. Фильтры, которые API hh.ru выполняет с тем же результатом
+    (регион, опыт, тип занятости, наличие зарплаты), передаются в запрос; остальные применяются локально
+    """
+
+    def __init__(
+        self,
+        text: str,
+        keywords: Optional[Sequence[str]] = None,
+        salary_range: Union[None, str, Tuple[int, int]] = None,
+        experience: Union[None, str, Sequence[str]] = None,
+        employment: Union[None, str, Sequence[str]] = None,
+        area: Optional[int] = None,
+        only_with_salary: bool = False,
+        exact: bool = True,
+        rates: Optional[RateTable] = None
+    ) -> None:
+        """
+        Инициализация
+        :param text: Поисковый запрос
+        :param keywords: Ключевые слова, которые должны быть в вакансии (как в filter_vacancies)
+        :param salary_range: Диапазон зарплат: строка "min-max" или пара (min, max)
+        :param experience: Опыт работы: идентификатор или название из EXPERIENCE (одно или список)
+        :param employment: Тип занятости: идентификатор или название из EMPLOYMENT (одно или список)
+        :param area: Код региона hh.ru (по умолчанию - регион источника)
+        :param only_with_salary: Только вакансии с указанной зарплатой
+        :param exact: Передавать в API только фильтры с точно таким же результатом.
+            Если False, в API передаются также зарплата и ключевые слова; API отбрасывает больше
+            вакансий на своей стороне, но его отбор по ним приблизительный и может пропустить
+            часть подходящих вакансий. Локальная проверка этих фильтров сохраняется
+        :param rates: Курсы валют: зарплаты ответа пересчитываются в базовую валюту до проверки диапазона
+            (без курсов сравниваются исходные суммы)
+        """
+        if not text or not text.strip():
+            raise ValueError("Поисковый запрос не может быть пустым")
+        if isinstance(salary_range, str):
+            salary_range = parse_salary_range(salary_range)
+            if salary_range is None:
+                raise ValueError("Диапазон зарплат должен быть в формате min-max")
+
+        self.text = text.strip()
+        self.keywords = list(keywords or [])
+        self.salary_range = salary_range
+        self.experience = _dictionary_ids(experience, EXPERIENCE, 'опыт работы')
+        self.employment = _dictionary_ids(employment, EMPLOYMENT, 'тип занятости')
+        self.area = area
+        self.only_with_salary = only_with_salary
+        self.exact = exact
+        self.rates = rates
+
+    def plan(self) -> QueryPlan:
+        """
+        Разделение фильтров между API и локальной обработкой
+        :return: План запроса
+        """
+        params: Dict[str, Any] = {'only_with_salary': self.only_with_salary}
+        if self.area is not None:
+            params['area'] = self.area
+        if self.experience:
+            params['experience'] = self.experience
+        if self.employment:
+            params['employment'] = self.employment
+
+        search_query = self.text
+        if not self.exact:
+            # Приблизительный отбор API только сокращает загрузку, результат проверяется локально
+            if self.keywords:
+                search_query = ' '.join([self.text, *self.keywords])
+            if self.salary_range is not None:
+                params['salary'] = self.salary_range[0]
+                params['currency'] = self.rates.base if self.rates is not None else 'RUR'
+
+        return QueryPlan(search_query, params, self.keywords, self.salary_range, self.rates)
+
+    def fetch(self, job_api: JobAPI, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Выполнение запроса по плану (см. plan)
+        :param job_api: Источник вакансий
+        :param kwargs: Дополнительные параметры запроса (per_page, fetch_all и т.п.)
+        :return: Вакансии, отобранные API и локальными фильтрами
+        """
+        return self.plan().fetch(job_api, **kwargs)
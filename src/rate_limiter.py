@@ -0,0 +1,91 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты запросов по алгоритму token bucket, общий для потоков.
+    Асинхронный клиент выполняет запросы в потоках исполнителя и использует тот же ограничитель
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Инициализация ограничителя
+        :param rate: Допустимое количество запросов в секунду
+        :param burst: Максимальное количество запросов, выполняемых без ожидания подряд
+        """
+        if rate <= 0:
+            raise ValueError("Частота запросов должна быть положительной")
+        if burst < 1:
+            raise ValueError("Размер пачки запросов должен быть не меньше 1")
+        self._rate = rate
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Резервирование токена
+        :return: Время в секундах, которое нужно подождать перед запросом
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # Отрицательный остаток означает очередь уже зарезервированных запросов
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> float:
+        """
+        Блокирующее ожидание разрешения на запрос
+        :return: Время ожидания в секундах
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class RequestBudgetExceeded(ConnectionError):
+    """Исчерпан лимит запросов на запуск (см. RequestBudget)"""
+
+
+class RequestBudget:
+    """Ограничение общего количества запросов за один запуск, общее для потоков"""
+
+    def __init__(self, limit: int) -> None:
+        """
+        Инициализация
+        :param limit: Допустимое количество запросов
+        """
+        if limit < 0:
+            raise ValueError("Лимит запросов не может быть отрицательным")
+        self.limit = limit
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def used(self) -> int:
+        """Количество израсходованных запросов"""
+        return self._used
+
+    @property
+    def remaining(self) -> int:
+        """Количество оставшихся запросов"""
+        return self.limit - self._used
+
+    def spend(self) -> None:
+        """Списание одного запроса (RequestBudgetExceeded, если лимит исчерпан)"""
+        with self._lock:
+            if self._used >= self.limit:
+                raise RequestBudgetExceeded(f"Исчерпан лимит запросов: {self.limit}")
+            self._used += 1
+
+    def reset(self) -> None:
+        """Начало нового запуска с полным лимитом"""
+        with self._lock:
+            self._used = 0
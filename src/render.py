@@ -0,0 +1,202 @@
+import sys
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from .models import format_salary, format_vacancy
+
+# Ширина столбцов компактной таблицы: номер, название, зарплата, работодатель
+_ROW_FORMAT = "{:>5}  {:<40.40}  {:>26.26}  {:<30.30}"
+
+
+def format_vacancy_block(vacancy: Dict[str, Any], number: int) -> str:
+    """
+    Подробный блок вакансии с заголовком-номером (формат print_vacancies)
+    :param vacancy: Словарь с данными о вакансии
+    :param number: Порядковый номер вакансии
+    :return: Текст блока с переводом строки в конце
+    """
+    return f"\nВакансия #{number}\n{'-' * 50}\n{format_vacancy(vacancy)}\n"
+
+
+def format_vacancy_row(vacancy: Dict[str, Any], number: int) -> str:
+    """
+    Компактная строка таблицы: номер, название, зарплата и работодатель
+    :param vacancy: Словарь с данными о вакансии
+    :param number: Порядковый номер вакансии
+    :return: Строка таблицы с переводом строки в конце
+    """
+    salary = format_salary(vacancy.get('salary_from'), vacancy.get('salary_to'), vacancy.get('salary_currency'))
+    return _ROW_FORMAT.format(number, vacancy.get('name') or '', salary, vacancy.get('employer') or '') + "\n"
+
+
+def table_header() -> str:
+    """Заголовок компактной таблицы"""
+    return _ROW_FORMAT.format('№', 'Вакансия', 'Зарплата', 'Компания') + "\n"
+
+
+def render_vacancies(
+    vacancies: Iterable[Dict[str, Any]],
+    file: Optional[TextIO] = None,
+    compact: bool = False,
+    start: int = 1,
+    chunk_size: int = 100
+) -> int:
+    """
+    Вывод вакансий блоками: текст накапливается и записывается одним вызовом на chunk_size вакансий
+    :param vacancies: Список или итератор вакансий (словари выводятся без создания Vacancy)
+    :param file: Поток вывода (по умолчанию sys.stdout)
+    :param compact: Вывод одной строкой таблицы на вакансию
+    :param start: Номер первой вакансии
+    :param chunk_size: Количество вакансий в одной записи
+    :return: Количество выведенных вакансий
+    """
+    file = file if file is not None else sys.stdout
+    formatter = format_vacancy_row if compact else format_vacancy_block
+
+    count = 0
+    chunk: List[str] = [table_header()] if compact else []
+    for count, vacancy in enumerate(vacancies, 1):
+        chunk.append(formatter(vacancy, start + count - 1))
+        if len(chunk) >= chunk_size:
+            file.write(''.join(chunk))
+            chunk = []
+
+    if count:
+        file.write(''.join(chunk))
+        file.flush()
+    return count
+
+
+class PagedViewer:
+    """
+    Постраничный просмотр вакансий. Вакансии берутся из итератора только до текущей
+    страницы включительно, а выводится только видимая страница
+    """
+
+    def __init__(
+        self,
+        vacancies: Iterable[Dict[str, Any]],
+        page_size: int = 10,
+        compact: bool = False,
+        file: Optional[TextIO] = None
+    ) -> None:
+        """
+        Инициализация
+        :param vacancies: Список или итератор вакансий
+        :param page_size: Количество вакансий на странице
+        :param compact: Вывод одной строкой таблицы на вакансию
+        :param file: Поток вывода (по умолчанию sys.stdout)
+        """
+        if page_size <= 0:
+            raise ValueError("Размер страницы должен быть положительным")
+
+        self._source: Iterator[Dict[str, Any]] = iter(vacancies)
+        self._loaded: List[Dict[str, Any]] = []
+        self._exhausted = False
+        self.page_size = page_size
+        self.compact = compact
+        self.page = 0
+        self._file = file
+
+    def _load(self, count: int) -> None:
+        """Чтение вакансий из источника, пока их меньше count"""
+        if self._exhausted or len(self._loaded) >= count:
+            return
+        self._loaded.extend(islice(self._source, count - len(self._loaded)))
+        if len(self._loaded) < count:
+            self._exhausted = True
+
+    def _has_page(self, page: int) -> bool:
+        """Есть ли вакансии на странице (номер с нуля)"""
+        self._load((page + 1) * self.page_size)
+        return page == 0 or len(self._loaded) > page * self.page_size
+
+    @property
+    def total(self) -> Optional[int]:
+        """Общее количество вакансий (None, пока источник не прочитан до конца)"""
+        return len(self._loaded) if self._exhausted else None
+
+    def visible(self) -> List[Dict[str, Any]]:
+        """Вакансии текущей страницы"""
+        self._load((self.page + 1) * self.page_size)
+        start = self.page * self.page_size
+        return self._loaded[start:start + self.page_size]
+
+    def show(self) -> int:
+        """
+        Вывод текущей страницы
+        :return: Количество выведенных вакансий
+        """
+        file = self._file if self._file is not None else sys.stdout
+        vacancies = self.visible()
+        if not vacancies:
+            file.write("Вакансии не найдены.\n")
+            return 0
+
+        start = self.page * self.page_size + 1
+        total = self.total
+        file.write(
+            f"\nСтраница {self.page + 1}: вакансии {start}-{start + len(vacancies) - 1}"
+            f" из {total if total is not None else 'не менее ' + str(len(self._loaded))}\n"
+        )
+        return render_vacancies(vacancies, file=file, compact=self.compact, start=start)
+
+    def next(self) -> bool:
+        """
+        Переход на следующую страницу
+        :return: Выполнен ли переход (False на последней странице)
+        """
+        if not self._has_page(self.page + 1):
+            return False
+        self.page += 1
+        return True
+
+    def prev(self) -> bool:
+        """
+        Переход на предыдущую страницу
+        :return: Выполнен ли переход (False на первой странице)
+        """
+        if self.page == 0:
+            return False
+        self.page -= 1
+        return True
+
+    def jump(self, page: int) -> bool:
+        """
+        Переход на страницу по номеру (с единицы)
+        :param page: Номер страницы
+        :return: Выполнен ли переход (False, если такой страницы нет)
+        """
+        if page < 1 or not self._has_page(page - 1):
+            return False
+        self.page = page - 1
+        return True
+
+    def run(self, input_func: Callable[[str], str] = input) -> None:
+        """
+        Интерактивный просмотр: Enter или n - следующая страница, p - предыдущая,
+        номер - переход на страницу, q - выход
+        :param input_func: Функция чтения команды пользователя
+        """
+        file = self._file if self._file is not None else sys.stdout
+        if not self.show():
+            return
+
+        while True:
+            command = input_func("\n[Enter/n] далее, [p] назад, [номер] страница, [q] выход: ").strip().lower()
+            if command == 'q':
+                return
+            if command in ('', 'n'):
+                moved = self.next()
+            elif command == 'p':
+                moved = self.prev()
+            elif command.isdigit():
+                moved = self.jump(int(command))
+            else:
+                file.write("Неизвестная команда.\n")
+                continue
+
+            if not moved:
+                file.write("Такой страницы нет.\n")
+                continue
+            self.show()
@@ -0,0 +1,82 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .currency import SALARY_FROM_BASE, SALARY_TO_BASE, RateTable
+from .utils import get_salary_sort_key
+
+# Порядок значений опыта работы в справочнике hh.ru
+EXPERIENCE_ORDER = {
+    'Нет опыта': 0,
+    'От 1 года до 3 лет': 1,
+    'От 3 до 6 лет': 2,
+    'Более 6 лет': 3,
+}
+
+
+def _text_key(value: Any) -> str:
+    """Ключ для сравнения текста без учета регистра (пустое значение - в начале)"""
+    return str(value).casefold() if value is not None else ''
+
+
+def _salary_key(vacancy: Dict[str, Any], rates: Optional[RateTable]) -> float:
+    """Зарплата для сортировки в базовой валюте (см. RateTable.normalize)"""
+    if rates is None or SALARY_FROM_BASE in vacancy or SALARY_TO_BASE in vacancy:
+        # Зарплата уже пересчитана при загрузке или курсы не заданы
+        return get_salary_sort_key(vacancy)
+    return get_salary_sort_key(rates.normalize(vacancy))
+
+
+SORT_KEYS: Dict[str, Callable[[Dict[str, Any], Optional[RateTable]], Any]] = {
+    'salary': _salary_key,
+    'employer': lambda vacancy, rates: _text_key(vacancy.get('employer')),
+    'experience': lambda vacancy, rates: EXPERIENCE_ORDER.get(vacancy.get('experience') or '', -1),
+    'name': lambda vacancy, rates: _text_key(vacancy.get('name')),
+}
+
+
+class VacancySorter:
+    """
+    Сортировка одного набора вакансий по составным ключам.
+    Значения ключей вычисляются один раз на вакансию и хранятся столбцами,
+    поэтому повторные сортировки в другом порядке не извлекают их заново
+    """
+
+    def __init__(self, vacancies: Iterable[Dict[str, Any]], rates: Optional[RateTable] = None) -> None:
+        """
+        Инициализация
+        :param vacancies: Вакансии для сортировки
+        :param rates: Таблица курсов для вакансий без зарплаты в базовой валюте;
+            валюты без курса не пересчитываются
+        """
+        self._vacancies = list(vacancies)
+        self._rates = rates
+        self._columns: Dict[str, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._vacancies)
+
+    def column(self, field: str) -> List[Any]:
+        """
+        Столбец значений ключа сортировки (вычисляется при первом обращении)
+        :param field: Название ключа (salary, employer, experience, name)
+        :return: Значения ключа в порядке вакансий
+        """
+        if field not in self._columns:
+            if field not in SORT_KEYS:
+                raise ValueError(f"Неизвестный ключ сортировки: {field}")
+            key = SORT_KEYS[field]
+            self._columns[field] = [key(vacancy, self._rates) for vacancy in self._vacancies]
+        return self._columns[field]
+
+    def sort(self, *fields: str) -> List[Dict[str, Any]]:
+        """
+        Сортировка по нескольким ключам
+        :param fields: Ключи в порядке приоритета; префикс "-" означает убывание
+            (например, sort('-salary', 'employer'))
+        :return: Отсортированный список вакансий; при равенстве всех ключей сохраняется исходный порядок
+        """
+        order = list(range(len(self._vacancies)))
+        # Устойчивая сортировка от младшего ключа к старшему
+        for spec in reversed(fields):
+            field = spec[1:] if spec.startswith('-') else spec
+            order.sort(key=self.column(field).__getitem__, reverse=spec.startswith('-'))
+        return [self._vacancies[i] for i in order]
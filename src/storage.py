@@ -1,40 +1,331 @@
+import hashlib
 import json
+import os
+import sqlite3
+import stat
+import tempfile
+import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from types import ModuleType
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+from .currency import SALARY_FROM_BASE, SALARY_TO_BASE, RateTable
 from .models import Vacancy
 
+fcntl: Optional[ModuleType]
+try:
+    import fcntl
+except ImportError:  # Windows: рекомендательные блокировки fcntl недоступны
+    fcntl = None
+
+
+@contextmanager
+def file_lock(filename: str) -> Iterator[None]:
+    """
+    Эксклюзивная рекомендательная блокировка на время чтения-изменения-записи файла.
+    Блокируется отдельный файл filename + '.lock', поэтому чтение основного файла не ждет писателей.
+    Без fcntl (Windows) блокировка не выполняется
+    :param filename: Имя защищаемого файла
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(filename + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Сброс на диск записи каталога, чтобы переименование файла пережило сбой питания"""
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(filename: str, write: Callable[[IO[Any]], None], mode: str = 'w') -> None:
+    """
+    Запись файла целиком через временный файл в том же каталоге, fsync и атомарную замену:
+    после сбоя на диске остается либо прежняя, либо новая версия файла
+    :param filename: Имя файла
+    :param write: Функция, записывающая содержимое в открытый временный файл
+    :param mode: Режим открытия временного файла ('w' - текст в UTF-8, 'wb' - двоичный)
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temp_filename = tempfile.mkstemp(dir=directory, prefix=os.path.basename(filename) + '.', suffix='.tmp')
+    try:
+        try:
+            # Новая версия получает права доступа прежней
+            os.chmod(temp_filename, stat.S_IMODE(os.stat(filename).st_mode))
+        except FileNotFoundError:
+            pass
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else 'utf-8') as temp_file:
+            write(temp_file)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_filename, filename)
+    except BaseException:
+        try:
+            os.unlink(temp_filename)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def iter_json_array(file: IO[str], chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Потоковый разбор JSON-массива: элементы читаются по одному, файл - блоками
+    :param file: Открытый текстовый файл с JSON-массивом
+    :param chunk_size: Размер читаемого блока в символах
+    :return: Итератор по элементам массива (при ошибке формата чтение прекращается)
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+
+    def skip_whitespace() -> bool:
+        """Пропуск пробелов с дочитыванием файла; False, если файл закончился"""
+        nonlocal buffer, position, eof
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            if position < len(buffer):
+                return True
+            if eof:
+                return False
+            # Отбрасываем разобранную часть буфера
+            buffer = buffer[position:] + file.read(chunk_size)
+            position = 0
+            eof = len(buffer) == 0
+
+    if not skip_whitespace() or buffer[position] != '[':
+        return
+    position += 1
+
+    if not skip_whitespace():
+        return
+    if buffer[position] == ']':
+        return
+
+    while True:
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+            # Значение в конце буфера может оказаться неполным (например, число)
+            complete = end < len(buffer) or eof
+        except json.JSONDecodeError:
+            complete = False
+            if eof:
+                return
+
+        if not complete:
+            chunk = file.read(chunk_size)
+            buffer = buffer[position:] + chunk
+            position = 0
+            eof = not chunk
+            continue
+
+        yield item
+        position = end
+
+        if not skip_whitespace():
+            return
+        if buffer[position] == ']':
+            return
+        if buffer[position] != ',':
+            return
+        position += 1
+        if not skip_whitespace():
+            return
+
+
+def content_hash(vacancy: Dict[str, Any]) -> str:
+    """
+    Хеш содержимого вакансии для обнаружения изменений при повторной загрузке.
+    Пустые поля не учитываются, а целые числа с плавающей точкой приводятся к int,
+    поэтому одна и та же вакансия, прочитанная из любого хранилища, дает один хеш
+    :param vacancy: Словарь с данными о вакансии
+    :return: Шестнадцатеричная строка хеша
+    """
+    canonical = {
+        key: int(value) if isinstance(value, float) and value.is_integer() else value
+        for key, value in vacancy.items() if value is not None
+    }
+    data = json.dumps(canonical, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 
 class Storage(ABC):
     """Абстрактный класс для работы с хранилищем данных"""
 
+    # Курсы валют для пересчета зарплат при загрузке (см. RateTable.normalize)
+    _rates: Optional[RateTable] = None
+
     @abstractmethod
     def add_vacancy(self, vacancy: Vacancy) -> None:
         """Добавление вакансии в хранилище"""
         pass
 
+    def add_vacancies(self, vacancies: Iterable[Union[Vacancy, Dict[str, Any]]]) -> Dict[str, int]:
+        """
+        Добавление пачки вакансий за одну запись.
+        Вакансия с уже сохраненным ID (первичный ключ) обновляется, а не добавляется повторно;
+        вакансия с URL, который занят вакансией с другим ID, считается дубликатом
+        (кроме вакансии с ID, присвоенным хранилищем: она обновляется и получает ID источника, см. _takes_over)
+        :param vacancies: Вакансии (объекты Vacancy или словари)
+        :return: Количество добавленных, обновленных, пропущенных дубликатов и некорректных записей
+        """
+        prepared, invalid = self._prepare_batch(vacancies)
+        counts = self._merge(prepared, skip_unchanged=False)
+        return {
+            'inserted': counts['inserted'],
+            'updated': counts['updated'],
+            'duplicates': counts['duplicates'],
+            'invalid': invalid
+        }
+
+    def upsert_vacancies(self, vacancies: Iterable[Union[Vacancy, Dict[str, Any]]]) -> Dict[str, int]:
+        """
+        Добавление и обновление вакансий при повторной загрузке: сохраненная вакансия перезаписывается,
+        только если изменилось ее содержимое (см. content_hash), поэтому объем записи
+        пропорционален числу изменений, а не размеру выборки
+        :param vacancies: Вакансии (объекты Vacancy или словари)
+        :return: Количество добавленных, обновленных, неизменившихся вакансий,
+            пропущенных дубликатов и некорректных записей
+        """
+        prepared, invalid = self._prepare_batch(vacancies)
+        counts = self._merge(prepared, skip_unchanged=True)
+        counts['invalid'] = invalid
+        return counts
+
+    @abstractmethod
+    def _merge(self, prepared: List[Dict[str, Any]], skip_unchanged: bool) -> Dict[str, int]:
+        """
+        Запись подготовленных вакансий с обновлением по ID
+        :param prepared: Словари вакансий из _prepare_batch
+        :param skip_unchanged: Не перезаписывать вакансии с неизменившимся содержимым
+        :return: Количество добавленных (inserted), обновленных (updated), неизменившихся (unchanged)
+            вакансий и пропущенных дубликатов (duplicates)
+        """
+        pass
+
     @abstractmethod
     def get_vacancies(self, **criteria) -> List[Dict[str, Any]]:
         """Получение списка вакансий по критериям"""
         pass
 
+    @abstractmethod
+    def iter_vacancies(self, **criteria: Any) -> Iterator[Dict[str, Any]]:
+        """Последовательное чтение вакансий по критериям без загрузки всего хранилища в память"""
+        pass
+
+    def iter_vacancy_objects(self, **criteria: Any) -> Iterator[Vacancy]:
+        """
+        Последовательное чтение вакансий в виде объектов Vacancy. Записи проверены при сохранении
+        (см. _prepare_batch), поэтому объекты создаются без повторной валидации (from_trusted_dict)
+        :param criteria: Критерии отбора, как в iter_vacancies
+        :return: Итератор по вакансиям
+        """
+        for record in self.iter_vacancies(**criteria):
+            yield Vacancy.from_trusted_dict(record)
+
     @abstractmethod
     def delete_vacancy(self, vacancy_id: str) -> None:
         """Удаление вакансии по ID"""
         pass
 
+    def _prepare_batch(
+        self, vacancies: Iterable[Union[Vacancy, Dict[str, Any]]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Проверка пачки вакансий и преобразование в словари с ID
+        (и с зарплатой в базовой валюте, если хранилищу заданы курсы)
+        :param vacancies: Вакансии (объекты Vacancy или словари)
+        :return: Список словарей корректных вакансий и количество некорректных
+        """
+        prepared = []
+        invalid = 0
+        for vacancy in vacancies:
+            try:
+                if isinstance(vacancy, dict):
+                    vacancy = Vacancy.from_dict(vacancy)
+                elif not isinstance(vacancy, Vacancy):
+                    raise ValueError("Можно добавлять только объекты класса Vacancy")
+            except ValueError:
+                invalid += 1
+                continue
+
+            vacancy_dict = vacancy.to_dict()
+            if not vacancy_dict.get('id'):
+                vacancy_dict['id'] = str(uuid.uuid4())
+            if self._rates is not None:
+                vacancy_dict = self._rates.normalize(vacancy_dict)
+            prepared.append(vacancy_dict)
+
+        return prepared, invalid
+
+    @staticmethod
+    def _takes_over(owner_id: Any, vacancy_id: Any) -> bool:
+        """
+        Может ли вакансия с ID источника заменить сохраненную вакансию с тем же URL.
+        Заменяется только вакансия с ID, присвоенным хранилищем (uuid4 из _prepare_batch):
+        в файлах старого формата вакансии hh.ru сохранены с такими ID
+        :param owner_id: ID сохраненной вакансии, которой принадлежит URL
+        :param vacancy_id: ID добавляемой вакансии
+        :return: True, если сохраненная вакансия обновляется с переходом на ID источника
+        """
+        def generated(value: Any) -> bool:
+            try:
+                return isinstance(value, str) and str(uuid.UUID(value)) == value
+            except ValueError:
+                return False
+
+        return owner_id != vacancy_id and generated(owner_id) and not generated(vacancy_id)
+
+    @staticmethod
+    def _matches(vacancy: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
+        """Проверка соответствия вакансии всем критериям (поле: значение)"""
+        for key, value in criteria.items():
+            if key not in vacancy or vacancy[key] != value:
+                return False
+        return True
+
 
 class JSONStorage(Storage):
     """Класс для работы с JSON-файлом"""
 
-    def __init__(self, filename: str = 'vacancies.json'):
+    def __init__(self, filename: str = 'vacancies.json', indexed_fields: Optional[Iterable[str]] = None,
+                 rates: Optional[RateTable] = None):
         """
         Инициализация хранилища
         :param filename: Имя файла для хранения данных
+        :param indexed_fields: Поля, по которым строятся хеш-индексы в памяти
+            (например, employer, experience, employment, salary_currency, url).
+            Если заданы, вакансии держатся в памяти и перечитываются только при изменении файла
+        :param rates: Курсы валют для пересчета зарплат в базовую валюту при добавлении
         """
         self._filename = filename
+        self._rates = rates
         self._ensure_file_exists()
 
+        self._indexes: Dict[str, Dict[Any, Set[int]]] = {field: {} for field in indexed_fields or ()}
+        # Записи с нехешируемым значением поля проверяются при каждом запросе
+        self._unindexed: Dict[str, Set[int]] = {field: set() for field in self._indexes}
+        self._records: Dict[int, Dict[str, Any]] = {}  # Порядковый номер -> вакансия
+        self._ids: Dict[Any, int] = {}  # ID -> порядковый номер
+        self._urls: Dict[Any, Any] = {}  # URL -> ID
+        self._next_seq = 0
+        self._signature: Optional[Tuple[int, int, int]] = None
+
     def _ensure_file_exists(self) -> None:
         """Проверяет существование файла и создает его при необходимости"""
         try:
@@ -55,27 +346,182 @@ class JSONStorage(Storage):
             return []
 
     def _write_file(self, data: List[Dict[str, Any]]) -> None:
-        """Запись данных в файл"""
-        with open(self._filename, 'w', encoding='utf-8') as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
+        """Запись данных в файл (атомарная замена; вызывается под file_lock)"""
+        try:
+            atomic_write(self._filename, lambda file: json.dump(data, file, ensure_ascii=False, indent=4))
+        except BaseException:
+            # Вакансии в памяти уже изменены: при следующем обращении файл перечитывается
+            self._signature = None
+            raise
+        if self._indexes:
+            self._signature = self._file_signature()
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Inode, время изменения и размер файла для обнаружения изменений другими процессами"""
+        try:
+            file_stat = os.stat(self._filename)
+        except FileNotFoundError:
+            return None
+        # Каждая запись заменяет файл новым, поэтому inode меняется даже при совпадении времени и размера
+        return file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size
+
+    def _ensure_loaded(self, force: bool = False) -> None:
+        """
+        Загрузка вакансий и построение индексов, если файл изменился с прошлой загрузки
+        :param force: Перечитать файл в любом случае
+        """
+        signature = self._file_signature()
+        if not force and signature is not None and signature == self._signature:
+            return
+
+        self._records = {}
+        self._ids = {}
+        self._urls = {}
+        for field in self._indexes:
+            self._indexes[field] = {}
+            self._unindexed[field] = set()
+        for vacancy in self._read_file():
+            self._cache_add(vacancy)
+        self._signature = signature
+
+    def _release(self) -> None:
+        """Освобождение памяти после записи, если хранилище работает без индексов"""
+        if not self._indexes:
+            self._records = {}
+            self._ids = {}
+            self._urls = {}
+            self._signature = None
+
+    def _index(self, seq: int) -> None:
+        """Добавление вакансии с номером seq в индексы"""
+        vacancy = self._records[seq]
+        self._ids[vacancy.get('id')] = seq
+        self._urls[vacancy.get('url')] = vacancy.get('id')
+        for field, index in self._indexes.items():
+            if field not in vacancy:
+                continue
+            try:
+                index.setdefault(vacancy[field], set()).add(seq)
+            except TypeError:
+                self._unindexed[field].add(seq)
+
+    def _unindex(self, seq: int) -> None:
+        """Удаление вакансии с номером seq из индексов"""
+        vacancy = self._records[seq]
+        if self._ids.get(vacancy.get('id')) == seq:
+            del self._ids[vacancy.get('id')]
+        if self._urls.get(vacancy.get('url')) == vacancy.get('id'):
+            del self._urls[vacancy.get('url')]
+        for field, index in self._indexes.items():
+            if field not in vacancy:
+                continue
+            self._unindexed[field].discard(seq)
+            try:
+                postings = index.get(vacancy[field])
+            except TypeError:
+                continue
+            if postings is not None:
+                postings.discard(seq)
+                if not postings:
+                    del index[vacancy[field]]
+
+    def _cache_add(self, vacancy: Dict[str, Any]) -> None:
+        """Добавление вакансии в память и в индексы"""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._records[seq] = vacancy
+        self._index(seq)
+
+    def _cache_replace(self, seq: int, vacancy: Dict[str, Any]) -> None:
+        """Замена вакансии с сохранением ее места в файле"""
+        self._unindex(seq)
+        self._records[seq] = vacancy
+        self._index(seq)
+
+    def _cache_remove(self, seq: int) -> None:
+        """Удаление вакансии из памяти и из индексов"""
+        self._unindex(seq)
+        del self._records[seq]
+
+    def _lookup(self, criteria: Dict[str, Any]) -> List[int]:
+        """
+        Поиск порядковых номеров вакансий по критериям с использованием индексов
+        :param criteria: Ключевые слова для фильтрации (поле: значение)
+        :return: Номера подходящих вакансий в порядке добавления
+        """
+        postings = []
+        for field, value in criteria.items():
+            if field == 'id':
+                # По ID вакансия находится всегда без перебора
+                try:
+                    postings.append({self._ids[value]} if value in self._ids else set())
+                except TypeError:
+                    pass
+                continue
+            if field not in self._indexes:
+                continue
+            try:
+                postings.append(self._indexes[field].get(value, set()) | self._unindexed[field])
+            except TypeError:
+                # Нехешируемое значение критерия проверяется перебором
+                continue
+
+        if postings:
+            # Пересечение начинаем с самого короткого списка
+            postings.sort(key=len)
+            candidates = sorted(postings[0].intersection(*postings[1:]))
+        else:
+            candidates = list(self._records)
+
+        return [seq for seq in candidates if self._matches(self._records[seq], criteria)]
 
     def add_vacancy(self, vacancy: Vacancy) -> None:
         """Добавление вакансии в файл"""
         if not isinstance(vacancy, Vacancy):
             raise ValueError("Можно добавлять только объекты класса Vacancy")
 
-        vacancies = self._read_file()
-        vacancy_dict = vacancy.to_dict()
+        self.add_vacancies([vacancy])
+
+    def _merge(self, prepared: List[Dict[str, Any]], skip_unchanged: bool) -> Dict[str, int]:
+        """
+        Запись вакансий: одно чтение и одна запись файла под блокировкой (файл не перезаписывается,
+        если ничего не изменилось). Обновленная вакансия остается на своем месте
+        :param prepared: Словари вакансий из _prepare_batch
+        :param skip_unchanged: Не перезаписывать вакансии с неизменившимся содержимым
+        :return: Количество добавленных, обновленных, неизменившихся вакансий и дубликатов
+        """
+        counts = dict.fromkeys(('inserted', 'updated', 'unchanged', 'duplicates'), 0)
+        with file_lock(self._filename):
+            self._ensure_loaded(force=not self._indexes)
+            try:
+                for vacancy_dict in prepared:
+                    vacancy_id = vacancy_dict['id']
+                    owner_id = self._urls.get(vacancy_dict['url'], vacancy_id)
+                    seq = self._ids.get(vacancy_id)
+                    if owner_id != vacancy_id:
+                        if seq is None and self._takes_over(owner_id, vacancy_id):
+                            # Вакансия с ID хранилища обновляется на месте и получает ID источника
+                            self._cache_replace(self._ids[owner_id], vacancy_dict)
+                            counts['updated'] += 1
+                        else:
+                            # URL, занятый другой вакансией, - дубликат
+                            counts['duplicates'] += 1
+                        continue
+                    if seq is None:
+                        self._cache_add(vacancy_dict)
+                        counts['inserted'] += 1
+                    elif skip_unchanged and content_hash(self._records[seq]) == content_hash(vacancy_dict):
+                        counts['unchanged'] += 1
+                    else:
+                        self._cache_replace(seq, vacancy_dict)
+                        counts['updated'] += 1
 
-        # Генерируем ID, если его нет
-        if 'id' not in vacancy_dict:
-            import uuid
-            vacancy_dict['id'] = str(uuid.uuid4())
+                if counts['inserted'] or counts['updated']:
+                    self._write_file(list(self._records.values()))
+            finally:
+                self._release()
 
-        # Проверка на дубликаты по URL
-        if not any(v.get('url') == vacancy.url for v in vacancies):
-            vacancies.append(vacancy_dict)
-            self._write_file(vacancies)
+        return counts
 
     def get_vacancies(self, **criteria: Any) -> List[Dict[str, Any]]:
         """
@@ -83,33 +529,526 @@ class JSONStorage(Storage):
         :param criteria: Ключевые слова для фильтрации (поле: значение)
         :return: Список словарей с данными о вакансиях
         """
+        if self._indexes:
+            self._ensure_loaded()
+            # Копии: изменение результата не должно затрагивать кеш и индексы
+            return [dict(self._records[seq]) for seq in self._lookup(criteria)]
+
         vacancies = self._read_file()
 
         if not criteria:
             return vacancies
 
-        filtered_vacancies = []
-        for vacancy in vacancies:
-            match = True
-            for key, value in criteria.items():
-                if key not in vacancy or vacancy[key] != value:
-                    match = False
-                    break
-            if match:
-                filtered_vacancies.append(vacancy)
+        return [vacancy for vacancy in vacancies if self._matches(vacancy, criteria)]
 
-        return filtered_vacancies
+    def iter_vacancies(self, **criteria: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Потоковое чтение вакансий по критериям без загрузки всего файла в память
+        :param criteria: Ключевые слова для фильтрации (поле: значение)
+        :return: Итератор по словарям с данными о вакансиях
+        """
+        if self._indexes:
+            yield from self.get_vacancies(**criteria)
+            return
+
+        try:
+            with open(self._filename, 'r', encoding='utf-8') as file:
+                for vacancy in iter_json_array(file):
+                    if isinstance(vacancy, dict) and self._matches(vacancy, criteria):
+                        yield vacancy
+        except FileNotFoundError:
+            return
 
     def delete_vacancy(self, vacancy_id: str) -> None:
         """
         Удаление вакансии по ID
         :param vacancy_id: ID вакансии для удаления
         """
-        vacancies = self._read_file()
-        initial_count = len(vacancies)
-        vacancies = [v for v in vacancies if v.get('id') != vacancy_id]
+        with file_lock(self._filename):
+            self._ensure_loaded(force=not self._indexes)
+            try:
+                seq = self._ids.get(vacancy_id)
+                if seq is None:
+                    raise ValueError(f"Вакансия с ID {vacancy_id} не найдена")
+                self._cache_remove(seq)
+                self._write_file(list(self._records.values()))
+            finally:
+                self._release()
 
-        if len(vacancies) < initial_count:
-            self._write_file(vacancies)
-        else:
+
+class SQLiteStorage(Storage):
+    """Класс для работы с базой данных SQLite (режим WAL, уникальные индексы по id и url)"""
+
+    _fields = (
+        'id', 'name', 'url', 'salary_from', 'salary_to', 'salary_currency',
+        'description', 'employer', 'experience', 'employment', SALARY_FROM_BASE, SALARY_TO_BASE
+    )
+    # Признак пересчета зарплаты при загрузке: NULL в столбцах с пересчитанной зарплатой
+    # означает и "не пересчитывалась", и "валюта без курса"
+    _normalized_field = 'salary_normalized'
+
+    def __init__(self, filename: str = 'vacancies.db', rates: Optional[RateTable] = None):
+        """
+        Инициализация хранилища
+        :param filename: Имя файла базы данных
+        :param rates: Курсы валют для пересчета зарплат в базовую валюту при добавлении
+        """
+        self._filename = filename
+        self._rates = rates
+        try:
+            self._connection = sqlite3.connect(filename)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema()
+        except sqlite3.Error as e:
+            raise IOError(f"Ошибка при работе с базой данных {self._filename}: {e}")
+
+    def __enter__(self) -> 'SQLiteStorage':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрытие соединения с базой данных"""
+        self._connection.close()
+
+    def _create_schema(self) -> None:
+        """Создает таблицу и индексы, если их нет"""
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS vacancies (
+                    id TEXT NOT NULL,
+                    name TEXT,
+                    url TEXT NOT NULL,
+                    salary_from NUMERIC,
+                    salary_to NUMERIC,
+                    salary_currency TEXT,
+                    description TEXT,
+                    employer TEXT,
+                    experience TEXT,
+                    employment TEXT,
+                    salary_from_base NUMERIC,
+                    salary_to_base NUMERIC,
+                    salary_normalized INTEGER
+                )
+                """
+            )
+            # Базы, созданные до появления столбцов с пересчитанной зарплатой
+            columns = {row['name'] for row in self._connection.execute("PRAGMA table_info(vacancies)")}
+            for column, column_type in (
+                (SALARY_FROM_BASE, 'NUMERIC'), (SALARY_TO_BASE, 'NUMERIC'), (self._normalized_field, 'INTEGER')
+            ):
+                if column not in columns:
+                    self._connection.execute(f"ALTER TABLE vacancies ADD COLUMN {column} {column_type}")
+            self._connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_vacancies_id ON vacancies (id)")
+            self._connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_vacancies_url ON vacancies (url)")
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """Добавление вакансии в базу данных (вакансия с тем же ID обновляется)"""
+        if not isinstance(vacancy, Vacancy):
+            raise ValueError("Можно добавлять только объекты класса Vacancy")
+
+        self.add_vacancies([vacancy])
+
+    def _merge(self, prepared: List[Dict[str, Any]], skip_unchanged: bool) -> Dict[str, int]:
+        """
+        Запись вакансий в одной транзакции
+        :param prepared: Словари вакансий из _prepare_batch
+        :param skip_unchanged: Не перезаписывать вакансии с неизменившимся содержимым
+        :return: Количество добавленных, обновленных, неизменившихся вакансий и дубликатов
+        """
+        columns = ', '.join(self._fields)
+        stored_fields = self._fields + (self._normalized_field,)
+        placeholders = ', '.join('?' for _ in stored_fields)
+        update_fields = [field for field in stored_fields if field != 'id']
+        assignments = ', '.join(f"{field} = ?" for field in update_fields)
+        counts = dict.fromkeys(('inserted', 'updated', 'unchanged', 'duplicates'), 0)
+        with self._connection:
+            for vacancy_dict in prepared:
+                if skip_unchanged:
+                    row = self._connection.execute(
+                        f"SELECT {columns} FROM vacancies WHERE id = ?", (vacancy_dict['id'],)
+                    ).fetchone()
+                    if row is not None and content_hash(dict(row)) == content_hash(vacancy_dict):
+                        counts['unchanged'] += 1
+                        continue
+
+                vacancy_dict = {
+                    **vacancy_dict,
+                    self._normalized_field: int(SALARY_FROM_BASE in vacancy_dict or SALARY_TO_BASE in vacancy_dict)
+                }
+                # Обновление по первичному ключу; при URL, занятом другой вакансией, строка не меняется
+                cursor = self._connection.execute(
+                    f"UPDATE OR IGNORE vacancies SET {assignments} WHERE id = ?",
+                    [vacancy_dict.get(field) for field in update_fields] + [vacancy_dict['id']]
+                )
+                if cursor.rowcount:
+                    counts['updated'] += 1
+                    continue
+                cursor = self._connection.execute(
+                    f"INSERT OR IGNORE INTO vacancies ({', '.join(stored_fields)}) VALUES ({placeholders})",
+                    [vacancy_dict.get(field) for field in stored_fields]
+                )
+                if cursor.rowcount:
+                    counts['inserted'] += 1
+                    continue
+
+                # URL занят другой вакансией: вакансия с ID хранилища получает ID источника
+                # (при уже сохраненном ID источника обновление не выполняется), иначе это дубликат
+                owner = self._connection.execute(
+                    "SELECT id FROM vacancies WHERE url = ?", (vacancy_dict['url'],)
+                ).fetchone()
+                if owner is not None and self._takes_over(owner['id'], vacancy_dict['id']):
+                    cursor = self._connection.execute(
+                        f"UPDATE OR IGNORE vacancies SET id = ?, {assignments} WHERE id = ?",
+                        [vacancy_dict['id']] + [vacancy_dict.get(field) for field in update_fields] + [owner['id']]
+                    )
+                    if cursor.rowcount:
+                        counts['updated'] += 1
+                        continue
+                counts['duplicates'] += 1
+
+        return counts
+
+    def get_vacancies(self, **criteria: Any) -> List[Dict[str, Any]]:
+        """
+        Получение списка вакансий по критериям
+        :param criteria: Ключевые слова для фильтрации (поле: значение)
+        :return: Список словарей с данными о вакансиях
+        """
+        return list(self.iter_vacancies(**criteria))
+
+    def iter_vacancies(self, **criteria: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Чтение вакансий по критериям курсором, без загрузки всей выборки в память
+        :param criteria: Ключевые слова для фильтрации (поле: значение)
+        :return: Итератор по словарям с данными о вакансиях
+        """
+        # Поля, которых нет в таблице, не совпадают ни с одной вакансией
+        if any(key not in self._fields for key in criteria):
+            return
+
+        query = f"SELECT {', '.join(self._fields + (self._normalized_field,))} FROM vacancies"
+        if criteria:
+            query += " WHERE " + " AND ".join(f"{key} IS ?" for key in criteria)
+        query += " ORDER BY rowid"
+
+        for row in self._connection.execute(query, list(criteria.values())):
+            vacancy = dict(row)
+            normalized = vacancy.pop(self._normalized_field)
+            # Пересчитанная зарплата возвращается только для пересчитанных вакансий
+            # (в базах без признака - если она есть)
+            if not normalized and vacancy[SALARY_FROM_BASE] is None and vacancy[SALARY_TO_BASE] is None:
+                del vacancy[SALARY_FROM_BASE], vacancy[SALARY_TO_BASE]
+            yield vacancy
+
+    def delete_vacancy(self, vacancy_id: str) -> None:
+        """
+        Удаление вакансии по ID
+        :param vacancy_id: ID вакансии для удаления
+        """
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM vacancies WHERE id = ?", (vacancy_id,))
+
+        if cursor.rowcount == 0:
             raise ValueError(f"Вакансия с ID {vacancy_id} не найдена")
+
+
+class JSONLinesStorage(Storage):
+    """
+    Класс для работы с файлом JSON Lines, в который изменения только дописываются:
+    добавление - строка с вакансией, удаление - строка-отметка об удалении.
+    Файл может использоваться несколькими процессами: запись выполняется под file_lock,
+    а строки, дописанные другими процессами, учитываются в индексе перед каждой операцией
+    """
+
+    def __init__(self, filename: str = 'vacancies.jsonl', compact_threshold: float = 0.5,
+                 compact_min_lines: int = 1000, rates: Optional[RateTable] = None):
+        """
+        Инициализация хранилища
+        :param filename: Имя файла для хранения данных
+        :param compact_threshold: Доля устаревших строк, при которой файл сжимается автоматически
+        :param compact_min_lines: Минимальное число устаревших строк для автоматического сжатия
+        :param rates: Курсы валют для пересчета зарплат в базовую валюту при добавлении
+        """
+        self._filename = filename
+        self._rates = rates
+        self._compact_threshold = compact_threshold
+        self._compact_min_lines = compact_min_lines
+        self._offsets: Dict[str, int] = {}  # ID -> смещение актуальной строки
+        self._urls: Dict[str, str] = {}  # URL -> ID
+        self._id_urls: Dict[str, str] = {}  # ID -> URL
+        self._hashes: Dict[str, str] = {}  # ID -> хеш содержимого актуальной версии
+        self._garbage = 0  # Количество устаревших строк
+        self._ends_with_newline = True
+        self._inode: Optional[int] = None  # Inode проиндексированного файла (меняется при сжатии)
+        self._size = 0  # Размер проиндексированной части файла
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Построение индекса актуальных строк за один проход по файлу"""
+        self._inode = None
+        try:
+            with open(self._filename, 'a+b') as file:
+                self._refresh(file)
+        except IOError as e:
+            raise IOError(f"Ошибка при работе с файлом {self._filename}: {e}")
+
+    def _refresh(self, file: IO[bytes], complete_only: bool = False) -> None:
+        """
+        Учет изменений файла с момента последнего обращения: дописанные строки добавляются в индекс,
+        а после замены файла (сжатия другим процессом) индекс строится заново
+        :param file: Открытый файл хранилища
+        :param complete_only: Не учитывать последнюю строку без перевода строки (ее может дописывать
+            другой процесс; при чтении без блокировки)
+        """
+        file_stat = os.fstat(file.fileno())
+        if file_stat.st_ino != self._inode or file_stat.st_size < self._size:
+            self._offsets.clear()
+            self._urls.clear()
+            self._id_urls.clear()
+            self._hashes.clear()
+            self._garbage = 0
+            self._ends_with_newline = True
+            self._inode = file_stat.st_ino
+            self._size = 0
+        elif file_stat.st_size == self._size:
+            return
+
+        file.seek(self._size)
+        offset = self._size
+        for line in file:
+            if complete_only and not line.endswith(b'\n'):
+                break
+            self._apply_line(line, offset)
+            offset += len(line)
+            self._ends_with_newline = line.endswith(b'\n')
+        self._size = offset
+
+    @contextmanager
+    def _locked_file(self) -> Iterator[IO[bytes]]:
+        """Файл хранилища, открытый для дописывания под блокировкой, с актуальным индексом"""
+        with file_lock(self._filename):
+            with open(self._filename, 'a+b') as file:
+                self._refresh(file)
+                yield file
+
+    def _apply_line(self, line: bytes, offset: int) -> None:
+        """Учет строки файла в индексе"""
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # Пустая или недописанная строка
+            if line.strip():
+                self._garbage += 1
+            return
+
+        vacancy_id = record.get('id')
+        if vacancy_id in self._offsets:
+            self._garbage += 1
+            self._forget(vacancy_id)
+
+        if record.get('_deleted'):
+            self._garbage += 1
+        else:
+            self._remember(vacancy_id, record.get('url'), offset, content_hash(record))
+
+    def _remember(self, vacancy_id: str, url: str, offset: int, digest: str) -> None:
+        """Добавление актуальной строки в индекс"""
+        self._offsets[vacancy_id] = offset
+        self._urls[url] = vacancy_id
+        self._id_urls[vacancy_id] = url
+        self._hashes[vacancy_id] = digest
+
+    def _forget(self, vacancy_id: str) -> None:
+        """Удаление вакансии из индекса"""
+        del self._offsets[vacancy_id]
+        del self._hashes[vacancy_id]
+        self._urls.pop(self._id_urls.pop(vacancy_id), None)
+
+    @staticmethod
+    def _iter_lines(file: IO[bytes]) -> Iterator[Tuple[int, bytes]]:
+        """Построчное чтение файла с начала со смещениями строк"""
+        file.seek(0)
+        offset = 0
+        for line in file:
+            yield offset, line
+            offset += len(line)
+
+    def _append(self, file: IO[bytes], records: List[Dict[str, Any]]) -> List[int]:
+        """
+        Дописывание записей в конец файла (под блокировкой, см. _locked_file)
+        :param file: Файл, открытый через _locked_file
+        :param records: Записи для добавления
+        :return: Смещения добавленных строк
+        """
+        if not records:
+            return []
+
+        file.seek(0, os.SEEK_END)
+        if not self._ends_with_newline:
+            file.write(b'\n')
+            self._ends_with_newline = True
+        offset = file.tell()
+        offsets = []
+        for record in records:
+            line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+            file.write(line)
+            offsets.append(offset)
+            offset += len(line)
+        file.flush()
+        os.fsync(file.fileno())
+        self._size = offset
+        return offsets
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """Добавление вакансии в конец файла"""
+        if not isinstance(vacancy, Vacancy):
+            raise ValueError("Можно добавлять только объекты класса Vacancy")
+        self.add_vacancies([vacancy])
+
+    def _merge(self, prepared: List[Dict[str, Any]], skip_unchanged: bool) -> Dict[str, int]:
+        """
+        Запись вакансий одной записью в конец файла.
+        Новая версия вакансии с уже сохраненным ID дописывается, а прежняя становится устаревшей
+        :param prepared: Словари вакансий из _prepare_batch
+        :param skip_unchanged: Не дописывать вакансии с неизменившимся содержимым
+        :return: Количество добавленных, обновленных, неизменившихся вакансий и дубликатов
+        """
+        counts = dict.fromkeys(('inserted', 'updated', 'unchanged', 'duplicates'), 0)
+
+        with self._locked_file() as file:
+            batch: Dict[str, Tuple[Dict[str, Any], str]] = {}  # ID -> последняя версия в пачке и ее хеш
+            batch_urls: Dict[str, str] = {}  # URL -> ID
+            taken_over: List[str] = []  # ID хранилища, замененные ID источника
+            for vacancy_dict in prepared:
+                url, vacancy_id = vacancy_dict['url'], vacancy_dict['id']
+                owner_id = batch_urls.get(url, self._urls.get(url, vacancy_id))
+                digest = content_hash(vacancy_dict)
+                known = batch[vacancy_id][1] if vacancy_id in batch else self._hashes.get(vacancy_id)
+                if owner_id != vacancy_id:
+                    if url in batch_urls or known is not None or not self._takes_over(owner_id, vacancy_id):
+                        # URL, занятый другой вакансией, - дубликат
+                        counts['duplicates'] += 1
+                        continue
+                    # Вакансия с ID хранилища удаляется, а ее новая версия дописывается с ID источника
+                    taken_over.append(owner_id)
+                    counts['updated'] += 1
+                elif known is None:
+                    counts['inserted'] += 1
+                elif skip_unchanged and known == digest:
+                    counts['unchanged'] += 1
+                    continue
+                else:
+                    counts['updated'] += 1
+                batch[vacancy_id] = (vacancy_dict, digest)
+                batch_urls[url] = vacancy_id
+
+            records = [{'id': owner_id, '_deleted': True} for owner_id in taken_over]
+            records += [record for record, _ in batch.values()]
+            offsets = self._append(file, records)[len(taken_over):]
+            for owner_id in taken_over:
+                self._forget(owner_id)
+                # Устаревшими становятся и строка вакансии, и отметка об удалении
+                self._garbage += 2
+            for (record, digest), offset in zip(batch.values(), offsets):
+                if record['id'] in self._offsets:
+                    self._forget(record['id'])
+                    self._garbage += 1
+                self._remember(record['id'], record['url'], offset, digest)
+
+        self._maybe_compact()
+        return counts
+
+    def get_vacancies(self, **criteria: Any) -> List[Dict[str, Any]]:
+        """
+        Получение списка вакансий по критериям
+        :param criteria: Ключевые слова для фильтрации (поле: значение)
+        :return: Список словарей с данными о вакансиях
+        """
+        return list(self.iter_vacancies(**criteria))
+
+    def iter_vacancies(self, **criteria: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Построчное чтение вакансий по критериям (без блокировки)
+        :param criteria: Ключевые слова для фильтрации (поле: значение)
+        :return: Итератор по словарям с данными о вакансиях
+        """
+        try:
+            file = open(self._filename, 'rb')
+        except FileNotFoundError:
+            return
+
+        with file:
+            self._refresh(file, complete_only=True)
+            size = self._size
+            # Снимок актуальных строк на момент открытия: сжатие во время обхода меняет индекс
+            # на смещения нового файла, а обход продолжается по открытому старому
+            live = set(self._offsets.values())
+            for offset, line in self._iter_lines(file):
+                if offset >= size:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                # Пропускаем отметки об удалении и устаревшие версии записей
+                if offset not in live:
+                    continue
+                if self._matches(record, criteria):
+                    yield record
+
+    def delete_vacancy(self, vacancy_id: str) -> None:
+        """
+        Удаление вакансии по ID: в файл дописывается отметка об удалении
+        :param vacancy_id: ID вакансии для удаления
+        """
+        with self._locked_file() as file:
+            if vacancy_id not in self._offsets:
+                raise ValueError(f"Вакансия с ID {vacancy_id} не найдена")
+
+            self._append(file, [{'id': vacancy_id, '_deleted': True}])
+            self._forget(vacancy_id)
+            # Устаревшими становятся и строка вакансии, и отметка об удалении
+            self._garbage += 2
+
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Сжатие файла, если устаревших строк накопилось больше заданных порогов"""
+        total_lines = self._garbage + len(self._offsets)
+        if not total_lines:
+            return
+        if self._garbage >= self._compact_min_lines and self._garbage / total_lines >= self._compact_threshold:
+            self.compact()
+
+    def compact(self) -> None:
+        """Перезапись файла только с актуальными вакансиями через временный файл и атомарную замену"""
+        with self._locked_file() as file:
+            offsets: Dict[str, int] = {}
+
+            def write(temp_file: IO[bytes]) -> None:
+                for offset, line in self._iter_lines(file):
+                    if not line.strip():
+                        continue
+                    try:
+                        vacancy_id = json.loads(line).get('id')
+                    except json.JSONDecodeError:
+                        continue
+                    if self._offsets.get(vacancy_id) != offset:
+                        continue
+                    offsets[vacancy_id] = temp_file.tell()
+                    temp_file.write(line if line.endswith(b'\n') else line + b'\n')
+
+            atomic_write(self._filename, write, mode='wb')
+            file_stat = os.stat(self._filename)
+            self._offsets = offsets
+            self._garbage = 0
+            self._ends_with_newline = True
+            self._inode = file_stat.st_ino
+            self._size = file_stat.st_size
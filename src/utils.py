@@ -1,29 +1,40 @@
-import json
-from typing import Any, Dict, List
+import heapq
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from .models import Vacancy
+from .currency import SALARY_FROM_BASE, SALARY_TO_BASE
+from .export import export_vacancies
+from .render import render_vacancies
 
 
-def filter_vacancies(vacancies: List[Dict[str, Any]], filter_words: List[str]) -> List[Dict[str, Any]]:
+def get_search_text(vacancy: Dict[str, Any]) -> str:
+    """
+    Текст вакансии для поиска по ключевым словам
+    :param vacancy: Словарь с данными о вакансии
+    :return: Текстовые поля вакансии в нижнем регистре через пробел
+    """
+    # Объединяем все текстовые поля для поиска
+    return ' '.join([
+        str(vacancy.get('name', '')),
+        str(vacancy.get('description', '')),
+        str(vacancy.get('employer', '')),
+        str(vacancy.get('experience', '')),
+        str(vacancy.get('employment', ''))
+    ]).lower()
+
+
+def filter_vacancies(vacancies: Iterable[Dict[str, Any]], filter_words: List[str]) -> List[Dict[str, Any]]:
     """
     Фильтрация вакансий по ключевым словам
-    :param vacancies: Список вакансий
+    :param vacancies: Список или итератор вакансий
     :param filter_words: Список ключевых слов для фильтрации
     :return: Отфильтрованный список вакансий
     """
     if not filter_words:
-        return vacancies
+        return list(vacancies)
 
     filtered_vacancies = []
     for vacancy in vacancies:
-        # Объединяем все текстовые поля для поиска
-        text_to_search = ' '.join([
-            str(vacancy.get('name', '')),
-            str(vacancy.get('description', '')),
-            str(vacancy.get('employer', '')),
-            str(vacancy.get('experience', '')),
-            str(vacancy.get('employment', ''))
-        ]).lower()
+        text_to_search = get_search_text(vacancy)
 
         # Проверяем, содержатся ли все ключевые слова в тексте
         if all(word.lower() in text_to_search for word in filter_words):
@@ -32,54 +43,118 @@ def filter_vacancies(vacancies: List[Dict[str, Any]], filter_words: List[str]) -
     return filtered_vacancies
 
 
-def get_vacancies_by_salary(vacancies: List[Dict[str, Any]], salary_range: str) -> List[Dict[str, Any]]:
+def parse_salary_range(salary_range: str) -> Optional[Tuple[int, int]]:
     """
-    Фильтрация вакансий по диапазону зарплат
-    :param vacancies: Список вакансий
+    Разбор диапазона зарплат
     :param salary_range: Строка с диапазоном зарплат в формате "min-max"
-    :return: Отфильтрованный список вакансий
+    :return: Пара (min, max) или None, если диапазон не задан или некорректен
     """
     if not salary_range:
-        return vacancies
+        return None
 
     try:
         # Парсим диапазон зарплат
         salary_parts = salary_range.split('-')
         if len(salary_parts) != 2:
-            return vacancies
+            return None
 
         min_salary, max_salary = map(int, salary_parts)
     except (ValueError, IndexError):
-        return vacancies
+        return None
 
-    filtered_vacancies = []
-    for vacancy in vacancies:
-        salary_from = vacancy.get('salary_from') or 0
-        salary_to = vacancy.get('salary_to') or float('inf')
+    return min_salary, max_salary
 
-        # Проверяем пересечение диапазонов
-        if (salary_from <= max_salary) and (salary_to >= min_salary):
-            filtered_vacancies.append(vacancy)
 
-    return filtered_vacancies
+def get_salary_values(vacancy: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Зарплата вакансии для сравнения: пересчитанная в базовую валюту, если вакансия пересчитана
+    (см. RateTable.normalize), иначе исходная
+    :param vacancy: Словарь с данными о вакансии
+    :return: Пара (от, до), неуказанные значения - None. У пересчитанной вакансии в валюте
+        без курса обе границы None: исходные суммы в другой валюте сравнивать нельзя
+    """
+    if SALARY_FROM_BASE in vacancy or SALARY_TO_BASE in vacancy:
+        return vacancy.get(SALARY_FROM_BASE), vacancy.get(SALARY_TO_BASE)
+    return vacancy.get('salary_from'), vacancy.get('salary_to')
+
+
+def get_salary_bounds(vacancy: Dict[str, Any]) -> Tuple[float, float]:
+    """
+    Границы зарплаты вакансии для проверки пересечения с диапазоном
+    :param vacancy: Словарь с данными о вакансии
+    :return: Пара (от, до), где неуказанные границы равны 0 и бесконечности
+    """
+    salary_from, salary_to = get_salary_values(vacancy)
+    return salary_from or 0, salary_to or float('inf')
 
 
-def sort_vacancies(vacancies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def salary_overlaps(vacancy: Dict[str, Any], min_salary: float, max_salary: float) -> bool:
+    """
+    Пересекается ли зарплатная вилка вакансии с диапазоном
+    :param vacancy: Словарь с данными о вакансии
+    :param min_salary: Нижняя граница диапазона
+    :param max_salary: Верхняя граница диапазона
+    :return: True, если диапазоны пересекаются
+    """
+    salary_from, salary_to = get_salary_bounds(vacancy)
+    return salary_from <= max_salary and salary_to >= min_salary
+
+
+def get_vacancies_by_salary(vacancies: Iterable[Dict[str, Any]], salary_range: str) -> List[Dict[str, Any]]:
+    """
+    Фильтрация вакансий по диапазону зарплат
+    :param vacancies: Список или итератор вакансий
+    :param salary_range: Строка с диапазоном зарплат в формате "min-max"
+    :return: Отфильтрованный список вакансий
+    """
+    bounds = parse_salary_range(salary_range)
+    if bounds is None:
+        return list(vacancies)
+
+    min_salary, max_salary = bounds
+    return [vacancy for vacancy in vacancies if salary_overlaps(vacancy, min_salary, max_salary)]
+
+
+def get_salary_sort_key(vacancy: Dict[str, Any]) -> float:
+    """
+    Ключ сортировки вакансии по зарплате
+    :param vacancy: Словарь с данными о вакансии
+    :return: Зарплата для сравнения вакансий
+    """
+    # Используем минимальную зарплату для сортировки
+    salary_from, salary_to = get_salary_values(vacancy)
+    salary_from = salary_from or 0
+    salary_to = salary_to or 0
+    # Если указана только максимальная зарплата, используем её
+    if salary_from == 0 and salary_to > 0:
+        return salary_to
+    return max(salary_from, salary_to)
+
+
+def sort_vacancies(vacancies: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Сортировка вакансий по зарплате (по убыванию)
-    :param vacancies: Список вакансий
+    :param vacancies: Список или итератор вакансий
     :return: Отсортированный список вакансий
     """
-    def get_sort_key(vacancy) -> int:
-        # Используем минимальную зарплату для сортировки
-        salary_from = vacancy.get('salary_from') or 0
-        salary_to = vacancy.get('salary_to') or 0
-        # Если указана только максимальная зарплата, используем её
-        if salary_from == 0 and salary_to > 0:
-            return salary_to
-        return max(salary_from, salary_to)
+    return sorted(vacancies, key=get_salary_sort_key, reverse=True)
+
 
-    return sorted(vacancies, key=get_sort_key, reverse=True)
+def top_vacancies(
+    vacancies: Iterable[Dict[str, Any]],
+    n: int,
+    key: Callable[[Dict[str, Any]], Any] = get_salary_sort_key
+) -> List[Dict[str, Any]]:
+    """
+    Выбор N лучших вакансий без полной сортировки (куча размера N, подходит для потоков)
+    :param vacancies: Список или итератор вакансий
+    :param n: Количество вакансий (0 и меньше - все вакансии)
+    :param key: Ключ сортировки (по умолчанию зарплата, как в sort_vacancies)
+    :return: Список из N вакансий по убыванию ключа; при равных ключах сохраняется исходный порядок
+    """
+    if n <= 0:
+        return sorted(vacancies, key=key, reverse=True)
+    return heapq.nlargest(n, vacancies, key=key)
 
 
 def get_top_vacancies(vacancies: List[Dict[str, Any]], top_n: int) -> List[Dict[str, Any]]:
@@ -92,33 +167,37 @@ def get_top_vacancies(vacancies: List[Dict[str, Any]], top_n: int) -> List[Dict[
     return vacancies[:top_n] if top_n > 0 else vacancies
 
 
-def print_vacancies(vacancies: List[Dict[str, Any]]) -> None:
+def print_vacancies(vacancies: Iterable[Dict[str, Any]], compact: bool = False) -> None:
     """
-    Вывод списка вакансий в консоль
-    :param vacancies: Список вакансий для вывода
+    Вывод списка вакансий в консоль (буферизованный, без создания объектов Vacancy)
+    :param vacancies: Список или итератор вакансий для вывода
+    :param compact: Вывод одной строкой таблицы на вакансию
     """
-    if not vacancies:
+    count = render_vacancies(vacancies, compact=compact)
+
+    if not count:
         print("Вакансии не найдены.")
         return
 
-    for i, vacancy_data in enumerate(vacancies, 1):
-        vacancy = Vacancy.from_dict(vacancy_data)
-        print(f"\nВакансия #{i}")
-        print("-" * 50)
-        print(vacancy)
+    print(f"\nВсего найдено вакансий: {count}")
 
-    print(f"\nВсего найдено вакансий: {len(vacancies)}")
 
-
-def save_vacancies_to_file(vacancies: List[Dict[str, Any]], filename: str = 'vacancies.json') -> None:
+def save_vacancies_to_file(
+    vacancies: Iterable[Dict[str, Any]],
+    filename: str = 'vacancies.json',
+    fmt: Optional[str] = None,
+    progress: Optional[Callable[[int], None]] = None
+) -> None:
     """
-    Сохранение списка вакансий в JSON-файл
-    :param vacancies: Список вакансий
-    :param filename: Имя файла для сохранения
+    Сохранение вакансий в файл (потоковая запись, см. export_vacancies)
+    :param vacancies: Список или итератор вакансий
+    :param filename: Имя файла для сохранения; формат и сжатие gzip определяются по расширению
+        (.json, .jsonl, .csv, с суффиксом .gz - сжатый)
+    :param fmt: Формат выгрузки (json, compact, jsonl, csv), если он не определяется по расширению
+    :param progress: Функция, получающая количество выгруженных вакансий
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(vacancies, file, ensure_ascii=False, indent=2)
+        export_vacancies(vacancies, filename, fmt=fmt, progress=progress)
         print(f"\nДанные успешно сохранены в файл: {filename}")
     except IOError as e:
         print(f"\nОшибка при сохранении в файл: {e}")
@@ -0,0 +1,132 @@
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from src.aggregator import JobAggregator
+from src.headhunter import HeadHunterAPI
+from src.job_api import JobAPI
+from src.storage import JSONStorage
+
+
+class FakeSource(JobAPI):
+    """Источник вакансий в памяти для тестов"""
+
+    def __init__(self, vacancies=(), delay=0.0, error=None):
+        self.vacancies = list(vacancies)
+        self.delay = delay
+        self.error = error
+        self.queries = []
+
+    def connect(self):
+        if self.error:
+            raise self.error
+
+    def get_vacancies(self, search_query, **kwargs):
+        self.queries.append((search_query, kwargs))
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.vacancies
+
+
+def vacancy(url, name='Python Developer', **fields):
+    return dict({'name': name, 'url': url}, **fields)
+
+
+def test_aggregate_and_dedupe():
+    """Тест объединения результатов источников с удалением дубликатов"""
+    first = FakeSource([vacancy('https://hh.ru/vacancy/1', id='1'), vacancy('https://hh.ru/vacancy/2', id='2')])
+    second = FakeSource([
+        vacancy('https://HH.ru/vacancy/2/', name='Копия'),
+        vacancy('https://superjob.ru/vacancy/7', salary_from=100000, extra='лишнее поле'),
+        vacancy('not-a-url'),
+    ])
+    aggregator = JobAggregator({'hh': first, 'sj': second})
+
+    vacancies = aggregator.get_vacancies('python', per_page=10)
+    assert [v['url'] for v in vacancies] == [
+        'https://hh.ru/vacancy/1', 'https://hh.ru/vacancy/2', 'https://superjob.ru/vacancy/7'
+    ]
+    # Вакансии приведены к общей схеме
+    assert 'extra' not in vacancies[2] and vacancies[2]['salary_from'] == 100000
+    assert vacancies[0]['id'] == 'hh:1' and vacancies[2]['id'] is None
+    assert aggregator.counts == {'hh': 2, 'sj': 1}
+    assert aggregator.errors == {}
+    assert first.queries == second.queries == [('python', {'per_page': 10})]
+
+
+def test_source_ids_do_not_collide():
+    """Тест сохранения вакансий разных источников с одинаковыми ID"""
+    hh = HeadHunterAPI()
+    with patch.object(hh, 'get_vacancies', return_value=[vacancy('https://hh.ru/vacancy/1', id='1')]):
+        aggregator = JobAggregator({
+            'hh': hh,
+            'sj': FakeSource([vacancy('https://superjob.ru/vacancy/1', id='1')]),
+            'habr': FakeSource([vacancy('https://career.habr.com/vacancies/1', id='1')]),
+        })
+        vacancies = aggregator.get_vacancies('python')
+        recrawled = aggregator.get_vacancies('python')
+
+    # ID hh.ru не меняются, ID остальных источников получают префикс
+    assert [v['id'] for v in vacancies] == ['1', 'sj:1', 'habr:1']
+    with tempfile.TemporaryDirectory() as directory:
+        storage = JSONStorage(os.path.join(directory, 'vacancies.json'))
+        assert storage.add_vacancies(vacancies)['inserted'] == 3
+        assert storage.upsert_vacancies(recrawled)['unchanged'] == 3
+        assert len(storage.get_vacancies()) == 3
+
+
+def test_sources_run_in_parallel():
+    """Тест одновременного опроса источников"""
+    sources = [FakeSource([vacancy(f'https://hh.ru/vacancy/{i}')], delay=0.3) for i in range(3)]
+    aggregator = JobAggregator(sources)
+    assert aggregator.sources == ['FakeSource', 'FakeSource#2', 'FakeSource#3']
+
+    started = time.monotonic()
+    assert len(aggregator.get_vacancies('python')) == 3
+    assert time.monotonic() - started < 0.8
+
+
+def test_slow_and_failing_sources_degrade():
+    """Тест: медленный и упавший источники не мешают остальным"""
+    release = threading.Event()
+
+    class HangingSource(FakeSource):
+        def get_vacancies(self, search_query, **kwargs):
+            release.wait(5)
+            return []
+
+    aggregator = JobAggregator(
+        {
+            'fast': FakeSource([vacancy('https://hh.ru/vacancy/1')]),
+            'slow': HangingSource(),
+            'broken': FakeSource(error=ConnectionError("Сервис недоступен")),
+        },
+        timeout=5,
+        timeouts={'slow': 0.2}
+    )
+
+    try:
+        started = time.monotonic()
+        vacancies = aggregator.get_vacancies('python')
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+
+    assert [v['url'] for v in vacancies] == ['https://hh.ru/vacancy/1']
+    assert isinstance(aggregator.errors['slow'], TimeoutError)
+    assert isinstance(aggregator.errors['broken'], ConnectionError)
+
+
+def test_all_sources_fail():
+    """Тест ошибки, когда не ответил ни один источник"""
+    aggregator = JobAggregator([FakeSource(error=ConnectionError("нет сети"))])
+    for method, args in ((aggregator.get_vacancies, ('python',)), (aggregator.connect, ())):
+        try:
+            method(*args)
+            assert False, "Должна быть ошибка ConnectionError"
+        except ConnectionError as e:
+            assert "нет сети" in str(e)
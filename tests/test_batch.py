@@ -0,0 +1,68 @@
+from src.batch import VacancyBatch
+from src.utils import get_vacancies_by_salary, sort_vacancies, top_vacancies
+from tests.test_utils import TEST_VACANCIES
+
+VACANCIES = [dict(vacancy, id=str(i)) for i, vacancy in enumerate(TEST_VACANCIES)] + [
+    {'id': '3', 'name': 'Только до', 'url': 'https://hh.ru/vacancy/4', 'salary_from': None, 'salary_to': 120000.5,
+     'salary_currency': 'USD', 'description': None, 'employer': 'Startup', 'experience': None, 'employment': None},
+    {'id': '4', 'name': 'Без зарплаты', 'url': 'https://hh.ru/vacancy/5', 'salary_from': None, 'salary_to': None,
+     'salary_currency': None, 'description': '', 'employer': None, 'experience': None, 'employment': None},
+]
+
+
+def test_round_trip():
+    """Тест преобразования словарей в столбцы и обратно"""
+    batch = VacancyBatch.from_dicts(VACANCIES)
+    assert len(batch) == 5
+    assert batch.to_dicts() == VACANCIES
+    assert batch[-1] == VACANCIES[-1]
+    assert batch.column('employer') == [v['employer'] for v in VACANCIES]
+
+
+def test_salary_filter_and_sorting():
+    """Тест фильтрации и сортировки по зарплате с семантикой функций utils"""
+    batch = VacancyBatch.from_dicts(VACANCIES)
+
+    for salary_range in ('0-1000000', '200000-400000', '110000-130000', 'некорректный'):
+        assert batch.filter_salary(salary_range).to_dicts() == get_vacancies_by_salary(VACANCIES, salary_range)
+
+    assert batch.sort_by_salary().to_dicts() == sort_vacancies(VACANCIES)
+    assert batch.top(2).to_dicts() == top_vacancies(VACANCIES, 2)
+
+
+def test_filter_equals():
+    """Тест отбора по категориальному полю"""
+    batch = VacancyBatch.from_dicts(VACANCIES)
+    assert [v['id'] for v in batch.filter_equals('employer', 'Startup')] == ['2', '3']
+    assert len(batch.filter_equals('employer', 'Нет такой')) == 0
+    assert [v['id'] for v in batch.filter_equals('experience', None)] == ['3', '4']
+
+
+def test_batch_uses_normalized_salary():
+    """Тест фильтрации и сортировки по зарплате в базовой валюте"""
+    vacancies = [
+        {'name': 'rub', 'salary_from': 150000, 'salary_to': 155000, 'salary_currency': 'RUR'},
+        {'name': 'usd', 'salary_from': 2000, 'salary_currency': 'USD',
+         'salary_from_base': 180000, 'salary_to_base': None},
+    ]
+    batch = VacancyBatch.from_dicts(vacancies)
+
+    assert batch.top(1)[0]['name'] == 'usd'
+    assert [v['name'] for v in batch.filter_salary('160000-200000')] == ['usd']
+    assert batch[1]['salary_from_base'] == 180000 and batch[1]['salary_to_base'] is None
+    assert 'salary_from_base' not in batch[0]
+
+
+def test_selections_share_columns():
+    """Тест выборок над общими столбцами: цепочки фильтров и сортировок без копирования данных"""
+    batch = VacancyBatch.from_dicts(VACANCIES)
+    filtered = batch.filter_salary('100000-400000')
+    expected = get_vacancies_by_salary(VACANCIES, '100000-400000')
+
+    assert filtered._columns is batch._columns
+    assert filtered.sort_by_salary().to_dicts() == sort_vacancies(expected)
+    assert filtered.filter_equals('employer', 'Startup').column('id') == [
+        v['id'] for v in expected if v['employer'] == 'Startup'
+    ]
+    assert filtered.take([1])[0] == expected[1]
+    assert list(filtered.salary_keys()) == [batch.salary_keys()[int(v['id'])] for v in expected]
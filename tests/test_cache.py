@@ -0,0 +1,72 @@
+import tempfile
+
+from src.cache import CachedJobAPI, FileCache, MemoryCache
+from src.job_api import JobAPI
+
+
+class FakeAPI(JobAPI):
+    """Источник вакансий для тестов, считающий обращения"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def connect(self):
+        pass
+
+    def get_vacancies(self, search_query, **kwargs):
+        self.calls += 1
+        return [{'name': search_query, 'url': 'https://hh.ru/vacancy/1'}]
+
+
+def test_memory_cache_lru_eviction():
+    """Тест вытеснения давно не использованных записей"""
+    cache = MemoryCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats == {'hits': 3, 'misses': 1, 'revalidations': 0}
+
+
+def test_memory_cache_ttl():
+    """Тест устаревания записей и заголовков условного запроса"""
+    cache = MemoryCache(ttl=0)
+    cache.set('a', 1, etag='"x"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+
+    assert cache.get('a') is None
+    assert cache.validators('a') == {
+        'If-None-Match': '"x"',
+        'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+    }
+    assert cache.revalidate('a') == 1
+
+
+def test_file_cache_persistence():
+    """Тест сохранения записей на диске между экземплярами кеша"""
+    with tempfile.TemporaryDirectory() as directory:
+        FileCache(directory).set('query', {'items': [1, 2]})
+        cache = FileCache(directory)
+
+        assert cache.get('query') == {'items': [1, 2]}
+        assert cache.get('other') is None
+
+        cache.clear()
+        assert cache.get('query') is None
+
+
+def test_cached_job_api():
+    """Тест кеширования результатов произвольного JobAPI"""
+    api = FakeAPI()
+    cached_api = CachedJobAPI(api)
+
+    first = cached_api.get_vacancies('Python', per_page=10)
+    second = cached_api.get_vacancies('Python', per_page=10)
+    cached_api.get_vacancies('Python', per_page=20)
+
+    assert first == second
+    assert api.calls == 2
+    assert cached_api.cache.stats['hits'] == 1
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from datetime import datetime
+
+from src.currency import RateTable
+from src.utils import get_salary_sort_key, get_vacancies_by_salary, top_vacancies
+
+RATES = RateTable({'USD': 90.0, 'EUR': 100.0}, timestamp=datetime(2026, 10, 1))
+
+
+def test_load_and_save():
+    """Тест сохранения и загрузки таблицы курсов"""
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'rates.json')
+        RATES.save(filename)
+        loaded = RateTable.load(filename)
+
+        assert loaded.base == 'RUR'
+        assert loaded.timestamp == datetime(2026, 10, 1)
+        assert loaded.rate('USD') == 90.0
+
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.write('{"base": "RUR"}')
+        try:
+            RateTable.load(filename)
+            assert False, "Должна быть ошибка ValueError"
+        except ValueError:
+            pass
+
+
+def test_convert():
+    """Тест пересчета сумм в базовую валюту"""
+    assert RATES.convert(1000, 'USD') == 90000
+    assert RATES.convert(1000, 'RUR') == 1000
+    assert RATES.convert(1000, None) == 1000
+    assert RATES.convert(None, 'USD') is None
+    assert RATES.convert(1000, 'KZT') is None
+
+
+def test_normalize():
+    """Тест добавления зарплаты в базовой валюте к вакансии"""
+    vacancy = {'name': 'usd', 'salary_from': 2000, 'salary_to': None, 'salary_currency': 'USD'}
+    normalized = RATES.normalize(vacancy)
+
+    assert normalized['salary_from_base'] == 180000
+    assert normalized['salary_to_base'] is None
+    assert 'salary_from_base' not in vacancy
+
+    # Зарплата в валюте без курса не пересчитывается
+    unknown = RATES.normalize({'name': 'kzt', 'salary_from': 500000, 'salary_currency': 'KZT'})
+    assert (unknown['salary_from_base'], unknown['salary_to_base']) == (None, None)
+
+
+def test_normalized_salary_comparison():
+    """Тест сравнения зарплат в разных валютах после пересчета"""
+    vacancies = list(RATES.normalize_all([
+        {'name': 'rub', 'salary_from': 150000, 'salary_to': 155000, 'salary_currency': 'RUR'},
+        {'name': 'usd', 'salary_from': 2000, 'salary_currency': 'USD'},
+        {'name': 'eur', 'salary_from': 1000, 'salary_to': 1500, 'salary_currency': 'EUR'},
+    ]))
+
+    assert get_salary_sort_key(vacancies[1]) == 180000
+    assert [v['name'] for v in top_vacancies(vacancies, 2)] == ['usd', 'rub']
+    assert [v['name'] for v in get_vacancies_by_salary(vacancies, '160000-200000')] == ['usd']
+
+
+def test_unconvertible_salary_is_not_compared():
+    """Тест: зарплата в валюте без курса не сравнивается с пересчитанными как сумма в базовой валюте"""
+    vacancies = list(RATES.normalize_all([
+        {'name': 'kzt', 'salary_from': 500000, 'salary_to': 600000, 'salary_currency': 'KZT'},
+        {'name': 'rub', 'salary_from': 300000, 'salary_to': 350000, 'salary_currency': 'RUR'},
+        {'name': 'none', 'salary_from': None, 'salary_to': None, 'salary_currency': None},
+    ]))
+
+    assert [v['name'] for v in top_vacancies(vacancies, 0)] == ['rub', 'kzt', 'none']
+    assert get_salary_sort_key(vacancies[0]) == 0
+    # Как у вакансии без зарплаты, вилка не ограничена
+    assert [v['name'] for v in get_vacancies_by_salary(vacancies, '550000-560000')] == ['kzt', 'none']
@@ -0,0 +1,69 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+
+from src.export import detect_format, export_vacancies
+from tests.test_utils import TEST_VACANCIES
+
+
+def test_detect_format():
+    """Тест определения формата по расширению"""
+    assert detect_format('vacancies.json') == 'json'
+    assert detect_format('vacancies.JSONL.gz') == 'jsonl'
+    assert detect_format('vacancies.csv') == 'csv'
+    assert detect_format('vacancies.txt') == 'json'
+
+
+def test_export_formats():
+    """Тест выгрузки во все форматы из итератора"""
+    vacancies = [dict(vacancy, id=str(i)) for i, vacancy in enumerate(TEST_VACANCIES)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'export.json')
+        assert export_vacancies(iter(vacancies), path) == len(vacancies)
+        with open(path, encoding='utf-8') as file:
+            # Совпадает с прежним форматом json.dump(..., indent=2)
+            assert file.read() == json.dumps(vacancies, ensure_ascii=False, indent=2)
+
+        path = os.path.join(directory, 'export.compact')
+        export_vacancies(iter(vacancies), path, fmt='compact')
+        with open(path, encoding='utf-8') as file:
+            text = file.read()
+        assert json.loads(text) == vacancies and '\n' not in text
+
+        path = os.path.join(directory, 'export.jsonl.gz')
+        export_vacancies(iter(vacancies), path)
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            assert [json.loads(line) for line in file] == vacancies
+
+        path = os.path.join(directory, 'export.csv')
+        export_vacancies(iter(vacancies), path)
+        with open(path, encoding='utf-8', newline='') as file:
+            rows = list(csv.DictReader(file))
+        assert [row['name'] for row in rows] == [v['name'] for v in vacancies]
+        assert rows[0]['salary_from'] == str(vacancies[0]['salary_from'])
+
+        path = os.path.join(directory, 'empty.json')
+        export_vacancies(iter([]), path)
+        with open(path, encoding='utf-8') as file:
+            assert file.read() == '[]'
+
+        try:
+            export_vacancies(vacancies, path, fmt='xml')
+            assert False, "Должна быть ошибка ValueError"
+        except ValueError:
+            pass
+
+
+def test_export_progress():
+    """Тест отчета о ходе выгрузки"""
+    reported = []
+    with tempfile.TemporaryDirectory() as directory:
+        count = export_vacancies(
+            ({'name': str(i)} for i in range(25)), os.path.join(directory, 'export.jsonl'),
+            progress=reported.append, progress_every=10
+        )
+    assert count == 25
+    assert reported == [10, 20, 25]
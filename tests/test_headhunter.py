@@ -1,11 +1,49 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
-from src.headhunter import HeadHunterAPI
+from src.cache import MemoryCache
+from src.headhunter import AsyncHeadHunterAPI, HeadHunterAPI
+from src.job_api import SyncJobAPI
+from src.rate_limiter import RequestBudgetExceeded
+
+
+# Локальный HTTP-сервер, отвечающий заранее заданными статусами
+def start_stub_server(statuses, headers=None):
+    log = {'ports': [], 'statuses': list(statuses), 'sent': []}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            log['ports'].append(self.client_address[1])
+            status = log['statuses'].pop(0) if log['statuses'] else 200
+            body = json.dumps({'items': [], 'pages': 1, 'found': 0}).encode()
+            etag = (headers or {}).get('ETag')
+            if etag and self.headers.get('If-None-Match') == etag:
+                status, body = 304, b''
+            log['sent'].append(status)
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}/vacancies', log
 
 
 def test_get_vacancies_success():
     """Тест успешного получения вакансий"""
-    # Создаем мок для requests.get
+    # Создаем мок для запросов через сессию
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = {
@@ -35,7 +73,7 @@ def test_get_vacancies_success():
         ]
     }
 
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         api = HeadHunterAPI()
         vacancies = api.get_vacancies("Python")
 
@@ -46,13 +84,237 @@ def test_get_vacancies_success():
 
 def test_connect_failure():
     """Тест неудачного подключения"""
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_response = MagicMock()
         mock_response.status_code = 500
         mock_get.return_value = mock_response
 
+        api = HeadHunterAPI(max_retries=0)
+        mock_get.assert_not_called()
+
         try:
-            HeadHunterAPI()
+            api.connect()
             assert False, "Должно быть вызвано исключение ConnectionError"
         except ConnectionError:
             pass  # Ожидаемое поведение
+
+
+def test_get_vacancies_fetch_all():
+    """Тест загрузки всех страниц выдачи в порядке страниц"""
+    def fake_get(url, params=None, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        page = (params or {}).get('page', 0)
+        response.json.return_value = {
+            'pages': 3,
+            'found': 5,
+            'items': [
+                {'id': f'{page}-{i}', 'name': f'Vacancy {page}-{i}', 'alternate_url': f'http://example.com/{page}/{i}'}
+                for i in range(2 if page < 2 else 1)
+            ]
+        }
+        return response
+
+    with patch('requests.Session.get', side_effect=fake_get):
+        api = HeadHunterAPI()
+        vacancies = api.get_vacancies("Python", per_page=2, fetch_all=True)
+
+    assert [v['id'] for v in vacancies] == ['0-0', '0-1', '1-0', '1-1', '2-0']
+
+
+def test_get_vacancies_fetch_all_depth_limit():
+    """Тест ограничения глубины выдачи при загрузке всех страниц"""
+    requested_pages = []
+
+    def fake_get(url, params=None, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        if params:
+            requested_pages.append(params['page'])
+        response.json.return_value = {'pages': 100, 'found': 10000, 'items': []}
+        return response
+
+    with patch('requests.Session.get', side_effect=fake_get):
+        api = HeadHunterAPI()
+        api.get_vacancies("Python", per_page=100, fetch_all=True)
+
+    assert sorted(requested_pages) == list(range(20))
+
+
+def test_session_reuses_connection():
+    """Тест переиспользования keep-alive соединения между запросами"""
+    server, url, log = start_stub_server([])
+    try:
+        with HeadHunterAPI(base_url=url) as api:
+            api.get_vacancies("Python")
+            api.get_vacancies("Java")
+
+        assert len(log['ports']) == 2
+        assert len(set(log['ports'])) == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_retry_after_on_throttling():
+    """Тест повторов с учетом Retry-After при ответах 429/503"""
+    server, url, log = start_stub_server([429, 503], headers={'Retry-After': '0'})
+    try:
+        with HeadHunterAPI(base_url=url) as api:
+            assert api.get_vacancies("Python") == []
+
+        assert len(log['ports']) == 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_retries_exhausted():
+    """Тест ошибки после исчерпания повторов с экспоненциальной задержкой"""
+    server, url, log = start_stub_server([500, 500, 500])
+    try:
+        with HeadHunterAPI(base_url=url, max_retries=2, backoff_factor=0.01) as api:
+            try:
+                api.get_vacancies("Python")
+                assert False, "Должно быть вызвано исключение ConnectionError"
+            except ConnectionError:
+                pass
+
+        assert len(log['ports']) == 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_health_check_cached():
+    """Тест кеширования результата проверки доступности API"""
+    server, url, log = start_stub_server([])
+    try:
+        with HeadHunterAPI(base_url=url, health_check_ttl=60) as api:
+            api.get_vacancies("Python")
+            api.get_vacancies("Java")
+
+        # Одна проверка доступности и два запроса вакансий
+        assert len(log['ports']) == 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_cache_revalidation_with_etag():
+    """Тест кеширования страниц и условной перепроверки по ETag"""
+    server, url, log = start_stub_server([], headers={'ETag': '"v1"'})
+    try:
+        # Нулевое время жизни: каждая запись сразу требует перепроверки
+        cache = MemoryCache(ttl=0)
+        with HeadHunterAPI(base_url=url, cache=cache) as api:
+            assert api.get_vacancies("Python") == []
+            assert api.get_vacancies("Python") == []
+
+        assert log['sent'] == [200, 304]
+        assert cache.stats == {'hits': 0, 'misses': 2, 'revalidations': 1}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_metrics_count_retries_and_time():
+    """Тест статистики запросов: повторы, время ожидания и время ввода-вывода"""
+    server, url, log = start_stub_server([503], headers={'Retry-After': '0'})
+    try:
+        with HeadHunterAPI(base_url=url, rate_limit=1000, burst=5) as api:
+            api.get_vacancies("Python")
+            metrics = api.metrics()
+
+        # Ответ 503 и повтор
+        assert metrics['requests'] == 2
+        assert metrics['retries'] == 1
+        assert metrics['io_time'] > 0
+        assert metrics['wait_time'] >= 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_request_budget():
+    """Тест лимита запросов на запуск"""
+    server, url, log = start_stub_server([])
+    try:
+        with HeadHunterAPI(base_url=url, request_budget=1) as api:
+            api.get_vacancies("Python")
+            assert api.metrics()['budget_remaining'] == 0
+            try:
+                api.get_vacancies("Java")
+                assert False, "Должно быть вызвано исключение RequestBudgetExceeded"
+            except RequestBudgetExceeded:
+                pass
+
+            api.reset_metrics()
+            assert api.metrics() == {
+                'requests': 0, 'retries': 0, 'wait_time': 0.0, 'backoff_time': 0.0, 'io_time': 0.0,
+                'budget_remaining': 1
+            }
+        assert len(log['ports']) == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def fake_search(url, params=None, **kwargs):
+    """Ответ API: по две вакансии на страницу, три страницы для каждого запроса"""
+    response = MagicMock()
+    response.status_code = 200
+    page = params['page']
+    response.json.return_value = {
+        'pages': 3,
+        'items': [
+            {'id': f"{params['text']}-{page}-{i}", 'alternate_url': f'http://example.com/{page}/{i}'}
+            for i in range(2)
+        ]
+    }
+    return response
+
+
+def test_async_get_vacancies_many():
+    """Тест одновременной загрузки нескольких запросов со всеми страницами"""
+    async def run():
+        async with AsyncHeadHunterAPI(max_concurrency=4, rate_limit=1000, burst=10) as api:
+            return await api.get_vacancies_many(['Python', 'Java'], per_page=2, fetch_all=True)
+
+    with patch('requests.Session.get', side_effect=fake_search):
+        results = asyncio.run(run())
+
+    assert list(results) == ['Python', 'Java']
+    assert [v['id'] for v in results['Java']] == [f'Java-{page}-{i}' for page in range(3) for i in range(2)]
+
+
+def test_async_rate_limit_shared_with_client():
+    """Тест ограничения частоты асинхронного клиента: одно ожидание на каждый запрос"""
+    async def run(api):
+        async with api:
+            await api.get_vacancies_many(['Python', 'Java'], per_page=2)
+
+    api = AsyncHeadHunterAPI(max_concurrency=4, rate_limit=1000, burst=2)
+    with patch('requests.Session.get', side_effect=fake_search), \
+            patch.object(api.client.rate_limiter, 'acquire', wraps=api.client.rate_limiter.acquire) as acquire:
+        asyncio.run(run(api))
+
+    assert acquire.call_count == api.client.metrics()['requests']
+
+    try:
+        AsyncHeadHunterAPI(rate_limit=10, client=HeadHunterAPI())
+        assert False, "Должна быть ошибка ValueError"
+    except ValueError:
+        pass
+
+
+def test_sync_facade():
+    """Тест синхронного фасада над асинхронным клиентом"""
+    api = SyncJobAPI(AsyncHeadHunterAPI())
+    with patch('requests.Session.get', side_effect=fake_search):
+        first = api.get_vacancies('Python', per_page=2)
+        # Повторный вызов выполняется в новом цикле событий
+        second = api.get_vacancies('Python', per_page=2, page=1)
+
+    assert [v['id'] for v in first] == ['Python-0-0', 'Python-0-1']
+    assert [v['id'] for v in second] == ['Python-1-0', 'Python-1-1']
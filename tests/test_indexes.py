@@ -0,0 +1,98 @@
+import random
+
+from src.indexes import KeywordIndex, SalaryIndex, tokenize
+from src.utils import filter_vacancies, get_vacancies_by_salary
+from tests.test_utils import TEST_VACANCIES
+
+
+def test_tokenize():
+    """Тест нормализации слов с учетом кириллицы"""
+    assert tokenize('Опыт работы с Python, Ёлка-ПАЛКА') == ['опыт', 'работы', 'с', 'python', 'елка', 'палка']
+
+
+def test_keyword_search_and_or():
+    """Тест поиска по целым словам в режимах AND и OR"""
+    index = KeywordIndex(TEST_VACANCIES)
+
+    found = index.search(['python', 'DJANGO'])
+    assert [v['name'] for v in found] == ['Senior Python Developer']
+
+    found = index.search(['Startup', 'Django'], mode='or')
+    assert [v['name'] for v in found] == ['Senior Python Developer', 'Junior Python Developer']
+
+    # Целое слово не совпадает с частью слова
+    assert index.search(['Pyth']) == []
+    assert len(index.search([])) == 3
+
+
+def test_keyword_search_substring_compatible():
+    """Тест совместимости режима подстрок с filter_vacancies"""
+    index = KeywordIndex(TEST_VACANCIES)
+
+    for words in (['Senior'], ['Python', 'Django'], ['pyth', 'от 3'], ['лет,'], ['none'], ['нет такого']):
+        assert index.search(words, substring=True) == filter_vacancies(TEST_VACANCIES, words)
+
+
+def test_keyword_index_updates():
+    """Тест добавления и удаления вакансий в индексе"""
+    index = KeywordIndex(TEST_VACANCIES)
+    index.remove('https://hh.ru/vacancy/2')
+    assert index.search(['Django']) == []
+
+    index.add({'id': '42', 'name': 'Django Ёжик', 'url': 'https://hh.ru/vacancy/42'})
+    assert [v['id'] for v in index.search(['django', 'ежик'])] == ['42']
+    assert len(index) == 3
+
+    try:
+        index.remove('https://hh.ru/vacancy/2')
+        assert False, "Должна быть ошибка ValueError"
+    except ValueError:
+        pass
+
+
+def test_salary_index_matches_linear_filter():
+    """Тест совпадения результатов индекса зарплат с get_vacancies_by_salary"""
+    vacancies = TEST_VACANCIES + [
+        {'url': 'https://hh.ru/vacancy/4', 'salary_from': None, 'salary_to': 90000},
+        {'url': 'https://hh.ru/vacancy/5', 'salary_from': 120000, 'salary_to': None},
+        {'url': 'https://hh.ru/vacancy/6', 'salary_from': None, 'salary_to': None},
+        {'url': 'https://hh.ru/vacancy/7', 'salary_from': 0, 'salary_to': 0},
+    ]
+    index = SalaryIndex(vacancies)
+
+    for salary_range in ('0-1000000', '200000-400000', '85000-95000', '150000-150000', '1-2', '', 'abc'):
+        assert index.search(salary_range) == get_vacancies_by_salary(vacancies, salary_range)
+
+
+def test_salary_index_updates():
+    """Тест добавления и удаления вакансий в индексе зарплат"""
+    index = SalaryIndex(TEST_VACANCIES)
+    index.remove('https://hh.ru/vacancy/2')
+    assert index.overlapping(200000, 400000) == []
+
+    index.add({'id': '42', 'url': 'https://hh.ru/vacancy/42', 'salary_from': 250000, 'salary_to': 260000})
+    index.add({'id': '42', 'url': 'https://hh.ru/vacancy/42', 'salary_from': 300000, 'salary_to': 310000})
+    assert [v['salary_from'] for v in index.overlapping(200000, 400000)] == [300000]
+    assert len(index) == 3
+
+
+def test_salary_index_interleaved_updates():
+    """Тест чередования изменений и запросов: результаты совпадают с линейной фильтрацией"""
+    rng = random.Random(7)
+    vacancies = {}
+    index = SalaryIndex()
+    for step in range(1500):
+        key = str(rng.randrange(400))
+        if key in vacancies and rng.random() < 0.3:
+            index.remove(key)
+            del vacancies[key]
+        else:
+            low = rng.choice([None, rng.randrange(0, 300000, 1000)])
+            high = rng.choice([None, (low or 0) + rng.randrange(0, 100000, 1000)])
+            vacancies[key] = {'id': key, 'url': f'https://hh.ru/vacancy/{key}', 'salary_from': low, 'salary_to': high}
+            index.add(vacancies[key])
+
+        if step % 50 == 0:
+            expected = get_vacancies_by_salary(vacancies.values(), '100000-150000')
+            assert sorted(v['id'] for v in index.search('100000-150000')) == sorted(v['id'] for v in expected)
+    assert len(index) == len(vacancies)
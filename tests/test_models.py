@@ -87,7 +87,8 @@ def test_from_dict():
         'description': 'Опыт работы с Python',
         'employer': 'Test Company',
         'experience': 'От 1 года',
-        'employment': 'Полная занятость'
+        'employment': 'Полная занятость',
+        'id': '12345'
     }
 
     vacancy = Vacancy.from_dict(data)
@@ -95,6 +96,10 @@ def test_from_dict():
     assert vacancy.url == 'https://hh.ru/vacancy/12345'
     assert vacancy.salary_from == 100000
     assert vacancy.employer == 'Test Company'
+    # ID источника сохраняется при преобразованиях
+    assert vacancy.id == '12345'
+    assert vacancy.to_dict() == data
+    assert Vacancy.from_trusted_dict(data).id == '12345'
 
 
 def test_to_dict():
@@ -113,3 +118,32 @@ def test_to_dict():
     assert data['salary_from'] == 100000
     assert data['salary_to'] == 150000
     assert data['salary_currency'] == 'RUR'
+
+
+def test_from_trusted_dict():
+    """Тест создания вакансии без валидации"""
+    data = {
+        'name': 'Python Developer',
+        'url': 'https://hh.ru/vacancy/12345',
+        'salary_from': 100000,
+        'employer': 'Test Company'
+    }
+
+    vacancy = Vacancy.from_trusted_dict(data)
+    assert vacancy == Vacancy.from_dict(data)
+    assert vacancy.to_dict() == Vacancy.from_dict(data).to_dict()
+
+    # Проверка не выполняется, а лишних атрибутов нет
+    assert Vacancy.from_trusted_dict({'url': 'invalid-url'}).url == 'invalid-url'
+    assert not hasattr(vacancy, '__dict__')
+
+
+def test_str():
+    """Тест строкового представления вакансии"""
+    vacancy = Vacancy('Python Developer', 'https://hh.ru/vacancy/1', 100000, None, 'RUR', employer='ООО Тест')
+    text = str(vacancy)
+
+    assert text.startswith('Python Developer\nЗарплата: от 100 000 RUR\nКомпания: ООО Тест\n')
+    # Разделитель выводится один раз в конце
+    assert text.count('Python Developer') == 1
+    assert text.endswith('Ссылка: https://hh.ru/vacancy/1\n' + '-' * 50)
@@ -0,0 +1,114 @@
+from unittest.mock import MagicMock, patch
+
+from src.currency import RateTable
+from src.headhunter import HeadHunterAPI
+from src.job_api import JobAPI
+from src.query import VacancyQuery
+
+
+class FakeSource(JobAPI):
+    """Источник вакансий в памяти, запоминающий параметры запросов"""
+
+    def __init__(self, vacancies=()):
+        self.vacancies = list(vacancies)
+        self.queries = []
+
+    def connect(self):
+        pass
+
+    def get_vacancies(self, search_query, **kwargs):
+        self.queries.append((search_query, kwargs))
+        return self.vacancies
+
+
+VACANCIES = [
+    {'name': 'Python Developer', 'url': 'https://hh.ru/vacancy/1', 'salary_from': 150000, 'salary_to': 200000},
+    {'name': 'Python Django', 'url': 'https://hh.ru/vacancy/2', 'salary_from': 50000, 'salary_to': 80000},
+    {'name': 'Java Developer', 'url': 'https://hh.ru/vacancy/3', 'salary_from': 150000, 'salary_to': 180000},
+]
+
+
+def test_exact_plan():
+    """Тест передачи в API только фильтров с точным результатом"""
+    query = VacancyQuery(
+        'Python', keywords=['developer'], salary_range='100000-300000',
+        experience='От 1 года до 3 лет', employment=['full', 'part'], area=1, only_with_salary=True
+    )
+    plan = query.plan()
+
+    assert plan.search_query == 'Python'
+    assert plan.params == {
+        'only_with_salary': True, 'area': 1, 'experience': ['between1And3'], 'employment': ['full', 'part']
+    }
+    assert plan.local_filters == ['keywords', 'salary_range']
+
+
+def test_fetch_applies_local_filters():
+    """Тест: API получает свои фильтры, остальные применяются к ответу"""
+    source = FakeSource(VACANCIES)
+    query = VacancyQuery('Python', keywords=['developer'], salary_range=(100000, 300000), experience='moreThan6')
+
+    vacancies = query.fetch(source, per_page=50)
+
+    assert [v['url'] for v in vacancies] == ['https://hh.ru/vacancy/1', 'https://hh.ru/vacancy/3']
+    assert source.queries == [
+        ('Python', {'per_page': 50, 'only_with_salary': False, 'experience': ['moreThan6']})
+    ]
+
+
+def test_salary_range_uses_base_currency():
+    """Тест сравнения диапазона зарплат с зарплатой в базовой валюте"""
+    usd = {'name': 'Python Developer', 'url': 'https://hh.ru/vacancy/4',
+           'salary_from': 1500, 'salary_to': 2000, 'salary_currency': 'USD'}
+    source = FakeSource(VACANCIES + [usd])
+    query = VacancyQuery('Python', salary_range='100000-200000', rates=RateTable({'USD': 90}))
+
+    vacancies = query.fetch(source)
+
+    assert [v['url'] for v in vacancies] == [
+        'https://hh.ru/vacancy/1', 'https://hh.ru/vacancy/3', 'https://hh.ru/vacancy/4'
+    ]
+    assert (vacancies[-1]['salary_from_base'], vacancies[-1]['salary_to_base']) == (135000, 180000)
+    # Без курсов сумма в долларах не попадает в диапазон в рублях
+    assert len(VacancyQuery('Python', salary_range='100000-200000').fetch(source)) == 2
+
+
+def test_approximate_plan():
+    """Тест передачи зарплаты и ключевых слов в API с сохранением локальной проверки"""
+    source = FakeSource(VACANCIES)
+    query = VacancyQuery('Python', keywords=['developer'], salary_range='100000-300000', exact=False)
+
+    vacancies = query.fetch(source)
+
+    search_query, params = source.queries[0]
+    assert search_query == 'Python developer'
+    assert params == {'only_with_salary': False, 'salary': 100000, 'currency': 'RUR'}
+    assert [v['url'] for v in vacancies] == ['https://hh.ru/vacancy/1', 'https://hh.ru/vacancy/3']
+
+
+def test_invalid_query():
+    """Тест проверки параметров запроса"""
+    for kwargs in ({'experience': 'много'}, {'salary_range': '100000'}, {'employment': ['full', 'remote']}):
+        try:
+            VacancyQuery('Python', **kwargs)
+            assert False, f"Должна быть ошибка ValueError: {kwargs}"
+        except ValueError:
+            pass
+
+
+def test_headhunter_receives_filters():
+    """Тест передачи фильтров плана в параметры запроса hh.ru"""
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {'items': [], 'pages': 1}
+
+    query = VacancyQuery('Python', experience='noExperience', employment='probation', area=2)
+    with patch('requests.Session.get', return_value=response) as mock_get:
+        assert query.fetch(HeadHunterAPI(), per_page=20) == []
+
+    params = mock_get.call_args.kwargs['params']
+    assert params['text'] == 'Python'
+    assert (params['area'], params['per_page']) == (2, 20)
+    assert params['experience'] == ['noExperience']
+    assert params['employment'] == ['probation']
+    assert 'salary' not in params
@@ -0,0 +1,54 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.rate_limiter import RateLimiter, RequestBudget, RequestBudgetExceeded
+
+
+def test_burst_without_waiting():
+    """Тест выполнения пачки запросов без ожидания"""
+    limiter = RateLimiter(rate=1, burst=3)
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_rate_is_limited():
+    """Тест ожидания после исчерпания пачки запросов"""
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.05
+
+
+def test_shared_between_threads():
+    """Тест общего ограничения частоты для нескольких потоков"""
+    limiter = RateLimiter(rate=50, burst=2)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        delays = sorted(executor.map(lambda _: limiter.acquire(), range(4)))
+
+    assert delays[:2] == [0.0, 0.0]
+    assert all(delay > 0 for delay in delays[2:])
+
+
+def test_invalid_parameters():
+    """Тест проверки параметров ограничителя"""
+    try:
+        RateLimiter(rate=0)
+        assert False, "Должна быть ошибка ValueError"
+    except ValueError:
+        pass
+
+
+def test_request_budget():
+    """Тест лимита запросов на запуск"""
+    budget = RequestBudget(2)
+    budget.spend()
+    budget.spend()
+    assert budget.remaining == 0
+    try:
+        budget.spend()
+        assert False, "Должно быть вызвано исключение RequestBudgetExceeded"
+    except RequestBudgetExceeded:
+        pass
+
+    budget.reset()
+    assert (budget.used, budget.remaining) == (0, 2)
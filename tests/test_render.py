@@ -0,0 +1,88 @@
+import io
+
+from src.render import PagedViewer, format_vacancy_row, render_vacancies
+
+VACANCIES = [
+    {'name': f'Vacancy {i}', 'url': f'https://hh.ru/vacancy/{i}', 'salary_from': 1000 * i, 'employer': 'Company'}
+    for i in range(1, 24)
+]
+
+
+class CountingStream(io.StringIO):
+    """Поток, подсчитывающий количество записей"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def test_render_vacancies_in_chunks():
+    """Тест вывода вакансий блоками без проверки данных"""
+    stream = CountingStream()
+    # Некорректный URL не мешает выводу: словари не превращаются в Vacancy
+    vacancies = VACANCIES + [{'name': 'Broken', 'url': 'not-a-url'}]
+
+    assert render_vacancies(vacancies, file=stream, chunk_size=10) == 24
+    assert stream.writes == 3
+    text = stream.getvalue()
+    assert text.startswith("\nВакансия #1\n")
+    assert "Зарплата: от 23 000" in text
+    assert text.count("-" * 50) == 48
+    assert render_vacancies([], file=io.StringIO()) == 0
+
+
+def test_compact_rows():
+    """Тест компактного табличного вывода"""
+    row = format_vacancy_row({'name': 'x' * 60, 'salary_to': 150000, 'salary_currency': 'RUR'}, 7)
+    assert row.endswith("\n") and "\n" not in row[:-1]
+    assert row.lstrip().startswith("7  " + "x" * 40 + " ")
+    assert "до 150 000 RUR" in row
+
+    stream = io.StringIO()
+    render_vacancies(VACANCIES[:3], file=stream, compact=True, start=11)
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 4
+    assert lines[1].split()[0] == '11'
+
+
+def test_paged_viewer_reads_lazily():
+    """Тест постраничного просмотра: из источника читается только нужное"""
+    consumed = []
+
+    def source():
+        for vacancy in VACANCIES:
+            consumed.append(vacancy)
+            yield vacancy
+
+    stream = io.StringIO()
+    viewer = PagedViewer(source(), page_size=5, compact=True, file=stream)
+    assert viewer.show() == 5
+    assert len(consumed) == 5
+    assert viewer.total is None
+
+    assert viewer.jump(3)
+    assert [v['name'] for v in viewer.visible()] == [f'Vacancy {i}' for i in range(11, 16)]
+    assert viewer.prev() and viewer.page == 1
+
+    assert not viewer.jump(6)
+    assert viewer.total == 23
+    assert viewer.jump(5) and len(viewer.visible()) == 3
+    assert not viewer.next()
+
+
+def test_paged_viewer_run():
+    """Тест интерактивного просмотра с командами пользователя"""
+    commands = iter(['', 'n', 'p', '9', 'x', 'q'])
+    stream = io.StringIO()
+    viewer = PagedViewer(VACANCIES, page_size=10, file=stream)
+    viewer.run(input_func=lambda prompt: next(commands))
+
+    text = stream.getvalue()
+    assert viewer.page == 1
+    assert "Страница 3: вакансии 21-23 из 23" in text
+    assert "Такой страницы нет." in text
+    assert "Неизвестная команда." in text
@@ -0,0 +1,49 @@
+from src.currency import RateTable
+from src.sorting import VacancySorter
+from src.utils import sort_vacancies
+from tests.test_utils import TEST_VACANCIES
+
+
+def test_sort_by_salary_matches_sort_vacancies():
+    """Тест совпадения сортировки по зарплате с sort_vacancies"""
+    sorter = VacancySorter(TEST_VACANCIES)
+    assert sorter.sort('-salary') == sort_vacancies(TEST_VACANCIES)
+
+
+def test_multi_key_sort():
+    """Тест сортировки по нескольким ключам с разным направлением"""
+    vacancies = [
+        {'name': 'b', 'employer': 'Сбер', 'experience': 'Более 6 лет', 'salary_from': 100},
+        {'name': 'a', 'employer': 'Яндекс', 'experience': 'Нет опыта', 'salary_from': 100},
+        {'name': 'c', 'employer': 'сбер', 'experience': 'От 1 года до 3 лет', 'salary_from': 300},
+    ]
+    sorter = VacancySorter(vacancies)
+
+    assert [v['name'] for v in sorter.sort('employer', '-salary')] == ['c', 'b', 'a']
+    assert [v['name'] for v in sorter.sort('experience')] == ['a', 'c', 'b']
+    assert [v['name'] for v in sorter.sort('-salary', 'name')] == ['c', 'a', 'b']
+
+
+def test_salary_currency_normalisation():
+    """Тест сортировки по зарплате с пересчетом валют"""
+    vacancies = [
+        {'name': 'rub', 'salary_from': 200000, 'salary_currency': 'RUR'},
+        {'name': 'usd', 'salary_from': 3000, 'salary_currency': 'USD'},
+    ]
+    assert [v['name'] for v in VacancySorter(vacancies).sort('-salary')] == ['rub', 'usd']
+    rates = RateTable({'USD': 90})
+    assert [v['name'] for v in VacancySorter(vacancies, rates=rates).sort('-salary')] == ['usd', 'rub']
+
+
+def test_sort_keys_are_cached():
+    """Тест однократного вычисления ключей сортировки"""
+    sorter = VacancySorter(TEST_VACANCIES)
+    column = sorter.column('salary')
+    sorter.sort('salary')
+    assert sorter.column('salary') is column
+
+    try:
+        sorter.sort('unknown')
+        assert False, "Должна быть ошибка ValueError"
+    except ValueError:
+        pass
@@ -1,8 +1,14 @@
+import io
+import json
+import multiprocessing
 import os
 import tempfile
+import uuid
+from unittest.mock import patch
 
+from src.currency import RateTable
 from src.models import Vacancy
-from src.storage import JSONStorage
+from src.storage import JSONLinesStorage, JSONStorage, SQLiteStorage, iter_json_array
 
 
 # Создаем временный файл для тестов
@@ -59,3 +65,416 @@ def test_add_and_get_vacancies():
         # Очистка
         if os.path.exists(temp_file):
             os.unlink(temp_file)
+
+
+def test_sqlite_storage():
+    """Тест добавления, поиска и удаления вакансий в SQLite"""
+    _, test_vacancy, test_vacancy_2, temp_file = setup_test_environment()
+    os.unlink(temp_file)
+
+    with tempfile.TemporaryDirectory() as directory:
+        with SQLiteStorage(os.path.join(directory, 'vacancies.db')) as storage:
+            storage.add_vacancy(test_vacancy)
+            storage.add_vacancy(test_vacancy_2)
+            # Дубликат по URL пропускается
+            storage.add_vacancy(test_vacancy)
+
+            vacancies = storage.get_vacancies()
+            assert [v['name'] for v in vacancies] == ["Python Developer", "Senior Python Developer"]
+            assert vacancies[0]['salary_from'] == 100000
+
+            found = storage.get_vacancies(salary_from=200000, salary_currency="RUR")
+            assert [v['name'] for v in found] == ["Senior Python Developer"]
+            assert storage.get_vacancies(unknown_field=1) == []
+
+            storage.delete_vacancy(vacancies[0]['id'])
+            assert len(storage.get_vacancies()) == 1
+
+            try:
+                storage.delete_vacancy(vacancies[0]['id'])
+                assert False, "Должна быть ошибка ValueError"
+            except ValueError:
+                pass
+
+
+def test_add_vacancies_batch():
+    """Тест пакетного добавления вакансий с подсчетом дубликатов и ошибок"""
+    storage, test_vacancy, test_vacancy_2, temp_file = setup_test_environment()
+
+    try:
+        storage.add_vacancy(test_vacancy)
+        batch = [
+            test_vacancy,
+            test_vacancy_2.to_dict(),
+            test_vacancy_2,
+            {'name': 'Broken', 'url': 'not-a-url'},
+            'not a vacancy'
+        ]
+
+        result = storage.add_vacancies(batch)
+        assert result == {'inserted': 1, 'updated': 0, 'duplicates': 2, 'invalid': 2}
+        assert [v['name'] for v in storage.get_vacancies()] == ["Python Developer", "Senior Python Developer"]
+
+        with tempfile.TemporaryDirectory() as directory:
+            with SQLiteStorage(os.path.join(directory, 'vacancies.db')) as sqlite_storage:
+                sqlite_storage.add_vacancy(test_vacancy)
+                assert sqlite_storage.add_vacancies(batch) == result
+                assert len(sqlite_storage.get_vacancies()) == 2
+    finally:
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
+
+
+def test_json_lines_storage():
+    """Тест хранилища JSON Lines: дописывание, отметки об удалении и сжатие"""
+    _, test_vacancy, test_vacancy_2, temp_file = setup_test_environment()
+    os.unlink(temp_file)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'vacancies.jsonl')
+        storage = JSONLinesStorage(filename, compact_min_lines=10)
+        storage.add_vacancy(test_vacancy)
+        storage.add_vacancy(test_vacancy)
+        assert storage.add_vacancies([test_vacancy_2]) == {'inserted': 1, 'updated': 0, 'duplicates': 0, 'invalid': 0}
+
+        first_id = storage.get_vacancies(name="Python Developer")[0]['id']
+        storage.delete_vacancy(first_id)
+        with open(filename, encoding='utf-8') as file:
+            assert len(file.readlines()) == 3
+
+        # Состояние восстанавливается при повторном открытии файла
+        reopened = JSONLinesStorage(filename)
+        assert [v['name'] for v in reopened.get_vacancies()] == ["Senior Python Developer"]
+        reopened.add_vacancy(test_vacancy)
+
+        reopened.compact()
+        with open(filename, encoding='utf-8') as file:
+            assert len(file.readlines()) == 2
+        assert [v['name'] for v in reopened.get_vacancies()] == ["Senior Python Developer", "Python Developer"]
+
+        try:
+            reopened.delete_vacancy(first_id)
+            assert False, "Должна быть ошибка ValueError"
+        except ValueError:
+            pass
+
+
+def test_json_lines_auto_compaction():
+    """Тест автоматического сжатия при накоплении устаревших строк"""
+    _, test_vacancy, test_vacancy_2, temp_file = setup_test_environment()
+    os.unlink(temp_file)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'vacancies.jsonl')
+        storage = JSONLinesStorage(filename, compact_threshold=0.5, compact_min_lines=2)
+        storage.add_vacancies([test_vacancy, test_vacancy_2])
+        storage.delete_vacancy(storage.get_vacancies()[0]['id'])
+
+        with open(filename, encoding='utf-8') as file:
+            assert len(file.readlines()) == 1
+
+        # Пустой файл без порога по числу строк не сжимается
+        empty = JSONLinesStorage(os.path.join(directory, 'empty.jsonl'), compact_min_lines=0)
+        assert empty.add_vacancies([]) == {'inserted': 0, 'updated': 0, 'duplicates': 0, 'invalid': 0}
+
+
+def test_iter_json_array_small_chunks():
+    """Тест потокового разбора JSON-массива при чтении маленькими блоками"""
+    data = [{'name': 'Разработчик, "Python"', 'salary_from': 123456}, 7, [1, 2], {'nested': {'a': [None]}}]
+    stream = io.StringIO(json.dumps(data, ensure_ascii=False, indent=4))
+
+    assert list(iter_json_array(stream, chunk_size=3)) == data
+    assert list(iter_json_array(io.StringIO(''))) == []
+    assert list(iter_json_array(io.StringIO('[]'))) == []
+
+
+def test_iter_vacancies():
+    """Тест потокового чтения вакансий по критериям"""
+    storage, test_vacancy, test_vacancy_2, temp_file = setup_test_environment()
+
+    try:
+        assert list(storage.iter_vacancies()) == []
+        storage.add_vacancies([test_vacancy, test_vacancy_2])
+
+        vacancies = storage.iter_vacancies(salary_from=200000)
+        assert not isinstance(vacancies, list)
+        assert [v['name'] for v in vacancies] == ["Senior Python Developer"]
+        assert list(storage.iter_vacancies()) == storage.get_vacancies()
+    finally:
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
+
+
+def test_iter_vacancy_objects_skips_validation():
+    """Тест чтения сохраненных вакансий объектами Vacancy без повторной валидации"""
+    storage, test_vacancy, test_vacancy_2, temp_file = setup_test_environment()
+
+    try:
+        storage.add_vacancies([test_vacancy, test_vacancy_2])
+        with patch.object(Vacancy, '_validate_url') as validate_url:
+            vacancies = list(storage.iter_vacancy_objects(salary_from=200000))
+
+        validate_url.assert_not_called()
+        assert [v.name for v in vacancies] == ["Senior Python Developer"]
+        assert vacancies[0].to_dict() == {**test_vacancy_2.to_dict(), 'id': vacancies[0].id}
+    finally:
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
+
+
+def test_delete_while_iterating():
+    """Тест удаления вакансий во время обхода: обход возвращает все вакансии, бывшие на момент начала"""
+    vacancies = [Vacancy(f"Vacancy {i}", f"https://hh.ru/vacancy/{i}", vacancy_id=str(i)) for i in range(20)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        storages = [
+            JSONStorage(os.path.join(directory, 'vacancies.json')),
+            JSONLinesStorage(os.path.join(directory, 'vacancies.jsonl'), compact_min_lines=3),
+            SQLiteStorage(os.path.join(directory, 'vacancies.db')),
+        ]
+        for storage in storages:
+            storage.add_vacancies(vacancies)
+            seen = []
+            for record in storage.iter_vacancies():
+                seen.append(record['id'])
+                if int(record['id']) % 2 == 0:
+                    # В JSON Lines удаления запускают сжатие файла
+                    storage.delete_vacancy(record['id'])
+
+            assert sorted(seen, key=int) == [str(i) for i in range(20)]
+            assert [v['id'] for v in storage.get_vacancies()] == [str(i) for i in range(1, 20, 2)]
+        storages[2].close()
+
+
+def test_indexed_json_storage():
+    """Тест поиска по хеш-индексам и их обновления при добавлении и удалении"""
+    temp_file = create_temp_file()
+    storage = JSONStorage(temp_file, indexed_fields=['employer', 'experience', 'id'])
+
+    try:
+        storage.add_vacancies([
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", employer="Яндекс", experience="От 3 до 6 лет"),
+            Vacancy("Go Developer", "https://hh.ru/vacancy/2", employer="Яндекс", experience="Нет опыта"),
+            Vacancy("Java Developer", "https://hh.ru/vacancy/3", employer="Сбер", experience="От 3 до 6 лет"),
+        ])
+
+        found = storage.get_vacancies(employer="Яндекс", experience="От 3 до 6 лет")
+        assert [v['name'] for v in found] == ["Python Developer"]
+        # Критерий по неиндексированному полю проверяется среди кандидатов из индекса
+        found = storage.get_vacancies(employer="Яндекс", name="Go Developer")
+        assert [v['name'] for v in found] == ["Go Developer"]
+        assert storage.get_vacancies(employer="Нет такой") == []
+
+        # Изменение результата не затрагивает кеш и индексы хранилища
+        found[0]['employer'] = "Изменено"
+        assert [v['name'] for v in storage.get_vacancies(employer="Яндекс")] == ["Python Developer", "Go Developer"]
+        assert storage.get_vacancies(employer="Изменено") == []
+
+        storage.delete_vacancy(found[0]['id'])
+        assert [v['name'] for v in storage.get_vacancies(employer="Яндекс")] == ["Python Developer"]
+
+        # Изменения, сделанные другим экземпляром, подхватываются по изменению файла
+        JSONStorage(temp_file).add_vacancy(Vacancy("Rust Developer", "https://hh.ru/vacancy/4", employer="Сбер"))
+        assert [v['name'] for v in storage.get_vacancies(employer="Сбер")] == ["Java Developer", "Rust Developer"]
+    finally:
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
+
+
+def test_storage_normalizes_currency():
+    """Тест пересчета зарплат в базовую валюту при добавлении в хранилище"""
+    rates = RateTable({'USD': 90.0})
+    usd_vacancy = Vacancy(name="Remote Developer", url="http://example.com/vacancy/3",
+                          salary_from=2000, salary_currency="USD")
+    kzt_vacancy = Vacancy(name="Almaty Developer", url="http://example.com/vacancy/4",
+                          salary_from=500000, salary_currency="KZT")
+
+    with tempfile.TemporaryDirectory() as directory:
+        storages = [
+            JSONStorage(os.path.join(directory, 'vacancies.json'), rates=rates),
+            JSONLinesStorage(os.path.join(directory, 'vacancies.jsonl'), rates=rates),
+            SQLiteStorage(os.path.join(directory, 'vacancies.db'), rates=rates),
+        ]
+        for storage in storages:
+            storage.add_vacancies([usd_vacancy, kzt_vacancy])
+            vacancy, unconvertible = storage.get_vacancies()
+            assert vacancy['salary_from'] == 2000
+            assert vacancy['salary_from_base'] == 180000
+            assert vacancy.get('salary_to_base') is None
+            # Валюта без курса: зарплата остается пересчитанной, но неизвестной
+            assert unconvertible['salary_from'] == 500000
+            assert (unconvertible['salary_from_base'], unconvertible['salary_to_base']) == (None, None)
+            assert storage.upsert_vacancies([unconvertible])['unchanged'] == 1
+        storages[2].close()
+
+        # Без курсов поля с пересчитанной зарплатой не добавляются
+        with SQLiteStorage(os.path.join(directory, 'plain.db')) as storage:
+            storage.add_vacancy(usd_vacancy)
+            assert 'salary_from_base' not in storage.get_vacancies()[0]
+
+
+def _add_worker(storage_class, filename, worker):
+    """Процесс-писатель для теста совместной работы с хранилищем"""
+    storage = storage_class(filename)
+    for i in range(10):
+        storage.add_vacancy(Vacancy(f"Worker {worker} #{i}", f"https://hh.ru/vacancy/{worker}-{i}"))
+
+
+def test_concurrent_writers():
+    """Тест одновременной записи в одно хранилище из нескольких процессов без потери данных"""
+    context = multiprocessing.get_context('fork')
+
+    with tempfile.TemporaryDirectory() as directory:
+        for storage_class, name in ((JSONStorage, 'vacancies.json'), (JSONLinesStorage, 'vacancies.jsonl')):
+            filename = os.path.join(directory, name)
+            storage_class(filename)
+            workers = [context.Process(target=_add_worker, args=(storage_class, filename, n)) for n in range(4)]
+            for process in workers:
+                process.start()
+            for process in workers:
+                process.join()
+
+            assert len(storage_class(filename).get_vacancies()) == 40
+
+
+def test_json_storage_write_is_atomic():
+    """Тест сохранения прежнего содержимого файла при сбое во время записи"""
+    _, test_vacancy, test_vacancy_2, _ = setup_test_environment()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'vacancies.json')
+        storage = JSONStorage(filename)
+        storage.add_vacancy(test_vacancy)
+
+        with patch('src.storage.json.dump', side_effect=OSError("Диск заполнен")):
+            try:
+                storage.add_vacancy(test_vacancy_2)
+                assert False, "Должна быть ошибка OSError"
+            except OSError:
+                pass
+
+        assert [v['name'] for v in storage.get_vacancies()] == ["Python Developer"]
+        assert sorted(os.listdir(directory)) == ['vacancies.json', 'vacancies.json.lock']
+
+
+def test_json_lines_sees_other_writers():
+    """Тест учета изменений, сделанных другим экземпляром хранилища (другим процессом)"""
+    _, test_vacancy, test_vacancy_2, _ = setup_test_environment()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'vacancies.jsonl')
+        first = JSONLinesStorage(filename)
+        second = JSONLinesStorage(filename)
+
+        first.add_vacancy(test_vacancy)
+        # Дубликат, добавленный другим писателем, обнаруживается
+        assert second.add_vacancies([test_vacancy, test_vacancy_2])['inserted'] == 1
+        assert [v['name'] for v in first.get_vacancies()] == ["Python Developer", "Senior Python Developer"]
+
+        first.delete_vacancy(second.get_vacancies()[0]['id'])
+        first.compact()
+        assert [v['name'] for v in second.get_vacancies()] == ["Senior Python Developer"]
+
+        # Недописанная другим процессом строка не читается до завершения записи
+        with open(filename, 'ab') as file:
+            file.write(b'{"id": "partial"')
+        assert len(second.get_vacancies()) == 1
+
+
+def test_recrawl_updates_by_source_id():
+    """Тест обновления вакансии на месте при повторной загрузке с тем же ID источника"""
+    first = Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, vacancy_id='1')
+    second = Vacancy("Go Developer", "https://hh.ru/vacancy/2", vacancy_id='2')
+    recrawled = Vacancy("Python Developer", "https://hh.ru/vacancy/1", 120000, vacancy_id='1')
+
+    with tempfile.TemporaryDirectory() as directory:
+        storages = [
+            JSONStorage(os.path.join(directory, 'vacancies.json')),
+            JSONStorage(os.path.join(directory, 'indexed.json'), indexed_fields=['employer']),
+            JSONLinesStorage(os.path.join(directory, 'vacancies.jsonl')),
+            SQLiteStorage(os.path.join(directory, 'vacancies.db')),
+        ]
+        for storage in storages:
+            storage.add_vacancies([first, second])
+            result = storage.add_vacancies([recrawled, Vacancy("Copy", "https://hh.ru/vacancy/2", vacancy_id='3')])
+            assert result == {'inserted': 0, 'updated': 1, 'duplicates': 1, 'invalid': 0}
+
+            # В JSON Lines новая версия дописывается в конец, в остальных хранилищах порядок сохраняется
+            vacancies = storage.get_vacancies()
+            assert sorted((v['id'], v['salary_from']) for v in vacancies) == [('1', 120000), ('2', None)]
+            if not isinstance(storage, JSONLinesStorage):
+                assert vacancies[0]['id'] == '1'
+            assert storage.get_vacancies(id='2')[0]['name'] == "Go Developer"
+
+            storage.delete_vacancy('1')
+            assert [v['id'] for v in storage.get_vacancies()] == ['2']
+        storages[3].close()
+
+
+def test_recrawl_adopts_source_id():
+    """Тест обновления вакансии, сохраненной с ID хранилища, при загрузке с ID источника"""
+    legacy = Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000)
+    recrawled = Vacancy("Python Developer", "https://hh.ru/vacancy/1", 120000, vacancy_id='1')
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Файл старого формата: вакансии hh.ru сохранены со случайными ID
+        baseline = os.path.join(directory, 'baseline.json')
+        with open(baseline, 'w', encoding='utf-8') as file:
+            json.dump([dict(legacy.to_dict(), id=str(uuid.uuid4()))], file)
+
+        storages = [
+            JSONStorage(baseline),
+            JSONStorage(os.path.join(directory, 'indexed.json'), indexed_fields=['url']),
+            JSONLinesStorage(os.path.join(directory, 'vacancies.jsonl')),
+            SQLiteStorage(os.path.join(directory, 'vacancies.db')),
+        ]
+        for storage in storages:
+            if storage is not storages[0]:
+                storage.add_vacancies([legacy])
+            result = storage.upsert_vacancies([recrawled])
+            assert result == {'inserted': 0, 'updated': 1, 'unchanged': 0, 'duplicates': 0, 'invalid': 0}
+            assert [(v['id'], v['salary_from']) for v in storage.get_vacancies()] == [('1', 120000)]
+            # Вакансия с ID источника больше не заменяется, повторная загрузка ничего не меняет
+            assert storage.upsert_vacancies([recrawled])['unchanged'] == 1
+            assert storage.add_vacancies([legacy])['duplicates'] == 1
+
+        reopened = JSONLinesStorage(os.path.join(directory, 'vacancies.jsonl'))
+        assert [v['id'] for v in reopened.get_vacancies()] == ['1']
+        storages[3].close()
+
+
+def test_upsert_vacancies():
+    """Тест повторной загрузки с записью только изменившихся вакансий"""
+    crawl = [
+        {'id': '1', 'name': "Python Developer", 'url': "https://hh.ru/vacancy/1", 'salary_from': 100000},
+        {'id': '2', 'name': "Go Developer", 'url': "https://hh.ru/vacancy/2", 'salary_from': 150000.0},
+    ]
+    changed = dict(crawl[0], description="Новые требования")
+    added = {'id': '3', 'name': "Java Developer", 'url': "https://hh.ru/vacancy/3"}
+
+    with tempfile.TemporaryDirectory() as directory:
+        storages = [
+            JSONStorage(os.path.join(directory, 'vacancies.json')),
+            JSONLinesStorage(os.path.join(directory, 'vacancies.jsonl')),
+            SQLiteStorage(os.path.join(directory, 'vacancies.db')),
+        ]
+        for storage in storages:
+            assert storage.upsert_vacancies(crawl)['inserted'] == 2
+            assert storage.upsert_vacancies(crawl) == {
+                'inserted': 0, 'updated': 0, 'unchanged': 2, 'duplicates': 0, 'invalid': 0
+            }
+            assert storage.upsert_vacancies([changed, crawl[1], added]) == {
+                'inserted': 1, 'updated': 1, 'unchanged': 1, 'duplicates': 0, 'invalid': 0
+            }
+            assert storage.get_vacancies(id='1')[0]['description'] == "Новые требования"
+        storages[2].close()
+
+        # Без изменений файлы не перезаписываются и не растут
+        json_file, jsonl_file = os.path.join(directory, 'vacancies.json'), os.path.join(directory, 'vacancies.jsonl')
+        stats = [os.stat(json_file).st_ino, os.path.getsize(jsonl_file)]
+        storages[0].upsert_vacancies([changed, added])
+        storages[1].upsert_vacancies([changed, added])
+        assert [os.stat(json_file).st_ino, os.path.getsize(jsonl_file)] == stats
+
+        # Хеши версий восстанавливаются при повторном открытии JSON Lines
+        assert JSONLinesStorage(jsonl_file).upsert_vacancies([changed])['unchanged'] == 1
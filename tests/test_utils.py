@@ -2,7 +2,7 @@ import os
 import tempfile
 
 from src.utils import (filter_vacancies, get_top_vacancies, get_vacancies_by_salary, save_vacancies_to_file,
-                       sort_vacancies)
+                       sort_vacancies, top_vacancies)
 
 # Тестовые данные
 TEST_VACANCIES = [
@@ -105,6 +105,26 @@ def test_get_top_vacancies():
     assert len(top) == 3
 
 
+def test_top_vacancies():
+    """Тест выбора N лучших вакансий без полной сортировки"""
+    vacancies = TEST_VACANCIES + [
+        {'name': 'Only To', 'salary_from': None, 'salary_to': 200000},
+        {'name': 'Same As Only To', 'salary_from': 150000, 'salary_to': 200000},
+        {'name': 'No Salary'},
+    ]
+
+    # Совпадает с полной сортировкой, в том числе порядок при равной зарплате
+    for n in range(len(vacancies) + 2):
+        assert top_vacancies(iter(vacancies), n) == get_top_vacancies(sort_vacancies(vacancies), n)
+
+    top = top_vacancies(vacancies, 3)
+    assert [v['name'] for v in top] == ['Senior Python Developer', 'Only To', 'Same As Only To']
+
+    # Произвольный ключ
+    top = top_vacancies(TEST_VACANCIES, 1, key=lambda v: -v['salary_from'])
+    assert top[0]['name'] == 'Junior Python Developer'
+
+
 def test_save_vacancies_to_file():
     """Тест сохранения вакансий в файл"""
     # Создаем временный файл